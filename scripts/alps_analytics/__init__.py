@@ -0,0 +1,4 @@
+"""
+ALPS analytics layer
+Vectorised spatial statistics behind the journal figures and daily pipeline
+"""
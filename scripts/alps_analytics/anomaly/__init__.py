@@ -0,0 +1,19 @@
+"""
+Daily radiance anomaly scoring for districts and states
+"""
+
+from .detector import (LEVELS, MIN_HISTORY, THRESHOLD, WINDOW, alerts_frame, detect, group_starts,
+                       read_daily, rolling_baseline, sort_daily)
+from .seasonal import (MAD_SCALE, MAX_PROFILE_AGE, MIN_MONTH_DAYS, MIN_SPREAD, PROFILE_DIRNAME,
+                       PROFILE_VERSION, Z_THRESHOLD, SeasonalProfile, grouped_median, load_profile,
+                       month_of_year, seasonal_gate)
+from .state import RESYNC_EVERY, STATE_DIRNAME, STATE_VERSION, RollingState
+
+__all__ = [
+    'LEVELS', 'MIN_HISTORY', 'THRESHOLD', 'WINDOW', 'alerts_frame', 'detect', 'group_starts',
+    'read_daily', 'rolling_baseline', 'sort_daily',
+    'MAD_SCALE', 'MAX_PROFILE_AGE', 'MIN_MONTH_DAYS', 'MIN_SPREAD', 'PROFILE_DIRNAME',
+    'PROFILE_VERSION', 'Z_THRESHOLD', 'SeasonalProfile', 'grouped_median', 'load_profile',
+    'month_of_year', 'seasonal_gate',
+    'RESYNC_EVERY', 'STATE_DIRNAME', 'STATE_VERSION', 'RollingState',
+]
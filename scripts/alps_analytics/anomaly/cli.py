@@ -0,0 +1,107 @@
+"""
+Command-line entry point: python -m alps_analytics.anomaly
+
+    python -m alps_analytics.anomaly                     # today (UTC)
+    python -m alps_analytics.anomaly 2024-11-02 --out alerts.json
+    python -m alps_analytics.anomaly --all               # score every stored day
+    python -m alps_analytics.anomaly 2024-11-02 --incremental --seasonal
+
+Reads {district,state}_daily_metrics.csv exported by export_paper_data.ts and
+writes one JSON array of alerts that scripts/import-alerts.ts inserts with
+createMany, replacing the per-district query loop of process-hotspots.ts.
+With --incremental the day is scored against the RollingState saved under
+<data-dir>/.rolling (seeded from earlier days on first use), which is then
+advanced by that day. --seasonal keeps only alerts that are also unusual for
+their calendar month (SeasonalProfile cached under <data-dir>/.seasonal)
+"""
+
+import argparse
+import json
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .detector import LEVELS, detect, read_daily
+from .seasonal import PROFILE_DIRNAME, load_profile, seasonal_gate
+from .state import STATE_DIRNAME, RollingState
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m alps_analytics.anomaly',
+                                     description='Score daily radiance anomalies in bulk')
+    parser.add_argument('date', nargs='?', default=None, help='Day to score (default: today, UTC)')
+    parser.add_argument('--all', action='store_true', help='Score every stored day')
+    parser.add_argument('--data-dir', type=Path, default=Path('tmp/exports/data'),
+                        help='Directory with the *_daily_metrics.csv exports')
+    parser.add_argument('--out', type=Path, default=Path('tmp/exports/alerts.json'))
+    parser.add_argument('--incremental', action='store_true',
+                        help='Score the day against the saved rolling-window state')
+    parser.add_argument('--seasonal', action='store_true',
+                        help='Drop alerts that are normal for the month of year')
+    args = parser.parse_args(argv)
+    if args.incremental and args.all:
+        parser.error('--incremental scores a single day; drop --all')
+    return args
+
+
+def score_incremental(frame, level, day, state_dir):
+    """Alerts for ``day`` from the saved state, which is then advanced"""
+    path = state_dir / f'{level}.npz'
+    state = RollingState.load(path)
+    if state is None:
+        state = RollingState.from_history(frame[frame['date'] < day], level)
+        print(f"   {level}: seeded rolling state for {len(state.codes)} entities")
+    else:
+        # Catch up on days stored since the last run before scoring ``day``,
+        # from the entity furthest behind (all history if one has none);
+        # ingest() skips the days each entity already holds
+        missed = frame[frame['date'] < day]
+        if len(state.last_date) and not np.isnat(state.last_date).any():
+            missed = missed[missed['date'] > pd.Timestamp(state.last_date.min())]
+        for date, rows in missed.groupby('date'):
+            state.ingest(rows['code'].to_numpy(), rows['radiance'].to_numpy(), date)
+    today = frame[frame['date'] == day]
+    alerts = state.ingest(today['code'].to_numpy(), today['radiance'].to_numpy(), day)
+    state.save(path)
+    return alerts
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    day = None if args.all else pd.Timestamp(
+        args.date or datetime.now(timezone.utc).date().isoformat())
+
+    t0 = time.perf_counter()
+    frames = []
+    for level in LEVELS:
+        path = args.data_dir / f'{level}_daily_metrics.csv'
+        if not path.exists():
+            print(f"⚠️  {path} not found, skipping {level} alerts")
+            continue
+        frame = read_daily(path)
+        if args.incremental:
+            alerts = score_incremental(frame, level, day, args.data_dir / STATE_DIRNAME)
+        else:
+            alerts = detect(frame, level, day=day)
+        if args.seasonal:
+            flat = len(alerts)
+            alerts = seasonal_gate(alerts, load_profile(frame, level, args.data_dir / PROFILE_DIRNAME, day))
+            print(f"   {level}: {len(alerts)} alerts ({flat - len(alerts)} seasonal suppressed)")
+        else:
+            print(f"   {level}: {len(alerts)} alerts")
+        frames.append(alerts)
+
+    alerts = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+    records = [
+        {'level': a.level, 'code': a.code, 'message': a.message, 'severity': int(a.severity),
+         'detectedAt': a.date.strftime('%Y-%m-%d')}
+        for a in alerts.itertuples(index=False)
+    ]
+    args.out.parent.mkdir(parents=True, exist_ok=True)
+    args.out.write_text(json.dumps(records, indent=1))
+    scope = 'all days' if day is None else day.strftime('%Y-%m-%d')
+    print(f"✅ {len(records)} alerts for {scope} → {args.out} ({time.perf_counter() - t0:.2f}s)")
+    return 0
@@ -0,0 +1,171 @@
+"""
+Seasonal radiance baseline from month-of-year median/MAD profiles
+Radiance peaks in winter and dips through the monsoon (Figure 2b), so a flat
+30-day mean flags the whole country when the monsoon ends. Each entity gets a
+12-month profile of median radiance and median absolute deviation, fitted
+once from its history and cached, and every row is scored with a robust
+z-score against its own calendar month in one vectorised pass
+"""
+
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .detector import LEVELS, sort_daily
+
+PROFILE_DIRNAME = '.seasonal'
+
+# Bump when the fitting rules or the saved layout change
+PROFILE_VERSION = 1
+
+# MAD -> standard deviation for normally distributed values
+MAD_SCALE = 1.4826
+
+# Robust z-score above which a day is unusual for its month
+Z_THRESHOLD = 3.0
+
+# Fewest observations of a calendar month for its profile entry to be used
+MIN_MONTH_DAYS = 10
+
+# MAD floor as a fraction of the median, so flat series do not give infinite z
+MIN_SPREAD = 0.05
+
+# A cached profile is refitted once the data runs this far past it
+MAX_PROFILE_AGE = np.timedelta64(90, 'D')
+
+
+def month_of_year(dates):
+    """0-11 calendar month of datetime64 ``dates``"""
+    return np.asarray(dates).astype('datetime64[M]').astype(np.int64) % 12
+
+
+def grouped_median(groups, values, n_groups):
+    """(median, count) of ``values`` per integer group; NaN for empty groups"""
+    order = np.lexsort((values, groups))
+    groups, values = groups[order], values[order]
+    count = np.bincount(groups, minlength=n_groups)
+    start = np.concatenate([[0], np.cumsum(count)[:-1]])
+    has = count > 0
+    lo = np.where(has, start + (count - 1) // 2, 0)
+    hi = np.where(has, start + count // 2, 0)
+    if not len(values):
+        return np.full(n_groups, np.nan), count
+    return np.where(has, 0.5 * (values[lo] + values[hi]), np.nan), count
+
+
+@dataclass
+class SeasonalProfile:
+    """Month-of-year radiance profile of every entity of one level.
+
+    Row ``i`` of the (entities, 12) arrays belongs to ``codes[i]`` (sorted);
+    ``through`` is the last day of the history it was fitted on.
+    """
+    level: str
+    codes: np.ndarray
+    median: np.ndarray
+    mad: np.ndarray
+    count: np.ndarray
+    through: np.datetime64
+
+    @classmethod
+    def fit(cls, frame, level):
+        """Profiles from ``frame`` (code, date, radiance; any order)"""
+        if level not in LEVELS:
+            raise ValueError(f"level must be one of {LEVELS}")
+        ids, codes, dates, values = sort_daily(frame)
+        valid = ~np.isnan(values)
+        ids, dates, values = ids[valid], dates[valid], values[valid]
+        n = len(codes) * 12
+        group = ids.astype(np.int64) * 12 + month_of_year(dates)
+        median, count = grouped_median(group, values, n)
+        mad, _ = grouped_median(group, np.abs(values - median[group]), n)
+        shape = (len(codes), 12)
+        through = dates.max() if len(dates) else np.datetime64('NaT', 'D')
+        return cls(level, codes.astype(str), median.reshape(shape), mad.reshape(shape),
+                   count.reshape(shape).astype(np.int32), through)
+
+    def spread(self):
+        """MAD_SCALE * MAD, floored at MIN_SPREAD of the median"""
+        return MAD_SCALE * np.maximum(self.mad, MIN_SPREAD * np.abs(self.median))
+
+    def zscores(self, codes, dates, radiance, min_days=MIN_MONTH_DAYS):
+        """(median, z) for each row; NaN where the entity or month lacks history"""
+        codes = np.asarray(codes, dtype=str)
+        rows = np.searchsorted(self.codes, codes)
+        known = rows < len(self.codes)
+        known[known] = self.codes[rows[known]] == codes[known]
+        rows = np.where(known, rows, 0)
+        month = month_of_year(dates)
+        median = np.where(known, self.median[rows, month], np.nan)
+        spread = np.where(known & (self.count[rows, month] >= min_days),
+                          self.spread()[rows, month], np.nan)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return median, (np.asarray(radiance, dtype=np.float64) - median) / spread
+
+    def score(self, frame, day=None, min_days=MIN_MONTH_DAYS):
+        """Robust z-score of every row of ``frame`` (only ``day`` if given)"""
+        if day is not None:
+            frame = frame[frame['date'] == pd.Timestamp(day)]
+        dates = frame['date'].to_numpy().astype('datetime64[D]')
+        radiance = frame['radiance'].to_numpy(dtype=np.float64)
+        median, z = self.zscores(frame['code'].to_numpy(), dates, radiance, min_days)
+        return pd.DataFrame({'level': self.level, 'code': frame['code'].to_numpy(), 'date': dates,
+                             'radiance': radiance, 'median': median, 'z': z})
+
+    def save(self, path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f'{path.stem}.{os.getpid()}.tmp.npz')
+        np.savez(tmp, version=PROFILE_VERSION, level=self.level, codes=self.codes,
+                 median=self.median, mad=self.mad, count=self.count,
+                 through=np.datetime64(self.through, 'D').astype(np.int64))
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path):
+        """Saved profile, or None if missing or written by another PROFILE_VERSION"""
+        path = Path(path)
+        if not path.exists():
+            return None
+        with np.load(path) as f:
+            if int(f['version']) != PROFILE_VERSION:
+                return None
+            return cls(str(f['level']), f['codes'], f['median'], f['mad'], f['count'],
+                       f['through'].astype('datetime64[D]'))
+
+
+def load_profile(frame, level, directory, day=None, max_age=MAX_PROFILE_AGE):
+    """Cached ``level`` profile under ``directory`` for scoring ``day``.
+
+    Only rows before ``day`` count as history. The cached profile is reused
+    while it ends on or before the latest history day and at most
+    ``max_age`` behind it; otherwise it is refitted and saved.
+    """
+    path = Path(directory) / f'{level}.npz'
+    if day is not None:
+        frame = frame[frame['date'] < pd.Timestamp(day)]
+    profile = SeasonalProfile.load(path)
+    if profile is not None and profile.level == level and len(frame):
+        age = np.datetime64(frame['date'].max(), 'D') - profile.through
+        if np.timedelta64(0, 'D') <= age <= max_age:
+            return profile
+    profile = SeasonalProfile.fit(frame, level)
+    profile.save(path)
+    return profile
+
+
+def seasonal_gate(alerts, profile, threshold=Z_THRESHOLD, min_days=MIN_MONTH_DAYS):
+    """Flat-rule ``alerts`` that are also unusual for their calendar month.
+
+    Adds the seasonal median and z-score columns. Entities or months without
+    enough history keep their flat-rule alert rather than being silenced.
+    """
+    median, z = profile.zscores(alerts['code'].to_numpy(), alerts['date'].to_numpy(),
+                                alerts['radiance'].to_numpy(), min_days)
+    alerts = alerts.assign(seasonal_median=median, z=z)
+    keep = np.isnan(z) | (z > threshold)
+    return alerts[keep].reset_index(drop=True)
+
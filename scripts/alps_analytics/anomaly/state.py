@@ -0,0 +1,169 @@
+"""
+Incremental rolling-window state for the daily anomaly rule
+Instead of re-reading 30 days of history per entity every day, the last
+WINDOW radiances of every district or state are kept in one ring-buffer
+matrix with running sums and counts. Ingesting a day is a handful of
+vectorised O(1)-per-entity updates, and the state persists as one small
+.npz file between runs
+"""
+
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .detector import LEVELS, MIN_HISTORY, THRESHOLD, WINDOW, alerts_frame, sort_daily
+
+STATE_DIRNAME = '.rolling'
+
+# Bump when the saved layout changes
+STATE_VERSION = 1
+
+# Running sums are recomputed from the buffers this often to cancel
+# floating-point drift from repeated add/subtract
+RESYNC_EVERY = 1024
+
+NO_DATE = np.datetime64('NaT', 'D')
+
+
+class RollingState:
+    """Last ``window`` observations of every entity of one level.
+
+    Row ``i`` belongs to ``codes[i]`` (kept sorted): ``buffer[i]`` is its
+    ring of values, ``head[i]`` the slot the next value goes to, ``count[i]``
+    the number of values held, ``total[i]`` their sum and ``last_date[i]``
+    the day last ingested.
+    """
+
+    def __init__(self, level, codes, buffer, head, count, total, last_date, updates=0):
+        if level not in LEVELS:
+            raise ValueError(f"level must be one of {LEVELS}")
+        self.level = level
+        self.codes = np.asarray(codes, dtype=str)
+        self.buffer = buffer
+        self.head = head
+        self.count = count
+        self.total = total
+        self.last_date = last_date
+        self.updates = updates
+
+    @property
+    def window(self):
+        return self.buffer.shape[1]
+
+    @classmethod
+    def empty(cls, level, codes=(), window=WINDOW):
+        n = len(codes)
+        return cls(level, np.sort(np.asarray(codes, dtype=str)), np.zeros((n, window)),
+                   np.zeros(n, np.int32), np.zeros(n, np.int32), np.zeros(n),
+                   np.full(n, NO_DATE))
+
+    @classmethod
+    def from_history(cls, frame, level, window=WINDOW):
+        """State after ingesting every row of ``frame`` (code, date, radiance)"""
+        ids, codes, dates, values = sort_daily(frame)
+        state = cls.empty(level, codes, window)
+        if not len(ids):
+            return state
+        # Keep each entity's last `window` rows; row k of a run goes to slot k % window
+        ends = np.r_[np.flatnonzero(ids[1:] != ids[:-1]), len(ids) - 1]
+        sizes = np.diff(np.r_[-1, ends])
+        rank = np.arange(len(ids)) - np.repeat(ends - sizes + 1, sizes)
+        keep = rank >= np.repeat(sizes, sizes) - window
+        state.buffer[ids[keep], rank[keep] % window] = values[keep]
+        entity = ids[ends]
+        state.count[entity] = np.minimum(sizes, window)
+        state.head[entity] = sizes % window
+        state.total[entity] = np.bincount(ids[keep], weights=values[keep], minlength=len(codes))[entity]
+        state.last_date[entity] = dates[ends]
+        return state
+
+    def _rows(self, codes):
+        """Row of every code, adding rows for codes not seen before"""
+        codes = np.asarray(codes, dtype=str)
+        rows = np.searchsorted(self.codes, codes)
+        known = rows < len(self.codes)
+        known[known] = self.codes[rows[known]] == codes[known]
+        if not known.all():
+            merged = np.union1d(self.codes, codes[~known])
+            old = np.searchsorted(merged, self.codes)
+            n = len(merged)
+
+            def grow(array, fill):
+                out = np.full((n,) + array.shape[1:], fill, dtype=array.dtype)
+                out[old] = array
+                return out
+
+            self.buffer = grow(self.buffer, 0.0)
+            self.head, self.count = grow(self.head, 0), grow(self.count, 0)
+            self.total, self.last_date = grow(self.total, 0.0), grow(self.last_date, NO_DATE)
+            self.codes = merged
+            rows = np.searchsorted(self.codes, codes)
+        return rows
+
+    def mean(self):
+        """Current baseline per entity (NaN without history)"""
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return self.total / self.count
+
+    def ingest(self, codes, values, day, min_history=MIN_HISTORY, threshold=THRESHOLD):
+        """Score one day against the current windows, then push it in.
+
+        Entities already holding ``day`` (or a later one) are skipped, so
+        re-running a day is harmless. Returns the alerts, as detect().
+        """
+        day = np.datetime64(pd.Timestamp(day), 'D')
+        rows = self._rows(codes)
+        values = np.asarray(values, dtype=np.float64)
+        fresh = np.isnat(self.last_date[rows]) | (self.last_date[rows] < day)
+        rows, values = rows[fresh], values[fresh]
+
+        mean = self.mean()[rows]
+        n = self.count[rows]
+        dev = values - mean
+        hit = (n >= min_history) & (dev > threshold * mean)
+        alerts = alerts_frame(self.level, self.codes[rows[hit]], np.full(hit.sum(), day),
+                              values[hit], mean[hit], self.window)
+
+        # Evict the oldest value once the ring is full, then write the new one
+        slot = self.head[rows]
+        full = self.count[rows] == self.window
+        self.total[rows] += values - np.where(full, self.buffer[rows, slot], 0.0)
+        self.buffer[rows, slot] = values
+        self.head[rows] = (slot + 1) % self.window
+        self.count[rows] = np.minimum(self.count[rows] + 1, self.window)
+        self.last_date[rows] = day
+
+        self.updates += 1
+        if self.updates % RESYNC_EVERY == 0:
+            self.resync()
+        return alerts
+
+    def resync(self):
+        """Recompute running sums exactly from the buffers"""
+        held = np.arange(self.window) < self.count[:, None]
+        slots = (self.head[:, None] - self.count[:, None] + np.arange(self.window)) % self.window
+        self.total = np.where(held, np.take_along_axis(self.buffer, slots, axis=1), 0.0).sum(axis=1)
+
+    def save(self, path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f'{path.stem}.{os.getpid()}.tmp.npz')
+        np.savez(tmp, version=STATE_VERSION, level=self.level, codes=self.codes,
+                 buffer=self.buffer, head=self.head, count=self.count, total=self.total,
+                 last_date=self.last_date.astype('datetime64[D]').astype(np.int64),
+                 updates=self.updates)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path):
+        """Saved state, or None if missing or written by another STATE_VERSION"""
+        path = Path(path)
+        if not path.exists():
+            return None
+        with np.load(path) as f:
+            if int(f['version']) != STATE_VERSION:
+                return None
+            return cls(str(f['level']), f['codes'], f['buffer'], f['head'], f['count'],
+                       f['total'], f['last_date'].astype('datetime64[D]'), int(f['updates']))
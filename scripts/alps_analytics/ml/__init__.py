@@ -0,0 +1,19 @@
+"""
+Radiance models and their explanations
+"""
+
+from .attributions import (SHAP_DIRNAME, SHAP_VERSION, Attributions, compute_attributions,
+                           fit_model, load_attributions)
+from .benchmark import (BENCHMARK_FILENAME, BENCHMARK_VERSION, MODELS, load_benchmark,
+                        migration_r2, regression_scores, run_benchmark)
+from .features import FEATURE_LABELS, FeatureTable, build_features, read_features
+from .treeshap import TreeEnsemble, TreeExplainer, pattern_tables, shap_values
+
+__all__ = [
+    'SHAP_DIRNAME', 'SHAP_VERSION', 'Attributions', 'compute_attributions', 'fit_model',
+    'load_attributions',
+    'BENCHMARK_FILENAME', 'BENCHMARK_VERSION', 'MODELS', 'load_benchmark', 'migration_r2',
+    'regression_scores', 'run_benchmark',
+    'FEATURE_LABELS', 'FeatureTable', 'build_features', 'read_features',
+    'TreeEnsemble', 'TreeExplainer', 'pattern_tables', 'shap_values',
+]
@@ -0,0 +1,190 @@
+"""
+SHAP attribution stage behind Figures 5 and 6
+Trains the gradient-boosted tree model on the district feature table, explains
+a fixed sample of district-days with exact TreeSHAP and stores the feature
+and SHAP matrices as .npy files that figures memory-map instead of
+recomputing. The stage is keyed on its input exports and settings, so it
+reruns only when either changes
+"""
+
+import hashlib
+import json
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from .features import read_features
+from .treeshap import TreeEnsemble, TreeExplainer, shap_values
+
+SHAP_DIRNAME = '.shap'
+
+# Bump when the features, model or stored layout change
+SHAP_VERSION = 1
+
+SEED = 42
+
+# District-days used to fit the model and explained with SHAP (0 = all)
+TRAIN_ROWS = 500_000
+SHAP_ROWS = 100_000
+
+# Held-out share of the training sample for the reported R²
+TEST_FRACTION = 0.2
+
+# LightGBM-style settings: leaf-wise trees of 31 leaves, 100 boosting rounds
+MODEL_PARAMS = {'max_iter': 100, 'max_leaf_nodes': 31, 'learning_rate': 0.1,
+                'early_stopping': False}
+
+INPUTS = ('district_daily_metrics.csv', 'state_daily_metrics.csv',
+          'district_yearly_metrics.csv', 'correlation_data.csv')
+
+
+@dataclass
+class Attributions:
+    """Stored SHAP output: ``shap[i, j]`` is feature ``names[j]``'s
+    contribution to the prediction for district ``codes[i]`` on
+    ``dates[i]``, whose feature values are ``features[i]``"""
+    names: list
+    labels: list
+    codes: np.ndarray
+    dates: np.ndarray
+    states: np.ndarray
+    features: np.ndarray
+    shap: np.ndarray
+    expected_value: float
+    meta: dict
+
+    def __len__(self):
+        return len(self.codes)
+
+    def mean_abs(self, rows=None):
+        """Mean |SHAP| per feature (over ``rows`` if given)"""
+        values = self.shap if rows is None else self.shap[rows]
+        return np.abs(values).mean(axis=0) if len(values) else np.full(len(self.names), np.nan)
+
+
+def load_attributions(directory):
+    """Stored Attributions with memory-mapped matrices, or None if absent"""
+    directory = Path(directory)
+    meta_path = directory / 'meta.json'
+    if not meta_path.exists():
+        return None
+    meta = json.loads(meta_path.read_text())
+    if meta.get('version') != SHAP_VERSION:
+        return None
+    with np.load(directory / 'index.npz') as f:
+        codes, dates, states = f['codes'], f['dates'].astype('datetime64[D]'), f['states']
+    return Attributions(meta['names'], meta['labels'], codes, dates, states,
+                        np.load(directory / 'features.npy', mmap_mode='r'),
+                        np.load(directory / 'shap.npy', mmap_mode='r'),
+                        meta['expected_value'], meta)
+
+
+def input_digest(data_dir, settings):
+    """Hash of ``settings`` (JSON-serialisable) and the INPUTS exports in ``data_dir``"""
+    h = hashlib.sha256()
+    h.update(json.dumps(settings, sort_keys=True).encode())
+    for name in INPUTS:
+        path = Path(data_dir) / name
+        h.update(f'|{name}:'.encode())
+        if path.exists():
+            with open(path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1 << 20), b''):
+                    h.update(chunk)
+    return h.hexdigest()
+
+
+def attribution_key(data_dir, train_rows=TRAIN_ROWS, shap_rows=SHAP_ROWS):
+    """Hash of the input exports and the stage settings"""
+    return input_digest(data_dir, {'version': SHAP_VERSION, 'seed': SEED,
+                                   'train_rows': train_rows, 'shap_rows': shap_rows,
+                                   'model': MODEL_PARAMS})
+
+
+def _sample(n, size, rng):
+    """Sorted random row indices (all rows when ``size`` is 0 or >= n)"""
+    if not size or size >= n:
+        return np.arange(n)
+    return np.sort(rng.choice(n, size, replace=False))
+
+
+def fit_model(table, train_rows=TRAIN_ROWS, seed=SEED):
+    """HistGradientBoostingRegressor on a sample of ``table``; returns
+    (model, held-out R²)"""
+    from sklearn.ensemble import HistGradientBoostingRegressor
+    from sklearn.metrics import r2_score
+
+    rng = np.random.default_rng(seed)
+    rows = rng.permutation(_sample(len(table), train_rows, rng))
+    n_test = int(len(rows) * TEST_FRACTION)
+    test, train = rows[:n_test], rows[n_test:]
+    model = HistGradientBoostingRegressor(random_state=seed, **MODEL_PARAMS)
+    model.fit(table.X[train], table.y[train])
+    r2 = float(r2_score(table.y[test], model.predict(table.X[test]))) if n_test else float('nan')
+    return model, r2
+
+
+def compute_attributions(data_dir, out_dir=None, train_rows=TRAIN_ROWS, shap_rows=SHAP_ROWS,
+                         jobs=1, force=False):
+    """Run the stage for the exports in ``data_dir`` (cached under .shap/)"""
+    data_dir = Path(data_dir)
+    out_dir = Path(out_dir) if out_dir else data_dir / SHAP_DIRNAME
+    key = attribution_key(data_dir, train_rows, shap_rows)
+    cached = load_attributions(out_dir)
+    if cached is not None and cached.meta.get('key') == key and not force:
+        print(f"⏭  SHAP attributions up to date ({len(cached):,} rows) in {out_dir}")
+        return cached
+
+    t0 = time.perf_counter()
+    table = read_features(data_dir)
+    print(f"   {len(table):,} district-days x {len(table.names)} features "
+          f"({time.perf_counter() - t0:.1f}s)")
+
+    t0 = time.perf_counter()
+    model, r2 = fit_model(table, train_rows)
+    fit_seconds = time.perf_counter() - t0
+    print(f"   model fitted in {fit_seconds:.1f}s (held-out R² = {r2:.3f})")
+
+    t0 = time.perf_counter()
+    explainer = TreeExplainer(TreeEnsemble.from_sklearn(model))
+    rows = _sample(len(table), shap_rows, np.random.default_rng(SEED + 1))
+    out_dir.mkdir(parents=True, exist_ok=True)
+    tmp = f'.{os.getpid()}.tmp'
+    (out_dir / 'meta.json').unlink(missing_ok=True)
+    features = np.lib.format.open_memmap(out_dir / f'features{tmp}.npy', mode='w+',
+                                         dtype=np.float32, shape=(len(rows), len(table.names)))
+    features[:] = table.X[rows]
+    shap = np.lib.format.open_memmap(out_dir / f'shap{tmp}.npy', mode='w+',
+                                     dtype=np.float32, shape=(len(rows), len(table.names)))
+
+    reported = [0]
+
+    def progress(done, total):
+        if done == total or done - reported[0] >= total / 20:
+            reported[0] = done
+            print(f"\r   TreeSHAP {done:,}/{total:,} rows", end='', flush=True)
+
+    shap_values(explainer, features, out=shap, jobs=jobs, progress=progress)
+    shap.flush()
+    features.flush()
+    del shap, features
+    shap_seconds = time.perf_counter() - t0
+    print(f"\n   explained in {shap_seconds:.1f}s")
+
+    np.savez(out_dir / f'index{tmp}.npz', codes=table.codes[rows],
+             dates=table.dates[rows].astype(np.int64), states=table.states[rows])
+    meta = {'version': SHAP_VERSION, 'key': key, 'names': list(table.names),
+            'labels': table.labels, 'expected_value': explainer.expected_value,
+            'rows': int(len(rows)), 'r2': r2, 'fit_seconds': fit_seconds,
+            'shap_seconds': shap_seconds, 'model': 'HistGradientBoostingRegressor',
+            'params': MODEL_PARAMS}
+    for name in ('features.npy', 'shap.npy', 'index.npz'):
+        stem, suffix = name.split('.')
+        os.replace(out_dir / f'{stem}{tmp}.{suffix}', out_dir / name)
+    # meta.json last: its presence marks a complete set
+    (out_dir / f'meta{tmp}.json').write_text(json.dumps(meta, indent=1))
+    os.replace(out_dir / f'meta{tmp}.json', out_dir / 'meta.json')
+    print(f"✅ SHAP attributions for {len(rows):,} district-days → {out_dir}")
+    return load_attributions(out_dir)
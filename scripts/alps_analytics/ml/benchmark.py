@@ -0,0 +1,237 @@
+"""
+Model benchmark behind Figure 8
+Trains every model family on the same sample of the district feature table
+with fixed seeds, times fit and predict with wall and CPU clocks, scores a
+random hold-out split and a state hold-out ("migration") split, and writes
+the results as JSON that Figure 8 reads. XGBoost and LightGBM are used when
+installed; otherwise scikit-learn models of the same kind stand in, and the
+backend used is recorded for each model
+"""
+
+import json
+import os
+import platform
+import time
+import warnings
+from pathlib import Path
+
+import numpy as np
+
+from .attributions import MODEL_PARAMS, SEED, TEST_FRACTION, _sample, input_digest
+from .features import read_features
+
+BENCHMARK_FILENAME = 'model_benchmark.json'
+
+# Bump when the models, metrics or the JSON layout change
+BENCHMARK_VERSION = 1
+
+# District-days sampled for the benchmark (0 = all)
+BENCH_ROWS = 100_000
+
+# State groups held out in turn for the migration R²
+MIGRATION_FOLDS = 3
+
+# Targets below this radiance are left out of MAPE (near-dark districts
+# would dominate it)
+MAPE_MIN_TARGET = 1.0
+
+# Shared boosting settings: 100 rounds at learning rate 0.1
+BOOSTING_ROUNDS = 100
+XGB_DEPTH = 6
+
+
+def _scaled(model):
+    """``model`` on standardised features and target"""
+    from sklearn.compose import TransformedTargetRegressor
+    from sklearn.pipeline import make_pipeline
+    from sklearn.preprocessing import StandardScaler
+    return TransformedTargetRegressor(make_pipeline(StandardScaler(), model),
+                                      transformer=StandardScaler())
+
+
+def _svm(seed):
+    # Exact kernel SVR is quadratic in rows; Nystroem features approximate
+    # the RBF kernel for a linear SVR
+    from sklearn.kernel_approximation import Nystroem
+    from sklearn.pipeline import make_pipeline
+    from sklearn.svm import LinearSVR
+    model = make_pipeline(Nystroem(n_components=300, random_state=seed),
+                          LinearSVR(max_iter=2000, random_state=seed))
+    return _scaled(model), 'scikit-learn Nystroem RBF + LinearSVR'
+
+
+def _ann(seed):
+    from sklearn.neural_network import MLPRegressor
+    model = MLPRegressor(hidden_layer_sizes=(64, 32), early_stopping=True, max_iter=200,
+                         random_state=seed)
+    return _scaled(model), 'scikit-learn MLPRegressor (64, 32)'
+
+
+def _xgboost(seed):
+    try:
+        from xgboost import XGBRegressor
+    except ImportError:
+        # Depth-wise histogram boosting, as XGBoost's hist tree method grows trees
+        from sklearn.ensemble import HistGradientBoostingRegressor
+        return (HistGradientBoostingRegressor(max_iter=BOOSTING_ROUNDS, max_depth=XGB_DEPTH,
+                                              max_leaf_nodes=None, learning_rate=0.1,
+                                              early_stopping=False, random_state=seed),
+                'scikit-learn HistGradientBoostingRegressor (depth-wise, xgboost not installed)')
+    return (XGBRegressor(n_estimators=BOOSTING_ROUNDS, max_depth=XGB_DEPTH, learning_rate=0.1,
+                         tree_method='hist', random_state=seed),
+            f'xgboost {__import__("xgboost").__version__}')
+
+
+def _lightgbm(seed):
+    try:
+        from lightgbm import LGBMRegressor
+    except ImportError:
+        # Leaf-wise trees of 31 leaves: the attribution model (MODEL_PARAMS)
+        from sklearn.ensemble import HistGradientBoostingRegressor
+        return (HistGradientBoostingRegressor(random_state=seed, **MODEL_PARAMS),
+                'scikit-learn HistGradientBoostingRegressor (leaf-wise, lightgbm not installed)')
+    return (LGBMRegressor(n_estimators=BOOSTING_ROUNDS, num_leaves=31, learning_rate=0.1,
+                          random_state=seed, verbose=-1),
+            f'lightgbm {__import__("lightgbm").__version__}')
+
+
+# Figure 8 model name -> factory(seed) returning (unfitted model, backend)
+MODELS = {'SVM': _svm, 'ANN': _ann, 'XGBoost': _xgboost, 'LightGBM': _lightgbm}
+
+
+def _timed(fn, *args):
+    """(result, wall seconds, CPU seconds of this process) of ``fn(*args)``"""
+    wall, cpu = time.perf_counter(), time.process_time()
+    result = fn(*args)
+    return result, time.perf_counter() - wall, time.process_time() - cpu
+
+
+def _fit(model, X, y):
+    from sklearn.exceptions import ConvergenceWarning
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', ConvergenceWarning)
+        return model.fit(X, y)
+
+
+def regression_scores(y, pred):
+    """R², RMSE and MAPE (%, over targets >= MAPE_MIN_TARGET)"""
+    residual = y - pred
+    total = ((y - y.mean()) ** 2).sum()
+    bright = np.abs(y) >= MAPE_MIN_TARGET
+    return {'r2': float(1 - (residual ** 2).sum() / total) if total > 0 else float('nan'),
+            'rmse': float(np.sqrt((residual ** 2).mean())),
+            'mape': float(100 * np.abs(residual[bright] / y[bright]).mean())
+            if bright.any() else float('nan')}
+
+
+def _json_number(value):
+    """``value`` as a JSON-safe float: NaN (an undefined score) becomes None"""
+    return None if value is None or not np.isfinite(value) else float(value)
+
+
+def migration_r2(factory, X, y, states, folds=MIGRATION_FOLDS, seed=SEED):
+    """R² on each group of held-out states when trained on all other states.
+
+    Rows without a state are left out; returns an empty list when fewer
+    than two states are present.
+    """
+    from sklearn.model_selection import GroupKFold
+
+    known = states != ''
+    X, y, states = X[known], y[known], states[known]
+    n_states = len(np.unique(states))
+    if n_states < 2:
+        return []
+    scores = []
+    for train, test in GroupKFold(n_splits=min(folds, n_states)).split(X, y, states):
+        model, _ = factory(seed)
+        _fit(model, X[train], y[train])
+        scores.append(regression_scores(y[test], model.predict(X[test]))['r2'])
+    return scores
+
+
+def host_info():
+    """Hardware and library versions the timings were measured with"""
+    import sklearn
+    return {'platform': platform.platform(), 'machine': platform.machine(),
+            'processor': platform.processor(), 'cpu_count': os.cpu_count(),
+            'python': platform.python_version(), 'numpy': np.__version__,
+            'sklearn': sklearn.__version__}
+
+
+def benchmark_key(data_dir, rows=BENCH_ROWS, folds=MIGRATION_FOLDS, models=tuple(MODELS)):
+    """Hash of the input exports, the benchmark settings, each model's backend
+    and the host, so installing xgboost or lightgbm or moving to other
+    hardware measures again"""
+    backends = {name: MODELS[name](SEED)[1] for name in models}
+    return input_digest(data_dir, {'version': BENCHMARK_VERSION, 'seed': SEED, 'rows': rows,
+                                   'folds': folds, 'models': list(models),
+                                   'backends': backends, 'host': host_info()})
+
+
+def load_benchmark(path):
+    """Stored benchmark results, or None if missing or from another BENCHMARK_VERSION"""
+    path = Path(path)
+    if not path.exists():
+        return None
+    results = json.loads(path.read_text())
+    return results if results.get('version') == BENCHMARK_VERSION else None
+
+
+def run_benchmark(data_dir, output=None, rows=BENCH_ROWS, folds=MIGRATION_FOLDS,
+                  models=tuple(MODELS), force=False):
+    """Benchmark ``models`` on the exports in ``data_dir``.
+
+    Results go to ``output`` (default: BENCHMARK_FILENAME in ``data_dir``)
+    and are reused while the inputs, settings, backends and host are unchanged.
+    """
+    data_dir = Path(data_dir)
+    output = Path(output) if output else data_dir / BENCHMARK_FILENAME
+    unknown = [name for name in models if name not in MODELS]
+    if unknown:
+        raise ValueError(f"unknown models {unknown}; choose from {list(MODELS)}")
+    key = benchmark_key(data_dir, rows, folds, models)
+    cached = load_benchmark(output)
+    if cached is not None and cached.get('key') == key and not force:
+        print(f"⏭  Model benchmark up to date in {output}")
+        return cached
+
+    table = read_features(data_dir)
+    rng = np.random.default_rng(SEED)
+    sample = rng.permutation(_sample(len(table), rows, rng))
+    X, y, states = table.X[sample], table.y[sample], table.states[sample]
+    n_test = int(len(sample) * TEST_FRACTION)
+    test, train = slice(0, n_test), slice(n_test, None)
+    print(f"   {len(sample):,} district-days x {len(table.names)} features, "
+          f"{len(np.unique(states[states != '']))} states")
+
+    results = []
+    for name in models:
+        model, backend = MODELS[name](SEED)
+        _, fit_wall, fit_cpu = _timed(_fit, model, X[train], y[train])
+        pred, predict_wall, predict_cpu = _timed(model.predict, X[test])
+        scores = regression_scores(y[test], pred)
+        migration = migration_r2(MODELS[name], X, y, states, folds)
+        migration_mean = float(np.mean(migration)) if migration else float('nan')
+        results.append({'model': name, 'backend': backend,
+                        **{metric: _json_number(v) for metric, v in scores.items()},
+                        'fit_wall': fit_wall, 'fit_cpu': fit_cpu,
+                        'predict_wall': predict_wall, 'predict_cpu': predict_cpu,
+                        'migration_r2': _json_number(migration_mean),
+                        'migration_folds': [_json_number(r2) for r2 in migration]})
+        print(f"   {name:<9} R² {scores['r2']:.3f}  fit {fit_wall:6.1f}s wall / "
+              f"{fit_cpu:6.1f}s CPU  migration R² {migration_mean:.3f}  [{backend}]")
+
+    benchmark = {'version': BENCHMARK_VERSION, 'key': key, 'seed': SEED,
+                 'rows': int(len(sample)), 'train_rows': int(len(sample) - n_test),
+                 'test_rows': n_test, 'features': list(table.names),
+                 'migration_folds': folds, 'mape_min_target': MAPE_MIN_TARGET,
+                 'host': host_info(), 'measured': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+                 'models': results}
+    output.parent.mkdir(parents=True, exist_ok=True)
+    tmp = output.with_name(f'{output.stem}.{os.getpid()}.tmp')
+    # Undefined scores are stored as null; NaN is not valid JSON
+    tmp.write_text(json.dumps(benchmark, indent=1, allow_nan=False))
+    os.replace(tmp, output)
+    print(f"✅ Model benchmark for {len(results)} models → {output}")
+    return benchmark
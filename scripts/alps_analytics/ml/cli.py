@@ -0,0 +1,55 @@
+"""
+Command-line entry point: python -m alps_analytics.ml
+
+    python -m alps_analytics.ml shap                  # train + explain, cached in .shap/
+    python -m alps_analytics.ml shap --jobs 4 --rows 0
+    python -m alps_analytics.ml bench                 # model benchmark for Figure 8
+
+Reads the CSV exports written by export_paper_data.ts; Figures 5 and 6 read
+the stored attributions, Figure 8 the benchmark results
+"""
+
+import argparse
+from pathlib import Path
+
+from .attributions import SHAP_ROWS, TRAIN_ROWS, compute_attributions
+from .benchmark import BENCH_ROWS, MIGRATION_FOLDS, MODELS, run_benchmark
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m alps_analytics.ml',
+                                     description='Radiance model pipeline stages')
+    parser.add_argument('--data-dir', type=Path, default=Path('tmp/exports/data'),
+                        help='Directory with the CSV exports')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    shap = commands.add_parser('shap', help='Train the tree model and store TreeSHAP values')
+    shap.add_argument('--rows', type=int, default=SHAP_ROWS,
+                      help=f'District-days to explain, 0 for all (default: {SHAP_ROWS:,})')
+    shap.add_argument('--train-rows', type=int, default=TRAIN_ROWS,
+                      help=f'District-days to train on, 0 for all (default: {TRAIN_ROWS:,})')
+    shap.add_argument('--jobs', '-j', type=int, default=1, help='Worker processes for TreeSHAP')
+    shap.add_argument('--force', '-f', action='store_true', help='Recompute even if up to date')
+
+    bench = commands.add_parser('bench', help='Time and score the Figure 8 model families')
+    bench.add_argument('--rows', type=int, default=BENCH_ROWS,
+                       help=f'District-days to sample, 0 for all (default: {BENCH_ROWS:,})')
+    bench.add_argument('--folds', type=int, default=MIGRATION_FOLDS,
+                       help=f'State hold-out folds for migration R² (default: {MIGRATION_FOLDS})')
+    bench.add_argument('--models', nargs='+', choices=list(MODELS), default=list(MODELS),
+                       help='Model families to run (default: all)')
+    bench.add_argument('--output', '-o', type=Path,
+                       help='Results JSON (default: model_benchmark.json in --data-dir)')
+    bench.add_argument('--force', '-f', action='store_true', help='Rerun even if up to date')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.command == 'shap':
+        compute_attributions(args.data_dir, train_rows=args.train_rows, shap_rows=args.rows,
+                             jobs=args.jobs, force=args.force)
+    elif args.command == 'bench':
+        run_benchmark(args.data_dir, args.output, rows=args.rows, folds=args.folds,
+                      models=tuple(args.models), force=args.force)
+    return 0
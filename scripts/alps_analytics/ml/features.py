@@ -0,0 +1,152 @@
+"""
+District-day feature table for the radiance models
+Every DistrictDailyMetric row becomes one sample: the target is that day's
+radiance and the features describe only what was known the day before
+(lagged and rolling radiance, hotspots, the state's radiance), the season and
+the long-term trend, plus the yearly climate covariates when exported
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from ..anomaly.detector import group_starts, rolling_baseline, sort_daily
+
+# Feature name -> label used in the figures, in column order
+FEATURE_LABELS = {
+    'radiance_lag1': 'Previous-Day Radiance',
+    'radiance_mean7': '7-Day Mean Radiance',
+    'radiance_mean30': '30-Day Mean Radiance',
+    'radiance_std30': '30-Day Radiance Variability',
+    'hotspots_lag1': 'Previous-Day Hotspots',
+    'state_radiance_lag1': 'State Mean Radiance',
+    'season_sin': 'Seasonal Cycle (sin)',
+    'season_cos': 'Seasonal Cycle (cos)',
+    'trend_years': 'Long-Term Trend',
+    'cloud_cover': 'Cloud Cover',
+    'temperature': 'Temperature',
+}
+
+# correlation_data.csv columns joined by year
+COVARIATES = ('cloud_cover', 'temperature')
+
+# Rows with less history than this are dropped (their rolling means are noise)
+MIN_HISTORY = 7
+
+EPOCH_YEAR = 2014
+
+
+@dataclass
+class FeatureTable:
+    """Samples ordered by (code, date): ``X[i]`` predicts ``y[i]``"""
+    codes: np.ndarray
+    dates: np.ndarray
+    states: np.ndarray
+    names: tuple
+    X: np.ndarray
+    y: np.ndarray
+
+    def __len__(self):
+        return len(self.y)
+
+    @property
+    def labels(self):
+        return [FEATURE_LABELS.get(name, name) for name in self.names]
+
+
+def _lag(ids, values):
+    """Previous row's value within each id run (NaN on the first row)"""
+    out = np.full(len(values), np.nan)
+    out[1:] = values[:-1]
+    out[group_starts(ids) == np.arange(len(ids))] = np.nan
+    return out
+
+
+def _lower(frame):
+    frame = frame.copy()
+    frame.columns = [c.lower() for c in frame.columns]
+    return frame
+
+
+def build_features(daily, state_daily=None, district_states=None, covariates=None,
+                   min_history=MIN_HISTORY):
+    """FeatureTable from district daily rows (code, date, radiance, hotspots).
+
+    ``state_daily`` (code, date, radiance) with ``district_states`` (district
+    code -> state code) adds the state's previous-day radiance;
+    ``covariates`` (year plus COVARIATES columns) adds the yearly climate
+    series. Features that cannot be built are left out of ``names``.
+    """
+    ids, codes, dates, radiance = sort_daily(daily)
+    _, _, _, hotspots = sort_daily(daily, 'hotspots')
+    columns = {}
+    columns['radiance_lag1'] = _lag(ids, radiance)
+    mean7, n = rolling_baseline(ids, radiance, 7)
+    columns['radiance_mean7'] = mean7
+    mean30, _ = rolling_baseline(ids, radiance, 30)
+    square30, _ = rolling_baseline(ids, radiance ** 2, 30)
+    columns['radiance_mean30'] = mean30
+    columns['radiance_std30'] = np.sqrt(np.maximum(square30 - mean30 ** 2, 0.0))
+    columns['hotspots_lag1'] = _lag(ids, hotspots)
+
+    codes = codes.astype(str)
+    code_states = np.full(len(codes), '', dtype=object)
+    if district_states is not None:
+        code_states = pd.Series(codes).map(district_states).fillna('').to_numpy(dtype=object)
+    code_states = code_states.astype(str)
+    states = code_states[ids]
+    if state_daily is not None and district_states is not None:
+        state = _lower(state_daily)
+        # Indexed by the day after the observation, i.e. the day it is known on
+        following = state['date'].to_numpy().astype('datetime64[D]') + np.timedelta64(1, 'D')
+        previous = pd.Series(state['radiance'].to_numpy(dtype=np.float64),
+                             index=pd.MultiIndex.from_arrays([state['code'].astype(str).to_numpy(),
+                                                              following]))
+        previous = previous[~previous.index.duplicated()]
+        key = pd.MultiIndex.from_arrays([states, dates])
+        columns['state_radiance_lag1'] = previous.reindex(key).to_numpy()
+
+    day_of_year = (dates - dates.astype('datetime64[Y]')).astype(np.float64)
+    angle = 2 * np.pi * day_of_year / 365.25
+    columns['season_sin'] = np.sin(angle)
+    columns['season_cos'] = np.cos(angle)
+    year = dates.astype('datetime64[Y]').astype(np.int64) + 1970
+    columns['trend_years'] = (year - EPOCH_YEAR) + day_of_year / 365.25
+
+    if covariates is not None:
+        yearly = _lower(covariates).set_index('year')
+        for name in COVARIATES:
+            if name in yearly:
+                columns[name] = yearly[name].reindex(year).to_numpy(dtype=np.float64)
+
+    names = tuple(name for name in FEATURE_LABELS if name in columns)
+    X = np.column_stack([columns[name] for name in names]).astype(np.float32)
+    keep = (n >= min_history) & ~np.isnan(X).any(axis=1) & ~np.isnan(radiance)
+    return FeatureTable(codes[ids[keep]], dates[keep], states[keep], names,
+                        np.ascontiguousarray(X[keep]), radiance[keep])
+
+
+def read_features(data_dir):
+    """FeatureTable from the CSV exports in ``data_dir`` (district daily required)"""
+    # Imported here: alps_figures.data itself imports from alps_analytics
+    from alps_figures.data import EXPORTS, read_export
+
+    data_dir = Path(data_dir)
+
+    def read(name, columns=None):
+        spec = EXPORTS[name]
+        path = data_dir / spec.filename
+        return read_export(path, spec, columns) if path.exists() else None
+
+    daily = read('district_daily', ('code', 'date', 'radiance', 'hotspots'))
+    if daily is None:
+        raise FileNotFoundError(f'{data_dir / EXPORTS["district_daily"].filename} not found')
+    state_daily = read('state_daily', ('code', 'date', 'radiance'))
+    yearly = read('district_yearly', ('district_code', 'state_code'))
+    district_states = None
+    if yearly is not None:
+        district_states = yearly.drop_duplicates('district_code').set_index('district_code')
+        district_states = district_states['state_code']
+    return build_features(daily, state_daily, district_states, read('correlation_data'))
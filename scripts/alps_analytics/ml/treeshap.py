@@ -0,0 +1,321 @@
+"""
+Exact TreeSHAP for tree ensembles
+Path-dependent TreeSHAP (Lundberg et al. 2020) split into a model part and a
+sample part. A leaf's contribution to each feature depends on a sample only
+through which of the features on its root path the sample agrees with, so for
+every leaf the contributions of all 2^d agreement patterns are tabulated once
+from the node covers. Explaining a batch is then one comparison per split,
+two sparse products giving a bit-packed pattern code per leaf, and a table
+lookup; batches are spread across a process pool. A leaf's table holds
+d 2^d values, so paths are limited to MAX_PATH_FEATURES distinct features
+"""
+
+import math
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+
+import numpy as np
+from scipy import sparse
+
+# Working memory of one explained batch (samples x path entries)
+BATCH_BYTES = 64 * 2 ** 20
+
+# Upper bound on the (leaves x patterns x features) block tabulated at once
+TABLE_ELEMENTS = 2 ** 22
+
+# Most distinct features on one root-to-leaf path: a leaf's pattern table
+# holds d 2^d values, 8 MiB at d = 16 and doubling with each further feature
+MAX_PATH_FEATURES = 16
+
+
+@dataclass
+class TreeEnsemble:
+    """Trees of an additive regression model as flat node arrays.
+
+    Node ``i`` sends a sample left when ``x[feature[i]] <= threshold[i]``
+    (NaN goes left where ``missing_left[i]``); ``left`` and ``right`` are -1
+    at leaves. ``cover`` is the training weight reaching each node. The
+    prediction is ``base`` plus the ``value`` of the leaf reached in each
+    tree, whose root nodes are ``roots``.
+    """
+    feature: np.ndarray
+    threshold: np.ndarray
+    missing_left: np.ndarray
+    left: np.ndarray
+    right: np.ndarray
+    value: np.ndarray
+    cover: np.ndarray
+    roots: np.ndarray
+    base: float
+    n_features: int
+
+    @classmethod
+    def from_trees(cls, trees, base, n_features):
+        """From one (feature, threshold, missing_left, left, right, value,
+        cover) tuple of per-node arrays per tree, children local to the tree"""
+        parts = [[] for _ in range(7)]
+        roots, offset = [], 0
+        for tree in trees:
+            feature, threshold, missing_left, left, right, value, cover = map(np.asarray, tree)
+            roots.append(offset)
+            for part, array in zip(parts, (feature, threshold, missing_left,
+                                           np.where(left >= 0, left + offset, -1),
+                                           np.where(right >= 0, right + offset, -1), value, cover)):
+                part.append(array)
+            offset += len(feature)
+        feature, threshold, missing_left, left, right, value, cover = (np.concatenate(p) for p in parts)
+        return cls(feature.astype(np.int64), threshold.astype(np.float64), missing_left.astype(bool),
+                   left.astype(np.int64), right.astype(np.int64), value.astype(np.float64),
+                   cover.astype(np.float64), np.asarray(roots, dtype=np.int64), float(base),
+                   int(n_features))
+
+    @classmethod
+    def from_sklearn(cls, model):
+        """From a fitted HistGradientBoostingRegressor, GradientBoostingRegressor,
+        RandomForestRegressor/ExtraTreesRegressor or DecisionTreeRegressor"""
+        n_features = model.n_features_in_
+        if hasattr(model, '_predictors'):
+            # HistGradientBoosting keeps its trees as TreePredictor node records
+            trees = []
+            for (predictor,) in model._predictors:
+                nodes = predictor.nodes
+                if nodes['is_categorical'].any():
+                    raise ValueError('categorical splits are not supported')
+                leaf = nodes['is_leaf'].astype(bool)
+                trees.append((nodes['feature_idx'], nodes['num_threshold'], nodes['missing_go_to_left'],
+                              np.where(leaf, -1, nodes['left'].astype(np.int64)),
+                              np.where(leaf, -1, nodes['right'].astype(np.int64)),
+                              nodes['value'], nodes['count']))
+            return cls.from_trees(trees, np.ravel(model._baseline_prediction)[0], n_features)
+
+        if hasattr(model, 'estimators_'):
+            estimators = np.ravel(model.estimators_)
+            if hasattr(model, 'learning_rate'):
+                scale, base = model.learning_rate, np.ravel(model.init_.constant_)[0]
+            else:
+                scale, base = 1.0 / len(estimators), 0.0
+        else:
+            estimators, scale, base = [model], 1.0, 0.0
+
+        trees = []
+        for estimator in estimators:
+            t = estimator.tree_
+            missing = getattr(t, 'missing_go_to_left', np.zeros(t.node_count, dtype=bool))
+            trees.append((t.feature, t.threshold, missing, t.children_left, t.children_right,
+                          t.value[:, 0, 0] * scale, t.weighted_n_node_samples))
+        return cls.from_trees(trees, base, n_features)
+
+    def leaves(self):
+        """Index of every leaf node"""
+        return np.flatnonzero(self.left < 0)
+
+    def predict(self, X):
+        X = np.asarray(X, dtype=np.float64)
+        total = np.full(len(X), self.base)
+        rows = np.arange(len(X))
+        for root in self.roots:
+            node = np.full(len(X), root)
+            inner = self.left[node] >= 0
+            while inner.any():
+                at = node[inner]
+                x = X[rows[inner], self.feature[at]]
+                go_left = (x <= self.threshold[at]) | (np.isnan(x) & self.missing_left[at])
+                node[inner] = np.where(go_left, self.left[at], self.right[at])
+                inner = self.left[node] >= 0
+            total += self.value[node]
+        return total
+
+
+def _leaf_paths(ensemble):
+    """(tree root, leaf, [(node, went_left), ...]) for every leaf, root first"""
+    for root in ensemble.roots:
+        stack = [(root, [])]
+        while stack:
+            node, path = stack.pop()
+            if ensemble.left[node] < 0:
+                yield root, node, path
+            else:
+                stack.append((ensemble.right[node], path + [(node, False)]))
+                stack.append((ensemble.left[node], path + [(node, True)]))
+
+
+def pattern_tables(z, value):
+    """Contribution of each feature of ``m`` paths of ``d`` unique features.
+
+    ``z`` (m, d) is the fraction of the training cover kept along the path
+    for each feature and ``value`` (m,) the leaf values. Entry ``[j, p, i]``
+    is path ``j``'s SHAP contribution to its feature ``i`` for a sample whose
+    agreement with the path is bit pattern ``p`` (bit ``k`` set when the
+    sample follows every split on feature ``k``):
+
+        v (o_i - z_i) sum_s s! (d - 1 - s)! / d! e_s(i)
+
+    where e_s(i) is the coefficient of t^s in prod_{k != i} (z_k + o_k t).
+    """
+    m, d = z.shape
+    patterns = (np.arange(2 ** d)[:, None] >> np.arange(d)) & 1
+    weights = np.array([math.factorial(s) * math.factorial(d - 1 - s) for s in range(d)],
+                       dtype=np.float64) / math.factorial(d)
+    out = np.empty((m, 2 ** d, d))
+    for i in range(d):
+        coef = np.zeros((m, 2 ** d, d))
+        coef[:, :, 0] = 1.0
+        for k in range(d):
+            if k == i:
+                continue
+            shifted = coef[:, :, :-1] * patterns[None, :, k, None]
+            coef *= z[:, None, k, None]
+            coef[:, :, 1:] += shifted
+        out[:, :, i] = value[:, None] * (patterns[None, :, i] - z[:, None, i]) * (coef @ weights)
+    return out
+
+
+class TreeExplainer:
+    """Exact (path-dependent) SHAP values of a TreeEnsemble.
+
+    Built once per model: the pattern tables and flattened path entries are
+    plain arrays, so the explainer pickles cheaply to worker processes.
+    Raises ValueError when a leaf's path splits on more than
+    ``max_path_features`` distinct features, as its table would not fit in
+    memory; limit the tree depth (or leaves) of such models.
+    """
+
+    def __init__(self, ensemble, max_path_features=MAX_PATH_FEATURES):
+        self.n_features = ensemble.n_features
+        e_node, e_left, e_group = [], [], []
+        g_slot, g_leaf, g_feature, leaf_z, leaf_value = [], [], [], [], []
+        expected = ensemble.base
+        for root, leaf, path in _leaf_paths(ensemble):
+            value = ensemble.value[leaf]
+            expected += value * ensemble.cover[leaf] / ensemble.cover[root]
+            if not path:
+                continue
+            slots, z = {}, []
+            for node, went_left in path:
+                child = ensemble.left[node] if went_left else ensemble.right[node]
+                slot = slots.setdefault(ensemble.feature[node], len(slots))
+                if slot == len(z):
+                    z.append(1.0)
+                z[slot] *= ensemble.cover[child] / ensemble.cover[node]
+            if len(z) > max_path_features:
+                raise ValueError(f"leaf {leaf} splits on {len(z)} distinct features, more than "
+                                 f"max_path_features={max_path_features}; its pattern table "
+                                 f"would hold {len(z) << len(z):,} values")
+            order = sorted(range(len(path)), key=lambda j: slots[ensemble.feature[path[j][0]]])
+            for j in order:
+                node, went_left = path[j]
+                e_node.append(node)
+                e_left.append(went_left)
+                e_group.append(len(g_slot) + slots[ensemble.feature[node]])
+            g_slot.extend(range(len(slots)))
+            g_leaf.extend([len(leaf_z)] * len(slots))
+            g_feature.extend(slots)
+            leaf_z.append(z)
+            leaf_value.append(value)
+
+        self.expected_value = float(expected)
+        # Each split is evaluated once per sample and shared by the paths through
+        # it: a path feature agrees when its left-going splits all went left and
+        # its right-going ones did not, i.e. when (+1 left, -1 right) summed
+        # over the went-left indicators equals its number of left-going splits
+        nodes, e_split = np.unique(np.asarray(e_node, dtype=np.int64), return_inverse=True)
+        self.s_feature = ensemble.feature[nodes]
+        self.s_threshold = ensemble.threshold[nodes]
+        self.s_missing = ensemble.missing_left[nodes]
+        e_left = np.asarray(e_left, dtype=bool)
+        e_group = np.asarray(e_group, dtype=np.int64)
+        self.splits = sparse.csr_matrix((np.where(e_left, 1.0, -1.0), (e_group, e_split)),
+                                        shape=(len(g_slot), len(nodes)))
+        self.g_need = np.bincount(e_group, weights=e_left, minlength=len(g_slot))
+        self.g_slot = np.asarray(g_slot, dtype=np.int64)
+        self.g_leaf = np.asarray(g_leaf, dtype=np.int64)
+        self.g_feature = np.asarray(g_feature, dtype=np.int64)
+        groups = np.arange(len(g_slot))
+        self.onehot = sparse.csr_matrix((np.ones(len(g_slot)), (self.g_feature, groups)),
+                                        shape=(self.n_features, len(g_slot)))
+        # Pattern code of each leaf: its agreeing features' bits
+        self.bits = sparse.csr_matrix((np.ldexp(1.0, self.g_slot), (self.g_leaf, groups)),
+                                      shape=(len(leaf_z), len(g_slot)))
+        self.l_depth = np.array([len(z) for z in leaf_z], dtype=np.int64)
+        self.l_offset = np.concatenate([[0], np.cumsum(self.l_depth << self.l_depth)[:-1]]).astype(np.int64)
+        self.tables = self._tabulate(leaf_z, np.asarray(leaf_value, dtype=np.float64))
+
+    def _tabulate(self, leaf_z, leaf_value):
+        tables = np.empty(int((self.l_depth << self.l_depth).sum()))
+        for d in np.unique(self.l_depth):
+            leaves = np.flatnonzero(self.l_depth == d)
+            z = np.array([leaf_z[j] for j in leaves], dtype=np.float64).reshape(len(leaves), d)
+            step = max(1, TABLE_ELEMENTS // (d << d))
+            for start in range(0, len(leaves), step):
+                chunk = leaves[start:start + step]
+                block = pattern_tables(z[start:start + step], leaf_value[chunk])
+                at = self.l_offset[chunk][:, None] + np.arange(d << d)
+                tables[at] = block.reshape(len(chunk), -1)
+        return tables
+
+    @property
+    def batch_rows(self):
+        """Rows per batch that keep explain() within BATCH_BYTES"""
+        per_row = 16 * len(self.s_feature) + 40 * len(self.g_slot) + 16 * len(self.l_depth)
+        return max(1, BATCH_BYTES // per_row)
+
+    def explain(self, X):
+        """(n, n_features) SHAP values of the rows of ``X``"""
+        X = np.asarray(X, dtype=np.float64)
+        if not len(self.g_slot):
+            return np.zeros((len(X), self.n_features))
+        # (splits, samples) layout so the sparse products run over sample rows
+        x = X.T[self.s_feature]
+        went_left = (x <= self.s_threshold[:, None]) | (np.isnan(x) & self.s_missing[:, None])
+        agrees = (self.splits @ went_left.astype(np.float64)) == self.g_need[:, None]
+        code = (self.bits @ agrees.astype(np.float64)).astype(np.int64)
+        index = code[self.g_leaf] * self.l_depth[self.g_leaf, None]
+        index += (self.l_offset[self.g_leaf] + self.g_slot)[:, None]
+        return (self.onehot @ self.tables[index]).T
+
+
+_WORKER = None
+
+
+def _init_worker(explainer):
+    global _WORKER
+    _WORKER = explainer
+
+
+def _explain_batch(X):
+    return _WORKER.explain(X)
+
+
+def shap_values(explainer, X, out=None, jobs=1, batch_rows=None, progress=None):
+    """SHAP values of every row of ``X``, written batch by batch into ``out``.
+
+    ``out`` may be a memory-mapped (n, n_features) array, so results never
+    have to fit in memory at once; with ``jobs`` > 1 batches are explained in
+    worker processes, each holding its own copy of the explainer.
+    ``progress(done, total)`` is called after each batch.
+    """
+    n = len(X)
+    if out is None:
+        out = np.empty((n, explainer.n_features), dtype=np.float32)
+    rows = batch_rows or explainer.batch_rows
+    batches = [(start, min(start + rows, n)) for start in range(0, n, rows)]
+    done = 0
+    if jobs <= 1 or len(batches) <= 1:
+        for start, stop in batches:
+            out[start:stop] = explainer.explain(X[start:stop])
+            done += stop - start
+            if progress:
+                progress(done, n)
+        return out
+
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                             initargs=(explainer,)) as pool:
+        futures = {pool.submit(_explain_batch, np.asarray(X[start:stop])): (start, stop)
+                   for start, stop in batches}
+        for future in as_completed(futures):
+            start, stop = futures[future]
+            out[start:stop] = future.result()
+            done += stop - start
+            if progress:
+                progress(done, n)
+    return out
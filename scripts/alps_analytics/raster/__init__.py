@@ -0,0 +1,25 @@
+"""
+Raster access and per-pixel processing of VIIRS Black Marble tiles
+"""
+
+from .cube import (BLOCK_BYTES, CHUNK_DAYS, CHUNK_PIXELS, RasterCube, build_cube, nan_quantiles,
+                   snap_grid)
+from .lut import LUT_DIRNAME, LUT_VERSION, LutStore, PixelIndex, lut_key, rasterise
+from .qa import (CLOUD_MASK_LAYER, CONFIDENT_CLEAR, CONFIDENT_CLOUDY, PROBABLY_CLEAR,
+                 PROBABLY_CLOUDY, QUALITY_LAYER, QaPolicy)
+from .tiles import (FILL_VALUE, PIXEL_DEGREES, RADIANCE_LAYERS, SCALE_FACTOR, TILE_DEGREES,
+                    TILE_SIZE, CogTile, Granule, H5Tile, TileGrid, Window, find_granules,
+                    open_tile, parse_granule, tiles_for_bbox, to_radiance)
+from .zonal import HOTSPOT_THRESHOLD, PERCENTILES, ZonalEngine, backfill, segment_stats
+
+__all__ = [
+    'BLOCK_BYTES', 'CHUNK_DAYS', 'CHUNK_PIXELS', 'RasterCube', 'build_cube', 'nan_quantiles',
+    'snap_grid',
+    'LUT_DIRNAME', 'LUT_VERSION', 'LutStore', 'PixelIndex', 'lut_key', 'rasterise',
+    'CLOUD_MASK_LAYER', 'CONFIDENT_CLEAR', 'CONFIDENT_CLOUDY', 'PROBABLY_CLEAR',
+    'PROBABLY_CLOUDY', 'QUALITY_LAYER', 'QaPolicy',
+    'FILL_VALUE', 'PIXEL_DEGREES', 'RADIANCE_LAYERS', 'SCALE_FACTOR', 'TILE_DEGREES',
+    'TILE_SIZE', 'CogTile', 'Granule', 'H5Tile', 'TileGrid', 'Window', 'find_granules',
+    'open_tile', 'parse_granule', 'tiles_for_bbox', 'to_radiance',
+    'HOTSPOT_THRESHOLD', 'PERCENTILES', 'ZonalEngine', 'backfill', 'segment_stats',
+]
@@ -0,0 +1,5 @@
+import sys
+
+from .zonal import main
+
+sys.exit(main())
@@ -0,0 +1,174 @@
+"""
+District-to-pixel lookup tables
+rasterise() assigns tile pixels to districts (pixel-centre rule). A PixelIndex
+depends only on the district geometry and the tile grid, so it is rasterised
+once and stored as <name>.offsets.npy (the int32 pixel offsets,
+memory-mapped on load) plus a small <name>.meta.npz. The name carries a hash
+of geometry, grid and LUT_VERSION, so edited boundaries never reuse a stale
+table and a daily ingest does no geometry work at all
+"""
+
+import hashlib
+import json
+import os
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import numpy as np
+
+from ..spatial.polygon import PolygonIndex
+from .tiles import TileGrid, Window
+
+LUT_DIRNAME = '.lut'
+
+# Bump when rasterisation rules or the on-disk layout change
+LUT_VERSION = 1
+
+# Pixel rows located per block while rasterising
+ROWS_PER_BLOCK = 256
+
+
+@dataclass
+class PixelIndex:
+    """District pixels of one tile grid.
+
+    ``offsets[ptr[i]:ptr[i + 1]]`` are the flat offsets (row-major, relative
+    to ``window``) of the pixels whose centres fall in district
+    ``district[i]``. Districts smaller than a pixel get the pixel under their
+    centroid.
+    """
+    grid: TileGrid
+    window: Window
+    district: np.ndarray
+    ptr: np.ndarray
+    offsets: np.ndarray
+
+    @property
+    def n_pixels(self):
+        return len(self.offsets)
+
+    def pixel_district(self):
+        """District index of every entry of ``offsets``"""
+        return np.repeat(self.district, np.diff(self.ptr))
+
+    def gather(self, array):
+        """Values of a window-shaped array at the indexed pixels (no full copy)"""
+        rows, cols = np.divmod(self.offsets, self.window.shape[1])
+        return array[rows, cols]
+
+
+def _polygon_index(geoms, districts):
+    """PolygonIndex over a subset of districts; owners stay global indices"""
+    rings = np.flatnonzero(np.isin(geoms.ring_owner, districts))
+    lengths = np.diff(geoms.ring_offsets)[rings]
+    starts = geoms.ring_offsets[rings]
+    take = np.repeat(starts - np.cumsum(lengths) + lengths, lengths) + np.arange(lengths.sum())
+    return PolygonIndex(geoms.vertices[take], np.concatenate([[0], np.cumsum(lengths)]),
+                        geoms.ring_owner[rings])
+
+
+def rasterise(geoms, grid, rows_per_block=ROWS_PER_BLOCK):
+    """PixelIndex of ``geoms`` on ``grid`` (pixel-centre rule)"""
+    west, south, east, north = grid.bounds
+    bbox = geoms.bbox
+    districts = np.flatnonzero((bbox[:, 0] < east) & (bbox[:, 2] > west) &
+                               (bbox[:, 1] < north) & (bbox[:, 3] > south))
+    if not len(districts):
+        return PixelIndex(grid, Window(0, 0, 0, 0), np.empty(0, np.int32),
+                          np.zeros(1, np.int64), np.empty(0, np.int32))
+    window = grid.window((bbox[districts, 0].min(), bbox[districts, 1].min(),
+                          bbox[districts, 2].max(), bbox[districts, 3].max()))
+    index = _polygon_index(geoms, districts)
+    lon, lat = grid.pixel_centres(window)
+    width = window.shape[1]
+
+    owners, offsets = [], []
+    for r0 in range(0, len(lat), rows_per_block):
+        block_lat = lat[r0:r0 + rows_per_block]
+        owner = index.locate(np.broadcast_to(lon, (len(block_lat), width)),
+                             np.broadcast_to(block_lat[:, None], (len(block_lat), width)))
+        flat = np.flatnonzero(owner.ravel() >= 0)
+        owners.append(owner.ravel()[flat])
+        offsets.append(flat + r0 * width)
+    owner = np.concatenate(owners)
+    offset = np.concatenate(offsets)
+
+    # Sub-pixel districts: the pixel under the centroid, if it is in this tile
+    empty = np.setdiff1d(districts, owner)
+    if len(empty):
+        centroid = geoms.centroids()[empty]
+        col = np.floor((centroid[:, 0] - grid.west) / grid.pixel).astype(np.int64) - window.col0
+        row = np.floor((grid.north - centroid[:, 1]) / grid.pixel).astype(np.int64) - window.row0
+        inside = (col >= 0) & (col < width) & (row >= 0) & (row < window.shape[0])
+        owner = np.concatenate([owner, empty[inside]])
+        offset = np.concatenate([offset, row[inside] * width + col[inside]])
+
+    order = np.argsort(owner, kind='stable')
+    owner, offset = owner[order], offset[order]
+    district, counts = np.unique(owner, return_counts=True)
+    return PixelIndex(grid, window, district.astype(np.int32),
+                      np.concatenate([[0], np.cumsum(counts)]), offset.astype(np.int32))
+
+
+def lut_key(digest, grid):
+    """Cache key of the table for geometry ``digest`` on ``grid``"""
+    h = hashlib.sha256()
+    h.update(json.dumps({'version': LUT_VERSION, **asdict(grid)}, sort_keys=True).encode())
+    h.update(digest.encode())
+    return h.hexdigest()
+
+
+class LutStore:
+    """Directory of PixelIndex tables, one pair of files per (geometry, grid)"""
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+
+    def stem(self, digest, grid):
+        hv = grid.hv
+        name = f'h{hv[0]:02d}v{hv[1]:02d}' if hv else 'grid'
+        return self.directory / f'{name}-{lut_key(digest, grid)[:16]}'
+
+    def load(self, digest, grid):
+        """Stored PixelIndex, offsets memory-mapped read-only; None if absent"""
+        stem = self.stem(digest, grid)
+        meta = stem.with_suffix('.meta.npz')
+        if not meta.exists():
+            return None
+        with np.load(meta) as f:
+            window = Window(*f['window'].tolist())
+            district, ptr = f['district'], f['ptr']
+        offsets = np.load(stem.with_suffix('.offsets.npy'), mmap_mode='r')
+        return PixelIndex(grid, window, district, ptr, offsets)
+
+    def save(self, digest, index):
+        stem = self.stem(digest, index.grid)
+        stem.parent.mkdir(parents=True, exist_ok=True)
+        tmp = f'.{os.getpid()}.tmp'
+        offsets_tmp = stem.with_name(stem.name + tmp + '.npy')
+        meta_tmp = stem.with_name(stem.name + tmp + '.npz')
+        np.save(offsets_tmp, np.ascontiguousarray(index.offsets, dtype=np.int32))
+        np.savez(meta_tmp, window=np.array([index.window.row0, index.window.col0,
+                                            index.window.row1, index.window.col1]),
+                 district=index.district, ptr=index.ptr)
+        # Offsets first: a present .meta.npz marks a complete table
+        os.replace(offsets_tmp, stem.with_suffix('.offsets.npy'))
+        os.replace(meta_tmp, stem.with_suffix('.meta.npz'))
+
+    def get(self, geoms, grid, digest=None):
+        """Stored table for ``geoms`` on ``grid``, rasterising it on first use"""
+        digest = digest or geoms.digest()
+        index = self.load(digest, grid)
+        if index is None:
+            index = rasterise(geoms, grid)
+            self.save(digest, index)
+            index = self.load(digest, grid)
+        return index
+
+    def grids(self):
+        """Grids of the standard tiles with stored tables (any geometry)"""
+        found = set()
+        for path in self.directory.glob('h*v*-*.meta.npz'):
+            name = path.name.split('-', 1)[0]
+            found.add(TileGrid.from_hv(int(name[1:3]), int(name[4:6])))
+        return sorted(found, key=lambda g: g.hv)
@@ -0,0 +1,66 @@
+"""
+VNP46 quality and cloud flag masking
+QF_Cloud_Mask (and, for VNP46A2, Mandatory_Quality_Flag) is decoded with
+integer bit operations into one validity mask per read. The mask is applied
+in place to the scaled radiance, or only at the gathered district pixels, so
+an unmasked copy is never held next to the masked one
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+CLOUD_MASK_LAYER = 'QF_Cloud_Mask'
+QUALITY_LAYER = 'Mandatory_Quality_Flag'
+
+# QF_Cloud_Mask bits (Black Marble user guide): 0 day/night, 1-3 land/water,
+# 4-5 cloud mask quality, 6-7 cloud detection, 8 shadow, 9 cirrus, 10 snow/ice
+DAY = 1 << 0
+SHADOW = 1 << 8
+CIRRUS = 1 << 9
+SNOW = 1 << 10
+CLOUD_DETECTION_SHIFT = 6
+CONFIDENT_CLEAR, PROBABLY_CLEAR, PROBABLY_CLOUDY, CONFIDENT_CLOUDY = range(4)
+
+# Mandatory_Quality_Flag values (VNP46A2)
+PERSISTENT, EPHEMERAL, POOR_QUALITY, NO_RETRIEVAL = 0, 1, 2, 255
+
+
+@dataclass(frozen=True)
+class QaPolicy:
+    """Which pixels count as valid observations.
+
+    A pixel is kept when none of the ``reject`` bits is set, its cloud
+    detection is at most ``max_cloud`` and, where the granule has a
+    Mandatory_Quality_Flag layer, that flag is at most ``max_quality``
+    (None skips it). The default keeps clear and probably-clear night pixels
+    without shadow, cirrus or snow.
+    """
+    max_cloud: int = PROBABLY_CLEAR
+    reject: int = DAY | SHADOW | CIRRUS | SNOW
+    max_quality: Optional[int] = EPHEMERAL
+
+    def valid(self, cloud, quality=None):
+        """Boolean mask from QF_Cloud_Mask values (and quality flags)"""
+        cloud = np.asarray(cloud)
+        ok = (cloud & self.reject) == 0
+        ok &= ((cloud >> CLOUD_DETECTION_SHIFT) & 0b11) <= self.max_cloud
+        if quality is not None and self.max_quality is not None:
+            ok &= np.asarray(quality) <= self.max_quality
+        return ok
+
+    def read_valid(self, tile, window, gather=None):
+        """Mask for ``window`` of ``tile``; with ``gather`` (e.g.
+        PixelIndex.gather) only at those pixels"""
+        take = gather or (lambda array: array)
+        cloud = take(tile.raw(CLOUD_MASK_LAYER, window))
+        quality = None
+        if self.max_quality is not None and tile.has_layer(QUALITY_LAYER):
+            quality = take(tile.raw(QUALITY_LAYER, window))
+        return self.valid(cloud, quality)
+
+    def apply(self, tile, window, radiance, gather=None):
+        """Set rejected pixels of ``radiance`` to NaN in place; returns it"""
+        radiance[~self.read_valid(tile, window, gather)] = np.nan
+        return radiance
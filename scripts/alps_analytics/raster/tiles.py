@@ -0,0 +1,368 @@
+"""
+VIIRS Black Marble tile access (VNP46A1/VNP46A2 HDF5 granules and COGs)
+Tiles sit on the 10-degree linear lat/lon grid (2400 x 2400 pixels of 15
+arc-seconds, h00v00 at 180W 90N). Readers open the HDF5 granule or the
+radiance.tif written by process-tiles.ts lazily and read only the window
+covering a bounding box; contiguous, unfiltered HDF5 layers are
+memory-mapped so their windows are views rather than copies
+"""
+
+import re
+from dataclasses import dataclass
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+try:
+    import h5py
+except ImportError:  # pragma: no cover - optional dependency
+    h5py = None
+
+try:
+    import rasterio
+    from rasterio.windows import Window as RioWindow
+except ImportError:  # pragma: no cover - optional dependency
+    rasterio = None
+
+TILE_SIZE = 2400
+TILE_DEGREES = 10.0
+PIXEL_DEGREES = TILE_DEGREES / TILE_SIZE
+
+# Radiance layers in order of preference (VNP46A2 gap-filled/BRDF, VNP46A1)
+RADIANCE_LAYERS = (
+    'DNB_BRDF_Corrected_NTL',
+    'Gap_Filled_DNB_BRDF_Corrected_NTL',
+    'DNB_At_Sensor_Radiance_500m',
+)
+
+# Product defaults for layers without CF attributes (nW/cm^2/sr)
+FILL_VALUE = 65535
+SCALE_FACTOR = 0.1
+
+# VNP46A1.A2023001.h25v06.001.2023008123456.h5; the tile id is optional
+GRANULE_PATTERN = re.compile(r'A(?P<year>\d{4})(?P<doy>\d{3})(?:\.h(?P<h>\d{2})v(?P<v>\d{2}))?')
+
+
+@dataclass(frozen=True)
+class Window:
+    """Half-open pixel window [row0, row1) x [col0, col1)"""
+    row0: int
+    col0: int
+    row1: int
+    col1: int
+
+    @property
+    def shape(self):
+        return self.row1 - self.row0, self.col1 - self.col0
+
+    @property
+    def slices(self):
+        return slice(self.row0, self.row1), slice(self.col0, self.col1)
+
+    @property
+    def empty(self):
+        return self.row1 <= self.row0 or self.col1 <= self.col0
+
+
+@dataclass(frozen=True)
+class TileGrid:
+    """Georeferencing of one tile: north-west corner, pixel size and shape"""
+    west: float
+    north: float
+    pixel: float = PIXEL_DEGREES
+    width: int = TILE_SIZE
+    height: int = TILE_SIZE
+
+    @classmethod
+    def from_hv(cls, h, v):
+        return cls(west=-180.0 + h * TILE_DEGREES, north=90.0 - v * TILE_DEGREES)
+
+    @property
+    def hv(self):
+        """(h, v) of a standard Black Marble tile, else None"""
+        h, v = (self.west + 180.0) / TILE_DEGREES, (90.0 - self.north) / TILE_DEGREES
+        if self.width != TILE_SIZE or not (h.is_integer() and v.is_integer()):
+            return None
+        return int(h), int(v)
+
+    @property
+    def bounds(self):
+        """(west, south, east, north)"""
+        return (self.west, self.north - self.height * self.pixel,
+                self.west + self.width * self.pixel, self.north)
+
+    def window(self, bbox):
+        """Window of every pixel touching ``bbox`` (west, south, east, north),
+        clipped to the tile; empty if they do not overlap"""
+        west, south, east, north = bbox
+        # Tolerance so edges that fall on pixel boundaries do not pick up a
+        # neighbouring pixel through rounding error
+        col0 = int(np.floor((west - self.west) / self.pixel + 1e-9))
+        col1 = int(np.ceil((east - self.west) / self.pixel - 1e-9))
+        row0 = int(np.floor((self.north - north) / self.pixel + 1e-9))
+        row1 = int(np.ceil((self.north - south) / self.pixel - 1e-9))
+        return Window(min(max(row0, 0), self.height), min(max(col0, 0), self.width),
+                      min(max(row1, 0), self.height), min(max(col1, 0), self.width))
+
+    def window_bounds(self, window):
+        return (self.west + window.col0 * self.pixel, self.north - window.row1 * self.pixel,
+                self.west + window.col1 * self.pixel, self.north - window.row0 * self.pixel)
+
+    def pixel_centres(self, window=None):
+        """Longitudes of the window's columns and latitudes of its rows"""
+        window = window or Window(0, 0, self.height, self.width)
+        lon = self.west + (np.arange(window.col0, window.col1) + 0.5) * self.pixel
+        lat = self.north - (np.arange(window.row0, window.row1) + 0.5) * self.pixel
+        return lon, lat
+
+
+def tiles_for_bbox(bbox):
+    """(h, v) of every standard tile overlapping ``bbox``"""
+    west, south, east, north = bbox
+    h0, h1 = int((west + 180.0) // TILE_DEGREES), int(np.ceil((east + 180.0) / TILE_DEGREES))
+    v0, v1 = int((90.0 - north) // TILE_DEGREES), int(np.ceil((90.0 - south) / TILE_DEGREES))
+    return [(h, v) for v in range(max(v0, 0), min(v1, 18)) for h in range(max(h0, 0), min(h1, 36))]
+
+
+@dataclass(frozen=True)
+class Granule:
+    path: Path
+    date: date
+    h: Optional[int]
+    v: Optional[int]
+
+
+def parse_granule(path):
+    """Acquisition date and tile of a granule file name, or None"""
+    path = Path(path)
+    match = GRANULE_PATTERN.search(path.name)
+    if not match:
+        return None
+    day = date(int(match['year']), 1, 1) + timedelta(days=int(match['doy']) - 1)
+    h = int(match['h']) if match['h'] else None
+    v = int(match['v']) if match['v'] else None
+    return Granule(path, day, h, v)
+
+
+def find_granules(directory, bbox=None, start=None, end=None):
+    """Granules under ``directory`` sorted by (date, h, v), optionally
+    restricted to tiles overlapping ``bbox`` and dates in [start, end]"""
+    wanted = set(tiles_for_bbox(bbox)) if bbox is not None else None
+    granules = []
+    for path in Path(directory).glob('*.h5'):
+        granule = parse_granule(path)
+        if granule is None:
+            continue
+        if start is not None and granule.date < start or end is not None and granule.date > end:
+            continue
+        if wanted is not None and granule.h is not None and (granule.h, granule.v) not in wanted:
+            continue
+        granules.append(granule)
+    return sorted(granules, key=lambda g: (g.date, g.h or 0, g.v or 0))
+
+
+def _normalise(name):
+    return re.sub(r'[\s\-]', '_', name).lower()
+
+
+def to_radiance(raw, fill=FILL_VALUE, scale=SCALE_FACTOR, offset=0.0):
+    """Scaled float32 radiance with NaN where ``raw`` is the fill value"""
+    out = raw.astype(np.float32)
+    out *= np.float32(scale)
+    if offset:
+        out += np.float32(offset)
+    if fill is not None:
+        out[raw == fill] = np.nan
+    return out
+
+
+class _Tile:
+    """Shared window/bbox logic; subclasses provide _open, _read and encoding"""
+
+    radiance_layers = RADIANCE_LAYERS
+
+    def __init__(self, path, grid=None):
+        self.path = Path(path)
+        granule = parse_granule(self.path)
+        self.date = granule.date if granule else None
+        if grid is None and granule is not None and granule.h is not None:
+            grid = TileGrid.from_hv(granule.h, granule.v)
+        self._grid = grid
+        self._handle = None
+
+    @property
+    def grid(self):
+        if self._grid is None:
+            raise ValueError(f'{self.path.name}: no tile id in the file name; pass grid=')
+        return self._grid
+
+    @property
+    def handle(self):
+        if self._handle is None:
+            self._handle = self._open()
+        return self._handle
+
+    def raw(self, layer=None, window=None):
+        """Stored values of ``layer`` (default: the radiance layer) in ``window``"""
+        window = window or Window(0, 0, self.grid.height, self.grid.width)
+        return self._read(layer, window)
+
+    def has_layer(self, layer):
+        return False
+
+    def radiance(self, window=None, layer=None, qa=None):
+        """Scaled radiance in ``window`` as float32, NaN for fill pixels and,
+        with a QaPolicy ``qa``, for pixels its flags reject"""
+        window = window or Window(0, 0, self.grid.height, self.grid.width)
+        radiance = to_radiance(self.raw(layer, window), *self.encoding(layer))
+        if qa is not None:
+            qa.apply(self, window, radiance)
+        return radiance
+
+    def read_bbox(self, bbox, layer=None, scaled=True, qa=None):
+        """(window, array) covering ``bbox``; the array is empty if the bbox
+        misses the tile"""
+        window = self.grid.window(bbox)
+        if window.empty:
+            return window, np.empty((0, 0), np.float32 if scaled else np.uint16)
+        if scaled:
+            return window, self.radiance(window, layer, qa)
+        return window, self.raw(layer, window)
+
+    def close(self):
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class H5Tile(_Tile):
+    """Lazy reader for a VNP46A1/VNP46A2 HDF5 granule"""
+
+    def __init__(self, path, grid=None):
+        if h5py is None:
+            raise ImportError('reading HDF5 granules requires h5py')
+        super().__init__(path, grid)
+        self._datasets = None
+        self._maps = {}
+
+    def _open(self):
+        return h5py.File(self.path, 'r')
+
+    @property
+    def layers(self):
+        """Normalised leaf name -> dataset path of every 2-D layer"""
+        if self._datasets is None:
+            found = {}
+
+            def visit(name, obj):
+                if isinstance(obj, h5py.Dataset) and obj.ndim == 2:
+                    found.setdefault(_normalise(name.rsplit('/', 1)[-1]), name)
+
+            self.handle.visititems(visit)
+            self._datasets = found
+        return self._datasets
+
+    def has_layer(self, layer):
+        return _normalise(layer) in self.layers
+
+    def dataset(self, layer=None):
+        names = self.radiance_layers if layer is None else (layer,)
+        for name in names:
+            path = self.layers.get(_normalise(name))
+            if path is not None:
+                return self.handle[path]
+        raise KeyError(f'{self.path.name}: no layer {" / ".join(names)}')
+
+    def _mapped(self, ds):
+        """Memory map of a contiguous, unfiltered dataset, else None"""
+        if ds.name not in self._maps:
+            offset = ds.id.get_offset() if ds.chunks is None and not ds.compression else None
+            self._maps[ds.name] = (None if offset is None else np.memmap(
+                self.path, dtype=ds.dtype, mode='r', offset=offset, shape=ds.shape))
+        return self._maps[ds.name]
+
+    def _read(self, layer, window):
+        ds = self.dataset(layer)
+        mapped = self._mapped(ds)
+        if mapped is not None:
+            return mapped[window.slices]
+        # Chunked/compressed: decode only the chunks under the window
+        out = np.empty(window.shape, dtype=ds.dtype)
+        if not window.empty:
+            ds.read_direct(out, source_sel=window.slices)
+        return out
+
+    def encoding(self, layer=None):
+        """(fill, scale, offset) of ``layer`` from its CF attributes"""
+        attrs = self.dataset(layer).attrs
+
+        def attr(key, default):
+            value = attrs.get(key)
+            return default if value is None else np.ravel(value)[0].item()
+
+        return (attr('_FillValue', FILL_VALUE), attr('scale_factor', SCALE_FACTOR),
+                attr('add_offset', 0.0))
+
+    def close(self):
+        self._maps.clear()
+        self._datasets = None
+        super().close()
+
+
+class CogTile(_Tile):
+    """Windowed reader for the single-band radiance.tif COGs (needs rasterio)"""
+
+    def __init__(self, path, grid=None):
+        if rasterio is None:
+            raise ImportError('reading GeoTIFF tiles requires rasterio')
+        super().__init__(path, grid)
+
+    def _open(self):
+        src = rasterio.open(self.path)
+        if self._grid is None:
+            t = src.transform
+            self._grid = TileGrid(west=t.c, north=t.f, pixel=t.a, width=src.width, height=src.height)
+        return src
+
+    @property
+    def grid(self):
+        if self._grid is None:
+            self.handle  # opening reads the grid from the GeoTIFF transform
+        return self._grid
+
+    def _read(self, layer, window):
+        if layer is not None:
+            raise KeyError(f'{self.path.name}: single-band GeoTIFF has no layer {layer}')
+        return self.handle.read(1, window=RioWindow(window.col0, window.row0, *window.shape[::-1]))
+
+    def encoding(self, layer=None):
+        src = self.handle
+        # gdal_translate carries the HDF5 attributes over as band metadata,
+        # prefixed with the layer path
+        tags = src.tags(1)
+
+        def tag(suffix, default):
+            values = [v for k, v in tags.items() if k.lower().endswith(suffix)]
+            return float(values[0]) if values else default
+
+        scale = tag('scale_factor', src.scales[0] if src.scales[0] != 1 else SCALE_FACTOR)
+        fill = src.nodata if src.nodata is not None else tag('_fillvalue', FILL_VALUE)
+        return fill, scale, tag('add_offset', src.offsets[0])
+
+
+def open_tile(path, grid=None):
+    """Lazy tile reader for an .h5 granule or a GeoTIFF"""
+    suffix = Path(path).suffix.lower()
+    if suffix in ('.h5', '.he5', '.hdf5'):
+        return H5Tile(path, grid)
+    if suffix in ('.tif', '.tiff'):
+        return CogTile(path, grid)
+    raise ValueError(f'unsupported tile format: {path}')
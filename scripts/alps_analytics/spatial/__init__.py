@@ -0,0 +1,23 @@
+"""
+Spatial statistics over districts and hotspot points
+"""
+
+from .autocorrelation import LisaResult, MoranResult, lisa, moran
+from .geometry import DistrictGeometries, from_features, load_districts, project_km
+from .hotspots import COLD, HOT, GiStarResult, daily_gi_star, fdr_mask, gi_star
+from .polygon import INDIA_OUTLINE, PolygonIndex
+from .variogram import (EmpiricalVariogram, VariogramModel, empirical_variogram,
+                        fit_models, fit_variogram)
+from .weights import (SpatialWeights, bbox_candidates, build_weights, contiguity_weights,
+                      distance_band_weights, knn_weights, row_standardise)
+
+__all__ = [
+    'LisaResult', 'MoranResult', 'lisa', 'moran',
+    'DistrictGeometries', 'from_features', 'load_districts', 'project_km',
+    'COLD', 'HOT', 'GiStarResult', 'daily_gi_star', 'fdr_mask', 'gi_star',
+    'INDIA_OUTLINE', 'PolygonIndex',
+    'EmpiricalVariogram', 'VariogramModel', 'empirical_variogram', 'fit_models',
+    'fit_variogram',
+    'SpatialWeights', 'bbox_candidates', 'build_weights', 'contiguity_weights',
+    'distance_band_weights', 'knn_weights', 'row_standardise',
+]
@@ -0,0 +1,132 @@
+"""
+District geometries in flat NumPy form
+Polygons from District.geomGeoJSON (exported as districts.geojson) are stored
+as one vertex array plus ring offsets, so spatial code can work on whole
+arrays instead of per-feature Python objects
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+# Kilometres per degree (equirectangular approximation around India)
+KM_PER_DEG_LAT = 110.574
+KM_PER_DEG_LON_EQUATOR = 111.320
+
+
+@dataclass
+class DistrictGeometries:
+    """All district rings packed into flat arrays.
+
+    ``vertices[ring_offsets[r]:ring_offsets[r + 1]]`` is ring ``r`` (closed,
+    lon/lat), owned by district ``ring_owner[r]``; ``ring_is_hole`` marks
+    interior rings. ``bbox`` rows are [west, south, east, north].
+    """
+    codes: np.ndarray
+    vertices: np.ndarray
+    ring_offsets: np.ndarray
+    ring_owner: np.ndarray
+    ring_is_hole: np.ndarray
+    bbox: np.ndarray
+
+    def __len__(self):
+        return len(self.codes)
+
+    @property
+    def vertex_owner(self):
+        """District index of every vertex"""
+        return np.repeat(self.ring_owner, np.diff(self.ring_offsets))
+
+    def digest(self):
+        """Content hash of codes and geometry (cache key for derived products)"""
+        h = hashlib.sha256()
+        h.update('\n'.join(self.codes.tolist()).encode())
+        for arr in (self.vertices, self.ring_offsets, self.ring_owner, self.ring_is_hole):
+            h.update(np.ascontiguousarray(arr).tobytes())
+        return h.hexdigest()
+
+    def centroids(self):
+        """Area-weighted centroids (lon/lat) from the shoelace formula"""
+        x, y = self.vertices[:, 0], self.vertices[:, 1]
+        # Edge terms; the segment crossing from one ring to the next is masked out
+        cross = x[:-1] * y[1:] - x[1:] * y[:-1]
+        ring_of_edge = np.repeat(np.arange(len(self.ring_owner)), np.diff(self.ring_offsets))[:-1]
+        same_ring = ring_of_edge == np.repeat(np.arange(len(self.ring_owner)),
+                                              np.diff(self.ring_offsets))[1:]
+        cross = np.where(same_ring, cross, 0.0)
+
+        a = np.bincount(ring_of_edge, cross, minlength=len(self.ring_owner)) / 2
+        cx = np.bincount(ring_of_edge, (x[:-1] + x[1:]) * cross, minlength=len(a)) / 6
+        cy = np.bincount(ring_of_edge, (y[:-1] + y[1:]) * cross, minlength=len(a)) / 6
+        # Holes subtract area regardless of the ring's winding order
+        sign = np.where(self.ring_is_hole, -1.0, 1.0) * np.sign(a)
+        area = np.bincount(self.ring_owner, sign * a, minlength=len(self))
+        mx = np.bincount(self.ring_owner, sign * cx, minlength=len(self))
+        my = np.bincount(self.ring_owner, sign * cy, minlength=len(self))
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            centroid = np.column_stack([mx / area, my / area])
+        # Degenerate polygons fall back to their bbox centre
+        bad = ~np.isfinite(centroid).all(axis=1)
+        centroid[bad] = np.column_stack([(self.bbox[bad, 0] + self.bbox[bad, 2]) / 2,
+                                         (self.bbox[bad, 1] + self.bbox[bad, 3]) / 2])
+        return centroid
+
+
+def project_km(lonlat, lat0=None):
+    """Equirectangular projection of lon/lat degrees to planar kilometres"""
+    lonlat = np.asarray(lonlat, dtype=np.float64)
+    if lat0 is None:
+        lat0 = np.nanmean(lonlat[:, 1])
+    return np.column_stack([
+        lonlat[:, 0] * KM_PER_DEG_LON_EQUATOR * np.cos(np.radians(lat0)),
+        lonlat[:, 1] * KM_PER_DEG_LAT,
+    ])
+
+
+def _polygons(geometry):
+    if geometry['type'] == 'Polygon':
+        return [geometry['coordinates']]
+    if geometry['type'] == 'MultiPolygon':
+        return geometry['coordinates']
+    raise ValueError(f"unsupported geometry type {geometry['type']}")
+
+
+def from_features(features):
+    """Pack GeoJSON features (with a ``code`` property) into DistrictGeometries"""
+    codes, rings, owner, is_hole, bbox = [], [], [], [], []
+    for i, feature in enumerate(features):
+        geometry = feature['geometry']
+        if isinstance(geometry, str):  # geomGeoJSON is stored as a string
+            geometry = json.loads(geometry)
+        if geometry.get('type') == 'Feature':
+            geometry = geometry['geometry']
+        codes.append(feature['properties']['code'])
+        start = len(rings)
+        for polygon in _polygons(geometry):
+            for r, ring in enumerate(polygon):
+                rings.append(np.asarray(ring, dtype=np.float64)[:, :2])
+                owner.append(i)
+                is_hole.append(r > 0)
+        pts = np.concatenate(rings[start:])
+        bbox.append([pts[:, 0].min(), pts[:, 1].min(), pts[:, 0].max(), pts[:, 1].max()])
+
+    lengths = np.array([len(r) for r in rings])
+    return DistrictGeometries(
+        codes=np.array(codes),
+        vertices=np.concatenate(rings) if rings else np.empty((0, 2)),
+        ring_offsets=np.concatenate([[0], np.cumsum(lengths)]).astype(np.int64),
+        ring_owner=np.array(owner, dtype=np.int64),
+        ring_is_hole=np.array(is_hole, dtype=bool),
+        bbox=np.array(bbox, dtype=np.float64).reshape(-1, 4),
+    )
+
+
+def load_districts(path):
+    """Read districts.geojson (written by scripts/export_paper_data.ts)"""
+    with open(Path(path)) as f:
+        collection = json.load(f)
+    return from_features(collection['features'])
@@ -0,0 +1,154 @@
+"""
+Vectorised point-in-polygon tests
+Polygon edges are indexed once into horizontal bands; each point is ray-cast
+(even-odd rule) only against the edges of its band, in array chunks, so
+millions of hotspot or pixel coordinates can be tested against the national
+outline or all district polygons without a Python loop per point.
+"""
+
+import numpy as np
+
+# Simplified India outline (lon, lat) shared by the figure scripts
+INDIA_OUTLINE = np.array([
+    [70, 35], [71, 33], [73, 31], [75, 30], [77, 29], [80, 28], [83, 27], [86, 26],
+    [88, 25], [92, 24], [95, 23], [97, 22], [97, 20], [95, 18], [93, 16], [90, 14],
+    [88, 12], [85, 10], [83, 9], [80, 8], [77, 8], [75, 9], [73, 10], [72, 12],
+    [71, 15], [70, 20], [68, 25], [68, 30], [69, 33], [70, 35],
+], dtype=np.float64)
+
+# Upper bound on (points x edges) cells evaluated per array operation
+CHUNK_CELLS = 1 << 22
+
+# Rejection batches sample() draws before giving up on a window with
+# (almost) no polygon area
+SAMPLE_ATTEMPTS = 1000
+
+
+class PolygonIndex:
+    """Band index over the edges of one or more polygons.
+
+    ``vertices``/``ring_offsets``/``ring_owner`` follow DistrictGeometries:
+    rings are consecutive slices of ``vertices`` and ``ring_owner`` names the
+    polygon each ring belongs to. Holes and multi-part polygons are handled
+    by the even-odd rule over all rings of a polygon.
+    """
+
+    def __init__(self, vertices, ring_offsets, ring_owner, n_bands=None):
+        vertices = np.asarray(vertices, dtype=np.float64)
+        ring_offsets = np.asarray(ring_offsets, dtype=np.int64)
+        ring_owner = np.asarray(ring_owner, dtype=np.int64)
+        self.n_polygons = int(ring_owner.max()) + 1 if len(ring_owner) else 0
+
+        # Edges i -> i+1 within each ring; horizontal edges never cross a ray
+        ring = np.repeat(np.arange(len(ring_owner)), np.diff(ring_offsets))
+        same = ring[:-1] == ring[1:]
+        a, b = vertices[:-1][same], vertices[1:][same]
+        keep = a[:, 1] != b[:, 1]
+        a, b = a[keep], b[keep]
+        self.x0, self.y0 = a[:, 0], a[:, 1]
+        self.slope = (b[:, 0] - a[:, 0]) / (b[:, 1] - a[:, 1])
+        self.ylo, self.yhi = np.minimum(a[:, 1], b[:, 1]), np.maximum(a[:, 1], b[:, 1])
+        self.owner = ring_owner[ring[:-1][same][keep]]
+        self.bbox = np.array([vertices[:, 0].min(), vertices[:, 1].min(),
+                              vertices[:, 0].max(), vertices[:, 1].max()])
+
+        # Band index: CSR lists of the edges spanning each horizontal band
+        n_edges = len(self.owner)
+        self.n_bands = int(n_bands or np.clip(n_edges // 2, 1, 8192))
+        self.band_height = (self.bbox[3] - self.bbox[1]) / self.n_bands or 1.0
+        first = self._band(self.ylo)
+        last = self._band(self.yhi)
+        spans = last - first + 1
+        edge_ids = np.repeat(np.arange(n_edges), spans)
+        bands = np.repeat(first - np.cumsum(spans) + spans, spans) + np.arange(spans.sum())
+        order = np.argsort(bands, kind='stable')
+        self.band_edges = edge_ids[order]
+        self.band_ptr = np.searchsorted(bands[order], np.arange(self.n_bands + 1))
+
+    @classmethod
+    def from_ring(cls, ring, **kwargs):
+        """Index for a single closed ring of (x, y) vertices"""
+        ring = np.asarray(ring, dtype=np.float64)
+        return cls(ring, [0, len(ring)], [0], **kwargs)
+
+    @classmethod
+    def from_geometries(cls, geoms, **kwargs):
+        """Index over all districts of a DistrictGeometries (owner = district index)"""
+        return cls(geoms.vertices, geoms.ring_offsets, geoms.ring_owner, **kwargs)
+
+    def _band(self, y):
+        band = np.floor((np.asarray(y) - self.bbox[1]) / self.band_height).astype(np.int64)
+        return np.clip(band, 0, self.n_bands - 1)
+
+    def locate(self, x, y):
+        """Index of the polygon containing each point, or -1 (same shape as x)"""
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        shape = x.shape
+        x, y = x.ravel(), y.ravel()
+        result = np.full(len(x), -1, dtype=np.int64)
+
+        inside_bbox = ((x >= self.bbox[0]) & (x <= self.bbox[2]) &
+                       (y >= self.bbox[1]) & (y <= self.bbox[3]))
+        candidates = np.flatnonzero(inside_bbox)
+        band = self._band(y[candidates])
+        order = np.argsort(band, kind='stable')
+        candidates, band = candidates[order], band[order]
+        bounds = np.searchsorted(band, np.arange(self.n_bands + 1))
+
+        for b in np.flatnonzero(np.diff(bounds)):
+            edges = self.band_edges[self.band_ptr[b]:self.band_ptr[b + 1]]
+            if not len(edges):
+                continue
+            owners, local = np.unique(self.owner[edges], return_inverse=True)
+            step = max(1, CHUNK_CELLS // len(edges))
+            for start in range(bounds[b], bounds[b + 1], step):
+                idx = candidates[start:min(start + step, bounds[b + 1])]
+                result[idx] = self._cast(x[idx], y[idx], edges, owners, local)
+        return result.reshape(shape)
+
+    def _cast(self, px, py, edges, owners, local):
+        py_col = py[:, None]
+        # Half-open y test so a ray through a vertex counts it once
+        spans = (self.ylo[edges] <= py_col) & (py_col < self.yhi[edges])
+        x_cross = self.x0[edges] + (py_col - self.y0[edges]) * self.slope[edges]
+        crossing = spans & (px[:, None] < x_cross)
+        if len(owners) == 1:
+            odd = crossing.sum(axis=1) % 2 == 1
+            return np.where(odd, owners[0], -1)
+        # Crossings per (point, polygon) as one product with the owner one-hot
+        counts = crossing.astype(np.float32) @ np.eye(len(owners), dtype=np.float32)[local]
+        odd = counts.astype(np.int64) % 2 == 1
+        return np.where(odd.any(axis=1), owners[np.argmax(odd, axis=1)], -1)
+
+    def contains(self, x, y):
+        """True where a point lies inside any indexed polygon"""
+        return self.locate(x, y) >= 0
+
+    def sample(self, n, rng, bounds=None):
+        """``n`` uniform random points inside the polygons (vectorised rejection).
+
+        ``bounds`` ([west, south, east, north]) restricts the draw to a window.
+        Raises ValueError when the window misses the polygons' bounding box or
+        SAMPLE_ATTEMPTS batches still fall short of ``n`` points.
+        """
+        west, south, east, north = self.bbox if bounds is None else bounds
+        if (west > self.bbox[2] or east < self.bbox[0] or
+                south > self.bbox[3] or north < self.bbox[1]):
+            raise ValueError(f'bounds {[west, south, east, north]} do not overlap the '
+                             f'polygons (bbox {self.bbox.tolist()})')
+        xs, ys = [np.empty(0)], [np.empty(0)]
+        found = attempts = 0
+        while found < n:
+            if attempts == SAMPLE_ATTEMPTS:
+                raise ValueError(f'found {found} of {n} points inside the polygons within '
+                                 f'bounds {[west, south, east, north]} after {attempts} batches')
+            attempts += 1
+            batch = max(2 * (n - found), 64)
+            x = rng.uniform(west, east, batch)
+            y = rng.uniform(south, north, batch)
+            keep = self.contains(x, y)
+            xs.append(x[keep])
+            ys.append(y[keep])
+            found += keep.sum()
+        return np.concatenate(xs)[:n], np.concatenate(ys)[:n]
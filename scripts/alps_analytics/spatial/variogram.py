@@ -0,0 +1,265 @@
+"""
+Empirical semivariogram and model fitting
+Point pairs within the maximum lag are enumerated with a KD-tree (or, for
+very large point sets, streamed tile by tile in bounded memory), so the cost
+follows the number of pairs within ``max_lag`` rather than n^2, and per-bin
+sums are accumulated with bincount. Per-bin errors come from a
+delete-one-block jackknife over spatial blocks of the points. Models use the
+practical range (the distance where ~95% of the sill is reached) so their
+ranges compare.
+"""
+
+import warnings
+from dataclasses import dataclass
+
+import numpy as np
+from scipy import stats
+from scipy.optimize import OptimizeWarning, curve_fit
+from scipy.spatial import cKDTree
+
+# Spatially compact point blocks (Z-order runs) left out in turn by the
+# jackknife behind EmpiricalVariogram.stderr
+JACKKNIFE_BLOCKS = 32
+
+# Populated lag bins needed to fit a model's three parameters
+MIN_FIT_BINS = 3
+
+
+def spherical(h, nugget, sill, range_):
+    h = np.asarray(h, dtype=np.float64)
+    r = np.minimum(h / range_, 1.0)
+    return np.where(h > 0, nugget + (sill - nugget) * (1.5 * r - 0.5 * r ** 3), 0.0)
+
+
+def exponential(h, nugget, sill, range_):
+    h = np.asarray(h, dtype=np.float64)
+    return np.where(h > 0, nugget + (sill - nugget) * (1 - np.exp(-3 * h / range_)), 0.0)
+
+
+def gaussian(h, nugget, sill, range_):
+    h = np.asarray(h, dtype=np.float64)
+    return np.where(h > 0, nugget + (sill - nugget) * (1 - np.exp(-3 * (h / range_) ** 2)), 0.0)
+
+
+MODELS = {'spherical': spherical, 'exponential': exponential, 'gaussian': gaussian}
+
+
+@dataclass
+class EmpiricalVariogram:
+    bin_edges: np.ndarray
+    lags: np.ndarray        # mean pair distance per bin (bin centre if empty)
+    gamma: np.ndarray       # semivariance per bin (NaN if empty)
+    counts: np.ndarray      # number of pairs per bin
+    stderr: np.ndarray      # block-jackknife standard error of gamma per bin (NaN if < 2 blocks)
+    sample_fraction: float = 1.0
+    blocks: int = 0         # jackknife blocks behind stderr
+
+    @classmethod
+    def from_sums(cls, bin_edges, sums, block_sums, sample_fraction=1.0):
+        """Finalise accumulated per-bin and per-block sums (see ``_accumulate``)"""
+        counts, dist, half_sq = sums
+        centres = (bin_edges[:-1] + bin_edges[1:]) / 2
+        with np.errstate(invalid='ignore', divide='ignore'):
+            lags = np.where(counts > 0, dist / counts, centres)
+            gamma = np.where(counts > 0, half_sq / counts, np.nan)
+            # gamma with every pair touching block g removed, per block and bin
+            left = counts - block_sums[0]
+            leave_out = np.where(left > 0, (half_sq - block_sums[1]) / left, np.nan)
+        valid = left > 0
+        n = valid.sum(axis=0)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = np.where(valid, leave_out, 0.0).sum(axis=0) / n
+            spread = (np.where(valid, leave_out - mean, 0.0) ** 2).sum(axis=0)
+            stderr = np.where(n > 1, np.sqrt((n - 1) / n * spread), np.nan)
+        return cls(bin_edges, lags, gamma, counts.astype(np.int64), stderr, sample_fraction,
+                   block_sums.shape[1])
+
+    def confidence_interval(self, level=0.95):
+        """(low, high) per bin: gamma -/+ the Student t quantile with
+        ``blocks`` - 1 degrees of freedom times ``stderr``"""
+        t = stats.t.ppf(0.5 + level / 2, max(self.blocks - 1, 1))
+        return self.gamma - t * self.stderr, self.gamma + t * self.stderr
+
+
+@dataclass
+class VariogramModel:
+    name: str
+    nugget: float
+    sill: float
+    range: float
+    wsse: float             # pair-count weighted sum of squared residuals
+
+    def __call__(self, h):
+        return MODELS[self.name](h, self.nugget, self.sill, self.range)
+
+
+def _accumulate(sums, block_sums, coords, values, block, i, j, max_lag, n_lags):
+    """Add pairs (i, j) to the per-bin [count, sum d, sum sq/2] arrays and to
+    the per-block [count, sum sq/2] arrays of the blocks each pair touches"""
+    dist = np.hypot(*(coords[i] - coords[j]).T)
+    keep = dist <= max_lag
+    i, j, dist = i[keep], j[keep], dist[keep]
+    half = (values[i] - values[j]) ** 2 / 2
+    b = np.minimum((dist * (n_lags / max_lag)).astype(np.int64), n_lags - 1)
+    sums[0] += np.bincount(b, minlength=n_lags)
+    sums[1] += np.bincount(b, dist, minlength=n_lags)
+    sums[2] += np.bincount(b, half, minlength=n_lags)
+
+    # A pair within one block counts against it once
+    n_blocks = block_sums.shape[1]
+    bi, bj = block[i], block[j]
+    across = bi != bj
+    key = np.concatenate([bi * n_lags + b, (bj * n_lags + b)[across]])
+    size = n_blocks * n_lags
+    block_sums[0] += np.bincount(key, minlength=size).reshape(n_blocks, n_lags)
+    block_sums[1] += np.bincount(key, np.concatenate([half, half[across]]),
+                                 minlength=size).reshape(n_blocks, n_lags)
+
+
+def _blocks(coords, n_blocks):
+    """Block id per point: ``n_blocks`` equal runs along the Z-order curve"""
+    n = len(coords)
+    n_blocks = max(min(n_blocks, n), 1)
+    block = np.empty(n, dtype=np.int64)
+    block[np.argsort(_morton(coords), kind='stable')] = np.arange(n) * n_blocks // max(n, 1)
+    return block, n_blocks
+
+
+def _morton(coords):
+    """Z-order key of coordinates quantised to a 2^16 grid"""
+    span = np.ptp(coords, axis=0)
+    q = ((coords - coords.min(axis=0)) / np.where(span > 0, span, 1) * 65535).astype(np.uint64)
+
+    def spread(v):
+        v = (v | (v << 8)) & 0x00FF00FF
+        v = (v | (v << 4)) & 0x0F0F0F0F
+        v = (v | (v << 2)) & 0x33333333
+        return (v | (v << 1)) & 0x55555555
+
+    return spread(q[:, 0]) | (spread(q[:, 1]) << np.uint64(1))
+
+
+def _tiles(coords, max_lag, tile_size):
+    """Z-ordered tile slices and a generator of the tile pairs within ``max_lag``.
+
+    Bounding-box gaps are computed one tile row at a time against the later
+    tiles, so finding the pairs takes O(tiles) memory rather than a dense
+    tiles x tiles matrix.
+    """
+    order = np.argsort(_morton(coords), kind='stable')
+    starts = np.arange(0, len(order), tile_size)
+    lo = np.minimum.reduceat(coords[order], starts)
+    hi = np.maximum.reduceat(coords[order], starts)
+    slices = [order[s:s + tile_size] for s in starts]
+
+    def pairs():
+        for a in range(len(starts)):
+            # Gap between tile bounding boxes; tiles further apart than max_lag share no pairs
+            gap = np.maximum(0, np.maximum(lo[a:] - hi[a], lo[a] - hi[a:]))
+            for b in np.flatnonzero(np.hypot(gap[:, 0], gap[:, 1]) <= max_lag):
+                yield a, a + int(b)
+
+    return slices, pairs()
+
+
+def empirical_variogram(coords, values, max_lag, n_lags=20, tile_size=None,
+                        sample=None, seed=None):
+    """Matheron estimator over planar ``coords`` (e.g. project_km output).
+
+    gamma(h) = sum (z_i - z_j)^2 / (2 N(h)) over pairs with distance in each
+    of ``n_lags`` equal bins up to ``max_lag``.
+
+    By default all pairs within ``max_lag`` are enumerated at once with a
+    KD-tree. With ``tile_size`` points are sorted along a Z-order curve into
+    tiles and only tile pairs whose bounding boxes lie within ``max_lag`` are
+    compared, one pair of tiles at a time, accumulating per-bin sums; beyond
+    the O(n) point arrays, peak memory is then bounded by tile_size^2 pairs
+    plus one row of tile-box gaps however many points there are.
+
+    ``sample`` (an int count or a fraction) draws a random subset of points
+    first. gamma stays unbiased and pair counts shrink by roughly the squared
+    sampling fraction.
+
+    ``stderr`` is a delete-one-block jackknife: points are split into
+    JACKKNIFE_BLOCKS runs along the Z-order curve, gamma is recomputed with
+    each block's pairs left out, and the spread of those estimates gives the
+    error. Unlike a per-pair sd / sqrt(N) it allows for pairs sharing points
+    and for spatial correlation up to the block size. It is still an
+    estimate: ``confidence_interval`` gives approximate t intervals, which
+    are too narrow where correlation reaches well beyond one block.
+    """
+    coords = np.asarray(coords, dtype=np.float64)
+    values = np.asarray(values, dtype=np.float64)
+    ok = np.isfinite(values) & np.isfinite(coords).all(axis=1)
+    coords, values = coords[ok], values[ok]
+
+    fraction = 1.0
+    if sample is not None:
+        m = int(round(sample * len(values))) if isinstance(sample, float) else int(sample)
+        if m < len(values):
+            idx = np.random.default_rng(seed).choice(len(values), size=m, replace=False)
+            fraction = m / len(values)
+            coords, values = coords[idx], values[idx]
+
+    edges = np.linspace(0.0, max_lag, n_lags + 1)
+    sums = np.zeros((3, n_lags))
+    block, n_blocks = _blocks(coords, JACKKNIFE_BLOCKS)
+    block_sums = np.zeros((2, n_blocks, n_lags))
+
+    if tile_size is None:
+        pairs = cKDTree(coords).query_pairs(max_lag, output_type='ndarray')
+        _accumulate(sums, block_sums, coords, values, block, pairs[:, 0], pairs[:, 1],
+                    max_lag, n_lags)
+        return EmpiricalVariogram.from_sums(edges, sums, block_sums, fraction)
+
+    slices, tile_pairs = _tiles(coords, max_lag, tile_size)
+    trees = {}
+    for a, b in tile_pairs:
+        for t in (a, b):
+            if t not in trees:
+                trees[t] = cKDTree(coords[slices[t]])
+        if a == b:
+            pairs = trees[a].query_pairs(max_lag, output_type='ndarray')
+            i, j = slices[a][pairs[:, 0]], slices[a][pairs[:, 1]]
+        else:
+            pairs = trees[a].sparse_distance_matrix(trees[b], max_lag, output_type='ndarray')
+            i, j = slices[a][pairs['i']], slices[b][pairs['j']]
+        _accumulate(sums, block_sums, coords, values, block, i, j, max_lag, n_lags)
+        # Tile pairs come in row order, so trees of earlier rows are done
+        for t in [t for t in trees if t < a]:
+            del trees[t]
+    return EmpiricalVariogram.from_sums(edges, sums, block_sums, fraction)
+
+
+def fit_variogram(ev, model='spherical'):
+    """Weighted least-squares fit of one model (bins weighted by pair count).
+
+    Returns None when fewer than MIN_FIT_BINS bins hold pairs, e.g. when
+    few points lie within ``max_lag`` of each other, or when the fit does
+    not converge.
+    """
+    ok = ev.counts > 0
+    if ok.sum() < MIN_FIT_BINS:
+        return None
+    h, g, n = ev.lags[ok], ev.gamma[ok], ev.counts[ok]
+    max_lag = ev.bin_edges[-1]
+    p0 = [max(g.min(), 0.0), g.max(), max_lag / 2]
+    bounds = ([0.0, 0.0, 1e-9], [np.inf, np.inf, 2 * max_lag])
+    try:
+        with warnings.catch_warnings():
+            # Degenerate bins leave the covariance undefined; it is not used
+            warnings.simplefilter('ignore', OptimizeWarning)
+            params, _ = curve_fit(MODELS[model], h, g, p0=p0, sigma=1 / np.sqrt(n),
+                                  bounds=bounds, maxfev=10000)
+    except RuntimeError:
+        # maxfev reached without convergence
+        return None
+    wsse = float((n * (MODELS[model](h, *params) - g) ** 2).sum())
+    return VariogramModel(model, *map(float, params), wsse=wsse)
+
+
+def fit_models(ev, models=tuple(MODELS)):
+    """Fit every model; returns those that could be fitted sorted best
+    (lowest weighted SSE) first, an empty list when none could"""
+    fits = [fit_variogram(ev, m) for m in models]
+    return sorted((f for f in fits if f is not None), key=lambda m: m.wsse)
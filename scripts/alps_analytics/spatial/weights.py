@@ -0,0 +1,206 @@
+"""
+Spatial weights as CSR sparse matrices
+Row i holds the weights of district i's neighbours; self-weights are zero.
+build_weights() derives contiguity, kNN or distance-band weights from the
+district geometries and caches the result on disk, keyed on a geometry hash
+"""
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+from scipy import sparse
+from scipy.spatial import cKDTree
+
+from .geometry import project_km
+
+# Bump when the construction of any weights kind changes
+WEIGHTS_VERSION = 1
+
+
+def row_standardise(W):
+    """Scale each row to sum to 1 (islands keep an all-zero row)"""
+    W = sparse.csr_matrix(W, dtype=np.float64)
+    row_sums = np.asarray(W.sum(axis=1)).ravel()
+    scale = np.divide(1.0, row_sums, out=np.zeros_like(row_sums), where=row_sums > 0)
+    return sparse.diags(scale) @ W
+
+
+def knn_weights(coords, k=8):
+    """Binary k-nearest-neighbour weights from (n, 2) point coordinates"""
+    coords = np.asarray(coords, dtype=np.float64)
+    n = len(coords)
+    k = min(k, n - 1)
+    # k + 1 because every point is its own nearest neighbour
+    _, idx = cKDTree(coords).query(coords, k=k + 1)
+    rows = np.repeat(np.arange(n), k)
+    cols = idx[:, 1:].ravel()
+    return sparse.csr_matrix((np.ones(n * k), (rows, cols)), shape=(n, n))
+
+
+def distance_band_weights(coords, threshold, binary=True, alpha=-1.0):
+    """Weights for all pairs closer than ``threshold`` (same units as coords).
+
+    Binary by default; otherwise inverse-distance ``d ** alpha``.
+    """
+    coords = np.asarray(coords, dtype=np.float64)
+    n = len(coords)
+    tree = cKDTree(coords)
+    D = tree.sparse_distance_matrix(tree, threshold, output_type='coo_matrix')
+    off_diag = D.row != D.col
+    rows, cols, dist = D.row[off_diag], D.col[off_diag], D.data[off_diag]
+    # Coincident points are neighbours but carry no finite inverse distance
+    values = np.ones(len(dist)) if binary else np.power(np.maximum(dist, 1e-12), alpha)
+    return sparse.csr_matrix((values, (rows, cols)), shape=(n, n))
+
+
+def bbox_candidates(bbox, tol=0.0):
+    """Index pairs (i < j) whose [west, south, east, north] boxes overlap.
+
+    Sweep over boxes sorted by west edge: each box is only compared with the
+    boxes that start before it ends, so the polygon tests downstream never
+    see the full n x n set of pairs.
+    """
+    bbox = np.asarray(bbox, dtype=np.float64)
+    order = np.argsort(bbox[:, 0], kind='stable')
+    west = bbox[order, 0]
+    end = np.searchsorted(west, bbox[order, 2] + tol, side='right')
+    start = np.arange(len(order)) + 1
+    counts = np.maximum(end - start, 0)
+
+    a = np.repeat(np.arange(len(order)), counts)
+    # Position within each run, added to that run's start
+    b = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts) + start[a]
+    i, j = order[a], order[b]
+
+    overlap = ((bbox[i, 1] <= bbox[j, 3] + tol) & (bbox[j, 1] <= bbox[i, 3] + tol))
+    i, j = i[overlap], j[overlap]
+    return np.minimum(i, j), np.maximum(i, j)
+
+
+def _incidence(owner, ids, n):
+    """Binary (district x feature) matrix from per-element owner and feature ids"""
+    M = sparse.csr_matrix((np.ones(len(ids)), (owner, ids)), shape=(n, ids.max() + 1 if len(ids) else 0))
+    M.data[:] = 1.0
+    return M
+
+
+def contiguity_weights(geoms, kind='queen', tol=1e-6):
+    """Binary queen (shared vertex) or rook (shared edge) contiguity.
+
+    Vertices are snapped to a ``tol``-degree grid so boundaries digitised
+    once and shared between districts match exactly; only pairs whose
+    bounding boxes overlap are tested.
+    """
+    if kind not in ('queen', 'rook'):
+        raise ValueError(f"unknown contiguity '{kind}' (expected 'queen' or 'rook')")
+    n = len(geoms)
+    snapped = np.round(geoms.vertices / tol).astype(np.int64)
+    _, vertex_id = np.unique(snapped, axis=0, return_inverse=True)
+    vertex_id = vertex_id.ravel()
+    owner = geoms.vertex_owner
+
+    if kind == 'queen':
+        M = _incidence(owner, vertex_id, n)
+    else:
+        # Ring edges are consecutive vertices of the same ring, direction-free
+        ring = np.repeat(np.arange(len(geoms.ring_owner)), np.diff(geoms.ring_offsets))
+        same_ring = ring[:-1] == ring[1:]
+        a, b = vertex_id[:-1][same_ring], vertex_id[1:][same_ring]
+        keep = a != b
+        edges = np.column_stack([np.minimum(a, b), np.maximum(a, b)])[keep]
+        _, edge_id = np.unique(edges, axis=0, return_inverse=True)
+        M = _incidence(owner[:-1][same_ring][keep], edge_id.ravel(), n)
+
+    i, j = bbox_candidates(geoms.bbox, tol)
+    shared = np.asarray(M[i].multiply(M[j]).sum(axis=1)).ravel() if len(i) else np.empty(0)
+    i, j = i[shared > 0], j[shared > 0]
+    rows, cols = np.concatenate([i, j]), np.concatenate([j, i])
+    return sparse.csr_matrix((np.ones(len(rows)), (rows, cols)), shape=(n, n))
+
+
+@dataclass
+class SpatialWeights:
+    """Weights matrix with the district codes labelling its rows and columns"""
+    codes: np.ndarray
+    W: sparse.csr_matrix
+    kind: str
+
+    @property
+    def cardinalities(self):
+        return np.diff(self.W.indptr)
+
+    @property
+    def islands(self):
+        """Codes of districts without any neighbour"""
+        return self.codes[self.cardinalities == 0]
+
+    def reorder(self, codes):
+        """Weights restricted and permuted to ``codes`` (e.g. rows of a metric table)"""
+        position = {c: i for i, c in enumerate(self.codes.tolist())}
+        idx = np.array([position[c] for c in codes], dtype=np.int64)
+        return SpatialWeights(np.asarray(codes), self.W[idx][:, idx].tocsr(), self.kind)
+
+
+def _weights_key(geoms, kind, params):
+    h = hashlib.sha256()
+    h.update(json.dumps({'version': WEIGHTS_VERSION, 'kind': kind, **params},
+                        sort_keys=True).encode())
+    h.update(geoms.digest().encode())
+    return h.hexdigest()
+
+
+def _save(path, weights):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    W = weights.W
+    tmp = path.with_name(f'{path.stem}.{os.getpid()}.tmp.npz')
+    np.savez(tmp, data=W.data, indices=W.indices, indptr=W.indptr,
+             shape=np.array(W.shape), codes=weights.codes.astype(str))
+    os.replace(tmp, path)
+
+
+def _load(path, kind):
+    with np.load(path) as f:
+        W = sparse.csr_matrix((f['data'], f['indices'], f['indptr']), shape=tuple(f['shape']))
+        return SpatialWeights(f['codes'], W, kind)
+
+
+def build_weights(geoms, kind='queen', k=8, threshold_km=None, tol=1e-6, cache_dir=None):
+    """Binary spatial weights over ``geoms`` (DistrictGeometries).
+
+    ``kind`` is 'queen' or 'rook' (polygon contiguity), 'knn' (``k`` nearest
+    centroids) or 'distance' (centroids within ``threshold_km``). With a
+    ``cache_dir`` the matrix is stored as .npz and reused until the geometry
+    or parameters change.
+    """
+    if kind in ('queen', 'rook'):
+        params = {'tol': tol}
+    elif kind == 'knn':
+        params = {'k': k}
+    elif kind == 'distance':
+        if threshold_km is None:
+            raise ValueError("distance-band weights need threshold_km")
+        params = {'threshold_km': threshold_km}
+    else:
+        raise ValueError(f"unknown weights kind '{kind}'")
+
+    path = None
+    if cache_dir is not None:
+        key = _weights_key(geoms, kind, params)
+        path = Path(cache_dir) / f'{kind}-{key[:16]}.npz'
+        if path.exists():
+            return _load(path, kind)
+
+    if kind in ('queen', 'rook'):
+        W = contiguity_weights(geoms, kind, tol)
+    else:
+        xy = project_km(geoms.centroids())
+        W = knn_weights(xy, k) if kind == 'knn' else distance_band_weights(xy, threshold_km)
+
+    weights = SpatialWeights(geoms.codes, W, kind)
+    if path is not None:
+        _save(path, weights)
+    return weights
@@ -0,0 +1,20 @@
+"""
+ALPS journal figure toolkit
+Registry, build runner and CLI shared by every generate_figure* script
+"""
+
+from .beeswarm import BeeswarmLayout, beeswarm, beeswarm_layout
+from .builder import BuildResult, build
+from .data import ExportData, load_exports
+from .paths import DATA_DIR, OUTPUT_DIR, ROOT_DIR
+from .registry import FIGURES, Figure, get_figure, register, select
+from .render import RASTER_THRESHOLD, export, rasterize_dense
+
+__all__ = [
+    'BeeswarmLayout', 'beeswarm', 'beeswarm_layout',
+    'BuildResult', 'build',
+    'ExportData', 'load_exports',
+    'DATA_DIR', 'OUTPUT_DIR', 'ROOT_DIR',
+    'FIGURES', 'Figure', 'get_figure', 'register', 'select',
+    'RASTER_THRESHOLD', 'export', 'rasterize_dense',
+]
@@ -0,0 +1,159 @@
+"""
+Beeswarm layout for per-feature distributions (SHAP summary plots)
+Values are binned along x for every row in one vectorised pass. Each bin is
+thinned to a density-preserving cap, and its points are stacked outwards from
+the row centre in fixed slots, so markers never overlap and the same input
+always gives the same picture. The result is drawn as a single scatter
+collection whatever the sample size
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+# Share of a row's height the swarm may fill
+ROW_FILL = 0.8
+
+# Default marker area in points² (matplotlib ``s``)
+MARKER_SIZE = 9
+
+
+@dataclass
+class BeeswarmLayout:
+    """Kept points: point ``i`` of row ``row[i]`` is drawn at (``x[i]``, ``y[i]``)
+    with colour value ``c[i]``; ``shown`` and ``total`` count points per row"""
+    x: np.ndarray
+    y: np.ndarray
+    c: np.ndarray
+    row: np.ndarray
+    shown: np.ndarray
+    total: np.ndarray
+
+    def __len__(self):
+        return len(self.x)
+
+
+def _rows(values):
+    """Sequence of 1-D float arrays, one per row (2-D arrays are taken column-wise)"""
+    if isinstance(values, np.ndarray) and values.ndim == 2:
+        return [np.asarray(values[:, j], dtype=np.float64) for j in range(values.shape[1])]
+    return [np.asarray(v, dtype=np.float64).ravel() for v in values]
+
+
+def _group_starts(count):
+    return np.concatenate([[0], np.cumsum(count)[:-1]])
+
+
+def _shrink(keep, occupied, max_points):
+    """``keep`` scaled by the largest common factor whose floored total, with
+    one point per occupied bin, fits ``max_points`` (found by bisection)"""
+    def scaled(f):
+        return np.where(occupied, np.maximum(np.floor(keep * f), 1), 0)
+
+    low, high = 0.0, max_points / keep.sum()
+    if scaled(high).sum() <= max_points:
+        return scaled(high)
+    for _ in range(50):
+        mid = (low + high) / 2
+        low, high = (mid, high) if scaled(mid).sum() <= max_points else (low, mid)
+    return scaled(low)
+
+
+def beeswarm_layout(values, colors=None, bins=100, max_per_bin=10, max_points=None,
+                    x_range=None, spacing=None):
+    """Swarm positions for one row of points per entry of ``values``.
+
+    Row ``r`` is centred on y = r. Its values fall into ``bins`` equal x bins
+    over ``x_range`` (the finite data range by default). Every row is scaled
+    so that its densest bin keeps ``max_per_bin`` points and the other bins
+    keep the same share, rounded up so that sparse tails stay visible.
+    ``max_points`` caps the total the same way; only when more bins are
+    occupied than ``max_points`` does keeping one point each exceed it.
+    Within a bin, the kept points are spread evenly over the colour order
+    and placed, in x order, in alternating slots ``spacing`` apart above and
+    below the centre.
+    """
+    rows = _rows(values)
+    color_rows = _rows(colors) if colors is not None else [np.zeros(len(v)) for v in rows]
+    n_rows = len(rows)
+    x = np.concatenate(rows) if rows else np.empty(0)
+    c = np.concatenate(color_rows) if rows else np.empty(0)
+    if len(c) != len(x):
+        raise ValueError('colors must match values row by row')
+    row = np.repeat(np.arange(n_rows), [len(v) for v in rows])
+    valid = np.isfinite(x)
+    x, c, row = x[valid], c[valid], row[valid]
+    total = np.bincount(row, minlength=n_rows)
+    if not len(x):
+        empty = np.empty(0)
+        return BeeswarmLayout(empty, empty, empty, row, np.zeros(n_rows, np.int64), total)
+
+    bins = max(int(bins), 1)
+    max_per_bin = max(int(max_per_bin), 1)
+    lo, hi = x_range if x_range is not None else (x.min(), x.max())
+    width = (hi - lo) / bins if hi > lo else 1.0
+    b = np.clip(np.floor((x - lo) / width), 0, bins - 1).astype(np.int64)
+    group = row * bins + b
+    count = np.bincount(group, minlength=n_rows * bins).reshape(n_rows, bins)
+
+    # Density-preserving cap: the densest bin of each row keeps max_per_bin
+    scale = np.minimum(1.0, max_per_bin / np.maximum(count.max(axis=1), 1))
+    keep = np.where(count > 0, np.ceil(count * scale[:, None]), 0)
+    if max_points and keep.sum() > max_points:
+        keep = _shrink(keep, count > 0, max_points)
+    count, keep = count.ravel(), keep.astype(np.int64).ravel()
+
+    # Evenly spaced picks in (bin, colour) order: rank r is kept when it
+    # starts a new keep/count quantile of its bin. One argsort of
+    # bin + scaled colour is several times faster than a lexsort
+    c_lo, c_span = np.nanmin(c), np.nanmax(c) - np.nanmin(c)
+    unit = (c - c_lo) / c_span if c_span > 0 else np.zeros(len(c))
+    order = np.argsort(group + 0.5 * np.nan_to_num(unit))
+    g = group[order]
+    rank = np.arange(len(g)) - _group_starts(count)[g]
+    n, k = count[g], keep[g]
+    chosen = order[(rank * k) // n != ((rank - 1) * k) // n]
+    # Slots are filled in x order within the bin, so colour does not
+    # follow distance from the row centre
+    position = (x[chosen] - lo) / width - b[chosen]
+    chosen = chosen[np.argsort(group[chosen] + 0.5 * np.clip(position, 0, 1), kind='stable')]
+    g = group[chosen]
+    slot = np.arange(len(chosen)) - _group_starts(keep)[g]
+
+    # Slots 0, 1, 2, 3, ... sit at 0, +1, -1, +2, ... spacings from the centre
+    if spacing is None:
+        spacing = ROW_FILL / max_per_bin
+    offset = ((slot + 1) // 2) * np.where(slot % 2 == 1, 1.0, -1.0) * spacing
+    kept_row = row[chosen]
+    return BeeswarmLayout(x[chosen], kept_row + offset, c[chosen], kept_row,
+                          np.bincount(kept_row, minlength=n_rows), total)
+
+
+def beeswarm(ax, values, colors=None, size=MARKER_SIZE, max_points=None, x_range=None,
+             margin=0.05, **scatter_kwargs):
+    """Draw ``values`` on ``ax`` as a beeswarm, one row per entry at y = 0, 1, ...
+
+    Bin width and slot spacing are one marker diameter at ``ax``'s current
+    size, so markers of area ``size`` do not overlap. Sets the axes limits
+    and returns (PathCollection, BeeswarmLayout).
+    """
+    rows = _rows(values)
+    n_rows = len(rows)
+    if x_range is None:
+        finite = np.concatenate([v[np.isfinite(v)] for v in rows] or [np.empty(0)])
+        x_range = (finite.min(), finite.max()) if len(finite) else (0.0, 1.0)
+    lo, hi = x_range
+    pad = margin * (hi - lo) if hi > lo else 0.5
+    ax.set_xlim(lo - pad, hi + pad)
+    ax.set_ylim(-0.5, max(n_rows, 1) - 0.5)
+
+    box = ax.get_window_extent().transformed(ax.figure.dpi_scale_trans.inverted())
+    diameter = np.sqrt(size)
+    row_height = 72 * box.height / max(n_rows, 1)
+    bins = 72 * box.width / diameter * (hi - lo) / (hi - lo + 2 * pad)
+    layout = beeswarm_layout(rows, colors, bins=bins,
+                             max_per_bin=ROW_FILL * row_height / diameter,
+                             max_points=max_points, x_range=(lo, hi),
+                             spacing=diameter / row_height)
+    collection = ax.scatter(layout.x, layout.y, c=layout.c, s=size, **scatter_kwargs)
+    return collection, layout
@@ -0,0 +1,129 @@
+"""
+Figure build runner
+Renders registered figures in-process or across a process pool, with
+per-figure timing and failure isolation
+"""
+
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional
+
+from . import cache
+from .data import load_exports
+from .paths import DATA_DIR, OUTPUT_DIR
+from .registry import Figure, get_figure
+
+
+@dataclass
+class BuildResult:
+    name: str
+    elapsed: float
+    error: Optional[str] = None
+    cached: bool = False
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
+def build_one(name, output_dir=OUTPUT_DIR, data_dir=DATA_DIR):
+    """Render a single registered figure.
+
+    Runs in a worker process when jobs > 1, so it never raises: failures
+    are returned as a formatted traceback and the remaining figures keep going.
+    """
+    import matplotlib as mpl
+    import matplotlib.pyplot as plt
+
+    start = time.perf_counter()
+    try:
+        func = get_figure(name).load()
+        # Each generate_* module declares its rcParams as STYLE; apply it per
+        # call so figures built in one process don't inherit each other's style
+        style = getattr(sys.modules[func.__module__], 'STYLE', {})
+        with mpl.rc_context(style):
+            func(output_dir=Path(output_dir), data=load_exports(data_dir))
+        error = None
+    except Exception:
+        error = traceback.format_exc()
+    finally:
+        plt.close('all')
+    return BuildResult(name, time.perf_counter() - start, error)
+
+
+def build(figures: List[Figure], jobs=1, output_dir=OUTPUT_DIR,
+          data_dir=DATA_DIR, force=False) -> List[BuildResult]:
+    """Build figures sequentially (jobs=1) or across a process pool.
+
+    Figures whose cache key matches the manifest in ``output_dir`` are
+    skipped unless ``force`` is set. Results are returned in the order the
+    figures were given, regardless of completion order.
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    manifest = cache.load_manifest(output_dir)
+    keys, results = {}, {}
+    for f in figures:
+        try:
+            keys[f.name] = cache.figure_key(f, f.load(), data_dir)
+        except Exception:
+            # A module that fails to import fails its figure only
+            results[f.name] = BuildResult(f.name, 0.0, traceback.format_exc())
+
+    pending = []
+    for f in figures:
+        if f.name in results:
+            continue
+        if not force and cache.is_fresh(manifest, f, keys[f.name], output_dir):
+            results[f.name] = BuildResult(f.name, 0.0, cached=True)
+        else:
+            pending.append(f.name)
+
+    if jobs <= 1 or len(pending) <= 1:
+        for name in pending:
+            results[name] = build_one(name, output_dir, data_dir)
+    else:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(pending))) as pool:
+            futures = {pool.submit(build_one, name, output_dir, data_dir): name for name in pending}
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    results[name] = future.result()
+                except Exception:
+                    # Worker died (e.g. killed by the OS) before it could report back
+                    results[name] = BuildResult(name, 0.0, traceback.format_exc())
+
+    for f in figures:
+        r = results[f.name]
+        if r.cached:
+            continue
+        if r.ok:
+            cache.record(manifest, f, keys[f.name], r.elapsed)
+        else:
+            manifest.pop(f.name, None)
+    cache.save_manifest(output_dir, manifest)
+
+    return [results[f.name] for f in figures]
+
+
+def print_report(results: List[BuildResult], wall_time: float):
+    print("\n" + "=" * 60)
+    print("⏱  Per-figure timing:")
+    for r in results:
+        if r.cached:
+            print(f"  ⏭  {r.name:<16}  cached")
+            continue
+        status = '✅' if r.ok else '❌'
+        print(f"  {status} {r.name:<16} {r.elapsed:6.2f}s")
+    print(f"  Total wall time: {wall_time:.2f}s "
+          f"(sum of figures: {sum(r.elapsed for r in results):.2f}s)")
+
+    for r in results:
+        if not r.ok:
+            print(f"\n❌ Error during {r.name}:")
+            print(r.error)
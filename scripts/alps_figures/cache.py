@@ -0,0 +1,114 @@
+"""
+Content-addressed build cache for figures
+A figure's key hashes the source of the module defining it (so helpers next
+to the figure function count), the source of the alps_analytics and
+alps_figures packages it calls into, its declared input files and the
+rcParams it renders with; figures whose key matches the manifest entry in the
+output directory (and whose outputs still exist) are skipped
+"""
+
+import hashlib
+import importlib
+import inspect
+import json
+import sys
+import time
+from functools import lru_cache
+from pathlib import Path
+
+from .paths import DATA_DIR
+
+# Bump to invalidate every cached figure (e.g. after changing the key itself)
+CACHE_VERSION = 2
+
+# Packages whose whole source is part of every key: any figure may call into
+# them, directly or through another module of the package
+SOURCE_PACKAGES = ('alps_analytics', 'alps_figures')
+
+MANIFEST_NAME = 'build_manifest.json'
+
+
+def _hash_file(path, h):
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+
+
+@lru_cache(maxsize=None)
+def source_digest(path):
+    """sha256 of one source file (read once per process)"""
+    h = hashlib.sha256()
+    _hash_file(path, h)
+    return h.hexdigest()
+
+
+@lru_cache(maxsize=None)
+def package_digest(names=SOURCE_PACKAGES):
+    """sha256 over every .py file of the ``names`` packages"""
+    h = hashlib.sha256()
+    for name in names:
+        root = Path(importlib.import_module(name).__file__).parent
+        for path in sorted(root.rglob('*.py')):
+            h.update(f'|{name}/{path.relative_to(root).as_posix()}:'.encode())
+            h.update(source_digest(path).encode())
+    return h.hexdigest()
+
+
+def figure_key(figure, func, data_dir=DATA_DIR):
+    """Compute the cache key for a registered figure and its loaded function"""
+    import matplotlib
+
+    h = hashlib.sha256()
+    h.update(f'v{CACHE_VERSION}|mpl={matplotlib.__version__}|'.encode())
+    h.update(figure.target.encode())
+    h.update(f'|module:{source_digest(inspect.getsourcefile(func))}'.encode())
+    h.update(f'|packages:{package_digest()}|'.encode())
+
+    style = getattr(sys.modules[func.__module__], 'STYLE', {})
+    h.update(json.dumps(style, sort_keys=True, default=str).encode())
+
+    for name in figure.inputs:
+        path = Path(data_dir) / name
+        h.update(f'|input:{name}:'.encode())
+        if path.exists():
+            _hash_file(path, h)
+        else:
+            h.update(b'<missing>')
+
+    h.update('|outputs:'.encode() + ','.join(figure.outputs).encode())
+    return h.hexdigest()
+
+
+def load_manifest(output_dir):
+    path = Path(output_dir) / MANIFEST_NAME
+    if not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        # A corrupt manifest only costs a full rebuild
+        return {}
+
+
+def save_manifest(output_dir, manifest):
+    path = Path(output_dir) / MANIFEST_NAME
+    tmp = path.with_suffix('.json.tmp')
+    tmp.write_text(json.dumps(manifest, indent=2, sort_keys=True))
+    tmp.replace(path)
+
+
+def is_fresh(manifest, figure, key, output_dir):
+    """True if the manifest records this key and every output is on disk"""
+    entry = manifest.get(figure.name)
+    if not entry or entry.get('key') != key:
+        return False
+    return all((Path(output_dir) / out).exists() for out in figure.outputs)
+
+
+def record(manifest, figure, key, elapsed):
+    manifest[figure.name] = {
+        'key': key,
+        'outputs': list(figure.outputs),
+        'elapsed': round(elapsed, 3),
+        'built_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+    }
@@ -0,0 +1,81 @@
+"""
+Command-line entry point: python -m alps_figures
+
+    python -m alps_figures list
+    python -m alps_figures build                  # all default figures
+    python -m alps_figures build fig1 fig11 --jobs 4
+"""
+
+import argparse
+import time
+
+from .builder import build, print_report
+from .paths import DATA_DIR, OUTPUT_DIR
+from .registry import FIGURES, select
+
+
+def cmd_list(args):
+    for fig in FIGURES.values():
+        marker = ' ' if fig.default else '*'
+        print(f"{marker} {fig.name:<16} {fig.title}")
+        for name in fig.inputs:
+            print(f"      ← {name}")
+        for output in fig.outputs:
+            print(f"      → {output}")
+    print("\n* built only when requested by name")
+    return 0
+
+
+def cmd_build(args):
+    try:
+        figures = select(args.figures)
+    except KeyError as e:
+        print(f"❌ {e.args[0]}")
+        return 2
+
+    print(f"📊 ALPS Figure Builder")
+    print(f"Output directory: {args.out_dir}")
+    print(f"Building {len(figures)} figure(s) with {args.jobs} job(s): "
+          f"{', '.join(f.name for f in figures)}")
+    print("=" * 60)
+
+    wall_start = time.perf_counter()
+    results = build(figures, jobs=args.jobs, output_dir=args.out_dir,
+                    data_dir=args.data_dir, force=args.force)
+    print_report(results, time.perf_counter() - wall_start)
+
+    failed = [r for r in results if not r.ok]
+    if failed:
+        print(f"❌ {len(failed)} of {len(results)} figures failed")
+        return 1
+    print("✅ All figures generated successfully!")
+    return 0
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m alps_figures',
+                                     description='Build ALPS journal paper figures')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    p_list = sub.add_parser('list', help='List registered figures')
+    p_list.set_defaults(func=cmd_list)
+
+    p_build = sub.add_parser('build', help='Build figures')
+    p_build.add_argument('figures', nargs='*',
+                         help='Figure names (e.g. fig1 fig11); default: all')
+    p_build.add_argument('--jobs', '-j', type=int, default=1,
+                         help='Number of worker processes (default: 1, build in-process)')
+    p_build.add_argument('--force', '-f', action='store_true',
+                         help='Rebuild figures even if their cache key is unchanged')
+    p_build.add_argument('--out-dir', default=OUTPUT_DIR,
+                         help=f'Output directory (default: {OUTPUT_DIR})')
+    p_build.add_argument('--data-dir', default=DATA_DIR,
+                         help=f'Exported paper data (default: {DATA_DIR})')
+    p_build.set_defaults(func=cmd_build)
+
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    return args.func(args)
@@ -0,0 +1,137 @@
+"""
+Columnar (Arrow IPC / Feather v2) cache for the CSV exports
+Each CSV is converted once to an uncompressed Arrow file next to the data
+(tmp/exports/data/.columnar/) and re-converted only when the CSV's mtime and
+content hash change; later reads memory-map the file and project only the
+requested columns. Falls back to plain pandas CSV parsing without pyarrow.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Optional, Sequence
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.feather as feather
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+
+CACHE_DIRNAME = '.columnar'
+
+# Bump when the on-disk layout or type mapping changes
+FORMAT_VERSION = 1
+
+
+def available():
+    return pa is not None
+
+
+def _arrow_type(dtype):
+    return {
+        'int16': pa.int16(), 'int32': pa.int32(), 'int64': pa.int64(),
+        'float32': pa.float32(), 'float64': pa.float64(),
+        'string': pa.string(),
+        'category': pa.dictionary(pa.int32(), pa.string()),
+    }[dtype]
+
+
+def _sha256(path):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def cache_paths(csv_path):
+    csv_path = Path(csv_path)
+    cache_dir = csv_path.parent / CACHE_DIRNAME
+    return cache_dir / f'{csv_path.stem}.arrow', cache_dir / f'{csv_path.stem}.arrow.json'
+
+
+def _is_current(csv_path, arrow_path, meta_path):
+    """Check the sidecar against the CSV; cheap stat first, hash only on mismatch"""
+    if not arrow_path.exists() or not meta_path.exists():
+        return False
+    try:
+        meta = json.loads(meta_path.read_text())
+    except (OSError, ValueError):
+        return False
+    if meta.get('version') != FORMAT_VERSION:
+        return False
+
+    st = csv_path.stat()
+    if meta.get('mtime_ns') == st.st_mtime_ns and meta.get('size') == st.st_size:
+        return True
+    # Touched but possibly unchanged (e.g. re-export of identical data)
+    if meta.get('size') == st.st_size and meta.get('sha256') == _sha256(csv_path):
+        meta['mtime_ns'] = st.st_mtime_ns
+        meta_path.write_text(json.dumps(meta))
+        return True
+    return False
+
+
+def convert(csv_path, spec, rename):
+    """Parse a CSV with its declared types and write the Arrow cache file"""
+    csv_path = Path(csv_path)
+    arrow_path, meta_path = cache_paths(csv_path)
+    arrow_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Date columns are left to Arrow's inference: plain dates come back as
+    # date32 and ISO timestamps with 'Z' as UTC timestamps
+    column_types = {col: _arrow_type(t) for col, t in spec.dtypes.items()}
+    table = pa_csv.read_csv(
+        csv_path, convert_options=pa_csv.ConvertOptions(column_types=column_types))
+    for col in spec.dates:
+        i = table.schema.get_field_index(col)
+        if i >= 0 and pa.types.is_date(table.schema.field(i).type):
+            table = table.set_column(i, col, table.column(i).cast(pa.timestamp('ms')))
+    table = table.rename_columns([rename(c) for c in table.column_names])
+
+    # Uncompressed so reads can memory-map the buffers without decoding
+    tmp = arrow_path.with_suffix(f'.arrow.{os.getpid()}.tmp')
+    feather.write_feather(table, tmp, compression='uncompressed')
+    os.replace(tmp, arrow_path)
+
+    st = csv_path.stat()
+    meta_path.write_text(json.dumps({
+        'version': FORMAT_VERSION,
+        'source': csv_path.name,
+        'mtime_ns': st.st_mtime_ns,
+        'size': st.st_size,
+        'sha256': _sha256(csv_path),
+        'rows': table.num_rows,
+    }))
+    return arrow_path
+
+
+def read_table(csv_path, spec, rename, columns: Optional[Sequence[str]] = None):
+    """Arrow table for a CSV export, memory-mapped and projected to ``columns``"""
+    csv_path = Path(csv_path)
+    arrow_path, meta_path = cache_paths(csv_path)
+    if not _is_current(csv_path, arrow_path, meta_path):
+        convert(csv_path, spec, rename)
+    return feather.read_table(arrow_path, columns=list(columns) if columns else None,
+                              memory_map=True)
+
+
+def read_frame(csv_path, spec, rename, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+    """DataFrame for a CSV export via the columnar cache (or pandas without pyarrow)"""
+    if available():
+        table = read_table(csv_path, spec, rename, columns)
+        return table.to_pandas(categories=[rename(c) for c, t in spec.dtypes.items()
+                                           if t == 'category'])
+
+    usecols = None
+    if columns:
+        header = pd.read_csv(csv_path, nrows=0).columns
+        usecols = [c for c in header if rename(c) in set(columns)]
+    dates = [c for c in spec.dates if usecols is None or c in usecols]
+    dtypes = {c: t for c, t in spec.dtypes.items() if usecols is None or c in usecols}
+    df = pd.read_csv(csv_path, usecols=usecols, dtype=dtypes, parse_dates=dates)
+    return df.rename(columns=rename)
@@ -0,0 +1,223 @@
+"""
+Shared loader for the paper-data exports written by scripts/export_paper_data.ts
+Each CSV in tmp/exports/data is parsed once per process into a typed pandas
+DataFrame (snake_case columns) and handed to every figure function; parsing
+goes through the columnar cache in columnar.py; district polygons come from
+districts.geojson and derived spatial weights are cached in .weights/;
+model attributions are memory-mapped from .shap/ and model benchmark results
+read from model_benchmark.json
+"""
+
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from alps_analytics.ml.attributions import SHAP_DIRNAME, load_attributions
+from alps_analytics.ml.benchmark import BENCHMARK_FILENAME, load_benchmark
+from alps_analytics.spatial import build_weights, load_districts
+
+from . import columnar
+from .paths import DATA_DIR
+
+
+@dataclass(frozen=True)
+class ExportSpec:
+    """Schema of one export file (column names as written by the exporter)"""
+    filename: str
+    dtypes: Dict[str, str] = field(default_factory=dict)
+    dates: Tuple[str, ...] = ()
+
+
+EXPORTS = {
+    'temporal_trends': ExportSpec(
+        'temporal_trends.csv',
+        {'Year': 'int16', 'Avg_Radiance': 'float64', 'Max_Radiance': 'float64',
+         'Total_Hotspots': 'int64', 'Observation_Count': 'int64', 'Std_Dev': 'float64'}),
+    'district_metrics': ExportSpec(
+        'district_metrics.csv',
+        {'District_Code': 'string', 'District_Name': 'string', 'State_Code': 'string',
+         'State_Name': 'string', 'Radiance': 'float64', 'Hotspots': 'int32'},
+        dates=('Date',)),
+    'district_daily': ExportSpec(
+        'district_daily_metrics.csv',
+        {'Code': 'string', 'Radiance': 'float64', 'Hotspots': 'int32'},
+        dates=('Date',)),
+    'state_daily': ExportSpec(
+        'state_daily_metrics.csv',
+        {'Code': 'string', 'Radiance': 'float64', 'Hotspots': 'int32'},
+        dates=('Date',)),
+    'district_yearly': ExportSpec(
+        'district_yearly_metrics.csv',
+        {'District_Code': 'string', 'State_Code': 'string', 'Year': 'int16',
+         'Radiance': 'float64', 'Hotspots': 'int32'}),
+    'state_aggregates': ExportSpec(
+        'state_aggregates.csv',
+        {'State_Code': 'string', 'State_Name': 'string', 'Avg_Radiance': 'float64',
+         'Total_Hotspots': 'int64', 'District_Count': 'int32'}),
+    'alerts': ExportSpec(
+        'alerts.csv',
+        {'Alert_ID': 'string', 'District_Code': 'string', 'Level': 'category',
+         'Severity': 'int16'},
+        dates=('Created_At',)),
+    'correlation_data': ExportSpec(
+        'correlation_data.csv',
+        {'Year': 'int16', 'Avg_Radiance': 'float64', 'Total_Hotspots': 'int64',
+         'Temperature': 'float64', 'Humidity': 'float64', 'Cloud_Cover': 'float64',
+         'Pop_Density': 'float64', 'Energy_Usage': 'float64'}),
+}
+
+DISTRICTS_FILE = 'districts.geojson'
+WEIGHTS_DIRNAME = '.weights'
+
+
+# Paper Table 1 (2014-2025); used when an export has not been generated yet
+TABLE1 = pd.DataFrame({
+    'year': range(2014, 2026),
+    'avg_radiance': [15.20, 15.52, 15.84, 16.16, 16.48, 16.80, 17.12,
+                     17.44, 17.76, 18.08, 18.40, 18.72],
+    'std_dev': [0.45, 0.48, 0.51, 0.53, 0.56, 0.58, 0.60,
+                0.62, 0.64, 0.66, 0.68, 0.70],
+    'total_hotspots': [12450, 12690, 12930, 13170, 13410, 13650, 13890,
+                       14130, 14370, 14610, 14850, 15090],
+    'temperature': [24.7, 23.3, 23.6, 25.4, 27.0, 26.9, 25.3,
+                    23.6, 23.3, 24.8, 26.7, 27.1],
+    'humidity': [57.2, 62.4, 70.0, 73.0, 68.6, 61.0, 57.0,
+                 60.4, 68.0, 72.9, 70.5, 63.1],
+    'cloud_cover': [56.9, 54.8, 50.2, 44.4, 38.7, 34.6, 33.0,
+                    34.3, 38.3, 43.9, 49.8, 54.5],
+    'pop_density': [400, 415, 430, 445, 460, 475, 490,
+                    505, 520, 535, 550, 565],
+    'energy_usage': [1200, 1285, 1370, 1455, 1540, 1625, 1710,
+                     1795, 1880, 1965, 2050, 2135],
+})
+
+
+def snake_case(column):
+    return re.sub(r'[^0-9a-zA-Z]+', '_', column).strip('_').lower()
+
+
+def read_export(path, spec: ExportSpec, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+    """Parse one export with its declared dtypes and snake_case columns.
+
+    ``columns`` (snake_case) projects the read so unused columns are never
+    materialised.
+    """
+    return columnar.read_frame(path, spec, snake_case, columns)
+
+
+class ExportData:
+    """Lazily parsed view of every export in a data directory.
+
+    Each table is read on first access and kept for the life of the object;
+    missing files yield ``None`` (or the Table 1 fallback where one exists).
+    """
+
+    def __init__(self, data_dir=DATA_DIR):
+        self.data_dir = Path(data_dir)
+        self._tables: Dict[tuple, Optional[pd.DataFrame]] = {}
+        self._districts = None
+        self._weights = {}
+        self._shap = None
+        self._benchmark = None
+        self.fallbacks = set()
+
+    def table(self, name, columns: Optional[Sequence[str]] = None) -> Optional[pd.DataFrame]:
+        key = (name, tuple(columns) if columns else None)
+        if key not in self._tables:
+            spec = EXPORTS[name]
+            path = self.data_dir / spec.filename
+            self._tables[key] = read_export(path, spec, columns) if path.exists() else None
+        return self._tables[key]
+
+    def has(self, name):
+        return self.table(name) is not None
+
+    def _with_fallback(self, name, columns):
+        df = self.table(name)
+        if df is not None and not df.empty:
+            return df
+        if name not in self.fallbacks:
+            self.fallbacks.add(name)
+            print(f"⚠️  {EXPORTS[name].filename} not found in {self.data_dir}, "
+                  f"using paper Table 1 values")
+        return TABLE1[list(columns)].copy()
+
+    @property
+    def temporal_trends(self) -> pd.DataFrame:
+        return self._with_fallback(
+            'temporal_trends', ['year', 'avg_radiance', 'std_dev', 'total_hotspots'])
+
+    @property
+    def correlation_data(self) -> pd.DataFrame:
+        return self._with_fallback(
+            'correlation_data', ['year', 'avg_radiance', 'total_hotspots', 'temperature',
+                                 'humidity', 'cloud_cover', 'pop_density', 'energy_usage'])
+
+    @property
+    def district_metrics(self) -> Optional[pd.DataFrame]:
+        return self.table('district_metrics')
+
+    def district_daily(self, columns=('code', 'date', 'radiance')) -> Optional[pd.DataFrame]:
+        """DistrictDailyMetric rows (742 districts x ~4,000 days), projected"""
+        return self.table('district_daily', columns)
+
+    def state_daily(self, columns=('code', 'date', 'radiance')) -> Optional[pd.DataFrame]:
+        return self.table('state_daily', columns)
+
+    @property
+    def district_yearly(self) -> Optional[pd.DataFrame]:
+        return self.table('district_yearly')
+
+    @property
+    def state_aggregates(self) -> Optional[pd.DataFrame]:
+        return self.table('state_aggregates')
+
+    @property
+    def districts(self):
+        """District polygons (DistrictGeometries) or None if not exported"""
+        if self._districts is None:
+            path = self.data_dir / DISTRICTS_FILE
+            if path.exists():
+                self._districts = load_districts(path)
+        return self._districts
+
+    def district_weights(self, kind='queen', **params):
+        """Spatial weights over ``districts``, cached on disk under .weights/"""
+        key = (kind, tuple(sorted(params.items())))
+        if key not in self._weights:
+            geoms = self.districts
+            self._weights[key] = None if geoms is None else build_weights(
+                geoms, kind, cache_dir=self.data_dir / WEIGHTS_DIRNAME, **params)
+        return self._weights[key]
+
+    @property
+    def alerts(self) -> Optional[pd.DataFrame]:
+        return self.table('alerts')
+
+    @property
+    def shap(self):
+        """Stored TreeSHAP attributions (python -m alps_analytics.ml shap), memory-mapped"""
+        if self._shap is None:
+            self._shap = load_attributions(self.data_dir / SHAP_DIRNAME)
+        return self._shap
+
+    @property
+    def benchmark(self):
+        """Stored model benchmark (python -m alps_analytics.ml bench) or None"""
+        if self._benchmark is None:
+            self._benchmark = load_benchmark(self.data_dir / BENCHMARK_FILENAME)
+        return self._benchmark
+
+
+_LOADED: Dict[Path, ExportData] = {}
+
+
+def load_exports(data_dir=DATA_DIR) -> ExportData:
+    """Process-wide ExportData for a data directory (parsed at most once)"""
+    key = Path(data_dir).resolve()
+    if key not in _LOADED:
+        _LOADED[key] = ExportData(key)
+    return _LOADED[key]
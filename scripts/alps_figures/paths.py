@@ -0,0 +1,15 @@
+"""
+Shared filesystem locations for ALPS figure generation
+Anchored to the repository root so builds work from any working directory
+"""
+
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+SCRIPTS_DIR = ROOT_DIR / 'scripts'
+
+# Written by scripts/export_paper_data.ts
+DATA_DIR = ROOT_DIR / 'tmp' / 'exports' / 'data'
+
+# Generated figures (PDFs + PNGs)
+OUTPUT_DIR = ROOT_DIR / 'tmp' / 'exports' / 'figures'
@@ -0,0 +1,120 @@
+"""
+Figure registry for the ALPS journal paper
+Every figure is declared once with its entry point, inputs and outputs so it
+can be built on its own, in any subset, or in parallel with the others
+"""
+
+import importlib
+import sys
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .paths import SCRIPTS_DIR
+
+
+@dataclass(frozen=True)
+class Figure:
+    """A buildable figure.
+
+    ``target`` is a ``"module:function"`` reference resolved lazily, so
+    listing the registry never imports matplotlib-heavy modules. ``inputs``
+    are data files (relative to the data directory) the figure reads and
+    ``outputs`` are the files it writes (relative to the output directory).
+    """
+    name: str
+    title: str
+    target: str
+    inputs: Tuple[str, ...] = ()
+    outputs: Tuple[str, ...] = ()
+    default: bool = True
+
+    def load(self) -> Callable:
+        """Import and return the figure function"""
+        module_name, func_name = self.target.split(':')
+        # The generate_*.py modules live next to this package in scripts/
+        if str(SCRIPTS_DIR) not in sys.path:
+            sys.path.insert(0, str(SCRIPTS_DIR))
+        return getattr(importlib.import_module(module_name), func_name)
+
+
+FIGURES: Dict[str, Figure] = {}
+
+
+def register(figure: Figure) -> Figure:
+    if figure.name in FIGURES:
+        raise ValueError(f"Figure '{figure.name}' is already registered")
+    FIGURES[figure.name] = figure
+    return figure
+
+
+def get_figure(name: str) -> Figure:
+    try:
+        return FIGURES[name]
+    except KeyError:
+        known = ', '.join(FIGURES)
+        raise KeyError(f"Unknown figure '{name}' (known: {known})") from None
+
+
+def select(names: Optional[List[str]] = None) -> List[Figure]:
+    """Resolve figure names to registry entries; no names means all defaults"""
+    if not names:
+        return [f for f in FIGURES.values() if f.default]
+    return [get_figure(name) for name in names]
+
+
+def _both(stem):
+    return (f'{stem}.pdf', f'{stem}.png')
+
+
+# ============================================================================
+# Figure declarations (paper order)
+# ============================================================================
+register(Figure('fig1', 'Study Area and Monitoring Infrastructure',
+                'generate_figure1_study_area:generate_figure1_study_area',
+                inputs=('districts.geojson', 'district_daily_metrics.csv'),
+                outputs=_both('figure1_study_area')))
+register(Figure('fig2', 'Temporal Trends Analysis',
+                'generate_journal_figures:generate_figure2_temporal_trends',
+                inputs=('temporal_trends.csv', 'district_yearly_metrics.csv',
+                        'state_aggregates.csv', 'district_daily_metrics.csv'),
+                outputs=_both('figure2_temporal_trends')))
+register(Figure('fig3', 'ALPS Sense-Reason-Act-Learn Framework',
+                'generate_figure3_framework:generate_figure3_framework',
+                outputs=_both('figure3_framework')))
+register(Figure('fig5', 'SHAP Summary Plot',
+                'generate_journal_figures:generate_figure5_shap_summary',
+                inputs=('.shap/meta.json',),
+                outputs=_both('figure5_shap_summary')))
+register(Figure('fig6', 'Feature Importance Evolution',
+                'generate_journal_figures:generate_figure6_feature_evolution',
+                inputs=('.shap/meta.json',),
+                outputs=_both('figure6_feature_evolution')))
+register(Figure('fig7', 'Urbanization Burden Analysis',
+                'generate_journal_figures:generate_figure7_urbanization_burden',
+                inputs=('district_yearly_metrics.csv',),
+                outputs=_both('figure7_urbanization_burden')))
+register(Figure('fig8', 'Model Performance Comparison',
+                'generate_journal_figures:generate_figure8_model_performance',
+                inputs=('model_benchmark.json',),
+                outputs=_both('figure8_model_performance')))
+register(Figure('fig9', 'ALPS Dashboard Interface',
+                'generate_figure9_dashboard:generate_figure9_dashboard',
+                outputs=_both('figure9_dashboard_interface')))
+register(Figure('fig10', 'Correlation Matrix',
+                'generate_journal_figures:generate_figure10_correlation_matrix',
+                inputs=('correlation_data.csv',),
+                outputs=_both('figure10_correlation_matrix')))
+register(Figure('fig11', 'Spatial Autocorrelation Analysis',
+                'generate_figure11_spatial_analysis:generate_figure11_spatial_analysis',
+                inputs=('districts.geojson', 'district_daily_metrics.csv'),
+                outputs=_both('figure11_spatial_autocorrelation')))
+register(Figure('fig12', 'Policy Effectiveness Timeline',
+                'generate_figure12_policy_effectiveness_v2:generate_figure12_policy_effectiveness',
+                outputs=_both('figure12_policy_effectiveness')))
+register(Figure('fig12-timeline', 'Policy Timeline (compact)',
+                'generate_figure12_timeline:generate_figure12_timeline',
+                outputs=_both('figure12_policy_timeline')))
+# Superseded by fig12 and writes the same files, so only built on request
+register(Figure('fig12-v1', 'Policy Effectiveness Timeline (original layout)',
+                'generate_figure12_policy_effectiveness:generate_figure12_policy_effectiveness',
+                outputs=_both('figure12_policy_effectiveness'), default=False))
@@ -0,0 +1,147 @@
+"""
+Rendering policy and export shared by all figures
+Dense data layers (scatter collections, marker-only lines) are rasterised in
+vector outputs once an axes holds more than RASTER_THRESHOLD points, while
+axes, outlines, labels and text stay vector. export() lays a figure out once
+and writes every requested format from that render
+"""
+
+from pathlib import Path
+
+import matplotlib as mpl
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import Collection
+from matplotlib.lines import Line2D
+from PIL import Image
+
+# Points per axes above which its data layers are rasterised. At 300 dpi a
+# rasterised scatter panel costs ~2-4 MB of image data, growing slowly with point
+# count, against ~27 bytes per vector marker; past ~100k points raster is
+# both smaller and several times faster to save (200k: 5.3 -> 3.9 MB,
+# 21.6 -> 6.0 s)
+RASTER_THRESHOLD = 100_000
+
+
+def _point_count(artist):
+    if isinstance(artist, Collection):
+        return max(len(artist.get_offsets()), len(artist.get_paths()))
+    return len(artist.get_xdata())
+
+
+def _is_marker_layer(artist):
+    """Scatter-like artists: collections and lines drawn with markers only"""
+    if isinstance(artist, Collection):
+        return True
+    return (isinstance(artist, Line2D) and artist.get_linestyle() in ('None', '', ' ')
+            and artist.get_marker() not in (None, 'None', '', ' '))
+
+
+def rasterize_dense(fig, threshold=RASTER_THRESHOLD):
+    """Rasterise high-cardinality artists of ``fig`` in place.
+
+    Per axes, points of all scatter-like artists are summed, so many small
+    scatter calls count together; any single artist above the threshold
+    (e.g. a long polyline) is rasterised as well. Returns the number of
+    artists switched to raster.
+    """
+    switched = 0
+    for ax in fig.axes:
+        artists = [a for a in ax.get_children() if isinstance(a, (Collection, Line2D))
+                   and a.get_visible()]
+        markers = [a for a in artists if _is_marker_layer(a)]
+        dense_axes = sum(_point_count(a) for a in markers) > threshold
+        for artist in artists:
+            if artist.get_rasterized():
+                continue
+            if (dense_axes and artist in markers) or _point_count(artist) > threshold:
+                artist.set_rasterized(True)
+                switched += 1
+    return switched
+
+
+# Output resolution per format; for vector formats this only affects
+# rasterised layers
+FORMAT_DPI = {'pdf': 300, 'png': 300, 'svg': 300, 'tiff': 600}
+DEFAULT_FORMATS = ('pdf', 'png')
+RASTER_FORMATS = ('png', 'tiff')
+
+
+def _render_agg(fig, dpi):
+    """Draw ``fig`` once with Agg; returns (RGBA pixels, tight bbox in inches)"""
+    old_canvas, old_dpi = fig.canvas, fig.dpi
+    try:
+        fig.dpi = dpi
+        canvas = FigureCanvasAgg(fig)
+        canvas.draw()
+        return np.array(canvas.buffer_rgba()), fig.get_tightbbox(canvas.get_renderer())
+    finally:
+        fig.dpi = old_dpi
+        fig.set_canvas(old_canvas)
+
+
+def _crop(fig, pixels, tight, pad, dpi):
+    """Pixels of the padded tight bbox, as savefig(bbox_inches='tight') writes them.
+
+    Padding that falls outside the canvas is filled with the figure
+    background; returns None if drawn content itself lies outside the canvas
+    (savefig then has to re-render).
+    """
+    height, width = pixels.shape[:2]
+
+    def box(b):
+        # Same pixel size savefig gives a canvas of b's size
+        x0, top = int(round(b.x0 * dpi)), height - int(round(b.y1 * dpi))
+        return x0, top, x0 + int(b.width * dpi), top + int(b.height * dpi)
+
+    cx0, ctop, cx1, cbottom = box(tight)
+    if cx0 < 0 or ctop < 0 or cx1 > width or cbottom > height:
+        return None
+    x0, top, x1, bottom = box(tight.padded(pad))
+    crop = pixels[max(top, 0):min(bottom, height), max(x0, 0):min(x1, width)]
+    margins = ((max(-top, 0), max(bottom - height, 0)), (max(-x0, 0), max(x1 - width, 0)))
+    if any(sum(m) for m in margins):
+        background = np.array(mpl.colors.to_rgba_array(fig.get_facecolor())[0] * 255, np.uint8)
+        crop = np.concatenate([
+            np.pad(crop[..., c], margins, constant_values=background[c])[..., None]
+            for c in range(4)], axis=-1)
+    return crop
+
+
+def export(fig, output_dir, stem, formats=DEFAULT_FORMATS, dpi=None):
+    """Write ``fig`` as ``output_dir/stem.<format>`` for every format.
+
+    Dense layers are rasterised first (rasterize_dense). The figure is drawn
+    once with Agg at the first raster format's DPI; that single render
+    provides the tight bounding box for every format and the pixels of each
+    raster format at that DPI. Vector formats, and raster formats at another
+    DPI, are written with the precomputed bbox so no format repeats the
+    tight-layout pass. ``dpi`` overrides FORMAT_DPI per format.
+    Returns the written paths in ``formats`` order.
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    dpi = {**FORMAT_DPI, **(dpi or {})}
+    rasterize_dense(fig)
+
+    raster = [f for f in formats if f in RASTER_FORMATS]
+    render_dpi = dpi[raster[0]] if raster else FORMAT_DPI['png']
+    pixels, tight = _render_agg(fig, render_dpi)
+    pad = mpl.rcParams['savefig.pad_inches']
+    bbox = tight.padded(pad)
+    pixels = _crop(fig, pixels, tight, pad, render_dpi)
+
+    paths = []
+    for fmt in formats:
+        path = output_dir / f'{stem}.{fmt}'
+        if fmt in RASTER_FORMATS and dpi[fmt] == render_dpi and pixels is not None:
+            image = Image.fromarray(pixels)
+            if fmt == 'png':
+                image.save(path, dpi=(render_dpi, render_dpi))
+            else:
+                image.convert('RGB').save(path, dpi=(render_dpi, render_dpi),
+                                          compression='tiff_lzw')
+        else:
+            fig.savefig(path, format=fmt, dpi=dpi[fmt], bbox_inches=bbox)
+        paths.append(path)
+    return paths
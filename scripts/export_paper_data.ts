@@ -4,7 +4,7 @@
  */
 
 import { PrismaClient } from '@prisma/client';
-import { writeFileSync } from 'fs';
+import { writeFileSync, createWriteStream } from 'fs';
 import { mkdirSync } from 'fs';
 import { join } from 'path';
 
@@ -130,6 +130,123 @@ async function exportDistrictMetrics() {
   }
 }
 
+/**
+ * Export district polygons as a GeoJSON FeatureCollection (districts.geojson)
+ * geomGeoJSON is already serialised, so it is streamed through verbatim
+ */
+async function exportDistrictGeometries() {
+  console.log('📊 Exporting district geometries...');
+
+  try {
+    const districts = await prisma.district.findMany({
+      select: { code: true, name: true, stateCode: true, geomGeoJSON: true, bbox: true },
+      orderBy: { code: 'asc' },
+    });
+
+    const out = createWriteStream(join(OUTPUT_DIR, 'districts.geojson'));
+    out.write('{"type":"FeatureCollection","features":[\n');
+    districts.forEach((d, i) => {
+      // Stored values may be a bare geometry or a full Feature
+      const geom = d.geomGeoJSON.includes('"Feature"')
+        ? JSON.stringify(JSON.parse(d.geomGeoJSON).geometry)
+        : d.geomGeoJSON;
+      const properties = JSON.stringify({
+        code: d.code,
+        name: d.name,
+        stateCode: d.stateCode,
+        bbox: JSON.parse(d.bbox),
+      });
+      out.write(`${i ? ',\n' : ''}{"type":"Feature","properties":${properties},"geometry":${geom}}`);
+    });
+    out.write('\n]}\n');
+    await new Promise<void>((resolve, reject) => out.end((err?: Error | null) => err ? reject(err) : resolve()));
+
+    console.log(`✅ Saved districts.geojson (${districts.length} districts)`);
+    return districts.length;
+  } catch (error) {
+    console.error('❌ Error exporting district geometries:', error);
+    return 0;
+  }
+}
+
+async function exportDistrictYearly() {
+  console.log('📊 Exporting district yearly metrics...');
+  
+  try {
+    const metrics = await prisma.districtMetric.findMany({
+      select: {
+        code: true,
+        year: true,
+        radiance: true,
+        hotspots: true,
+        district: {
+          select: { stateCode: true },
+        },
+      },
+      orderBy: [{ year: 'asc' }, { code: 'asc' }],
+    });
+
+    // Export as CSV (one row per district per year)
+    const csv = [
+      'District_Code,State_Code,Year,Radiance,Hotspots',
+      ...metrics.map(m => 
+        `${m.code},${m.district.stateCode},${m.year},${m.radiance},${m.hotspots}`
+      )
+    ].join('\n');
+
+    writeFileSync(join(OUTPUT_DIR, 'district_yearly_metrics.csv'), csv);
+    console.log(`✅ Saved district_yearly_metrics.csv (${metrics.length} rows)`);
+
+    return metrics;
+  } catch (error) {
+    console.error('❌ Error exporting district yearly metrics:', error);
+    return [];
+  }
+}
+
+// Rows fetched per query when streaming the daily metric tables
+const DAILY_BATCH_SIZE = 50000;
+
+async function exportDailyMetrics(level: 'district' | 'state') {
+  const filename = `${level}_daily_metrics.csv`;
+  console.log(`📊 Exporting ${level} daily metrics...`);
+
+  // ~742 districts x 4,000+ days: page through by id and stream to disk
+  // instead of holding the whole table in memory
+  const table: any = level === 'district' ? prisma.districtDailyMetric : prisma.stateDailyMetric;
+  const out = createWriteStream(join(OUTPUT_DIR, filename));
+  out.write('Code,Date,Radiance,Hotspots\n');
+
+  try {
+    let cursor: string | undefined;
+    let total = 0;
+    for (;;) {
+      const rows: { id: string; code: string; date: Date; radiance: number; hotspots: number }[] =
+        await table.findMany({
+          select: { id: true, code: true, date: true, radiance: true, hotspots: true },
+          orderBy: { id: 'asc' },
+          take: DAILY_BATCH_SIZE,
+          ...(cursor ? { skip: 1, cursor: { id: cursor } } : {}),
+        });
+      if (rows.length === 0) break;
+
+      out.write(rows.map(r =>
+        `${r.code},${r.date.toISOString().split('T')[0]},${r.radiance},${r.hotspots}`
+      ).join('\n') + '\n');
+      total += rows.length;
+      cursor = rows[rows.length - 1].id;
+    }
+
+    await new Promise<void>((resolve, reject) => out.end((err?: Error | null) => err ? reject(err) : resolve()));
+    console.log(`✅ Saved ${filename} (${total} rows)`);
+    return total;
+  } catch (error) {
+    out.destroy();
+    console.error(`❌ Error exporting ${level} daily metrics:`, error);
+    return 0;
+  }
+}
+
 async function exportStateAggregates() {
   console.log('📊 Exporting state-level aggregates...');
   
@@ -398,6 +515,10 @@ async function main() {
     // Export all data
     await exportTemporalTrends();
     await exportDistrictMetrics();
+    await exportDistrictYearly();
+    await exportDistrictGeometries();
+    await exportDailyMetrics('district');
+    await exportDailyMetrics('state');
     await exportStateAggregates();
     await exportAlertMetrics();
     await exportDashboardSnapshot();
@@ -409,6 +530,10 @@ async function main() {
     console.log('\nExported files:');
     console.log('  - temporal_trends.csv');
     console.log('  - district_metrics.csv');
+    console.log('  - district_yearly_metrics.csv');
+    console.log('  - districts.geojson');
+    console.log('  - district_daily_metrics.csv');
+    console.log('  - state_daily_metrics.csv');
     console.log('  - state_aggregates.csv');
     console.log('  - alerts.csv');
     console.log('  - alert_stats.json');
@@ -10,304 +10,314 @@ import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
 from matplotlib.patches import FancyBboxPatch, Rectangle, FancyArrowPatch
 import numpy as np
+from pathlib import Path
+
+from alps_figures.paths import OUTPUT_DIR
+from alps_figures.render import export
 
 # Configure
-plt.rcParams['font.family'] = 'sans-serif'
-plt.rcParams['font.sans-serif'] = ['Arial', 'DejaVu Sans']
-plt.rcParams['font.size'] = 10
-plt.rcParams['figure.dpi'] = 300
-
-# Create figure
-fig, ax = plt.subplots(figsize=(16, 9))
-ax.set_xlim(2015.5, 2025.5)
-ax.set_ylim(-2, 6)
-
-# Draw main timeline
-ax.axhline(y=0, color='black', linewidth=3, zorder=1)
-
-# Year markers on timeline
-for year in range(2016, 2026):
-    ax.plot([year, year], [-0.1, 0.1], 'k-', linewidth=2, zorder=2)
-    ax.text(year, -0.4, str(year), ha='center', va='top', fontsize=9, fontweight='bold')
-
-# Policy events with detailed specifications
-events = [
-    {
-        'year': 2017,
-        'period': '2016-2018',
-        'name': 'Pre-LED Era',
-        'description': 'Baseline Monitoring',
-        'impact': None,
-        'metrics': 'Establishing baseline metrics',
-        'detail': 'No intervention',
-        'color': '#95a5a6',
-        'y_offset': 0
-    },
-    {
-        'year': 2019,
-        'period': '2019',
-        'name': 'LED Policy Implementation',
-        'description': 'Energy-Radiance Decoupling',
-        'impact': -8.0,
-        'metrics': 'Correlation drops: 0.84 → 0.76',
-        'detail': '20.8% decoupling by 2025',
-        'color': '#2ecc71',
-        'y_offset': 2.5
-    },
-    {
-        'year': 2020,
-        'period': '2020',
-        'name': 'COVID-19 Lockdown',
-        'description': 'Natural Experiment',
-        'impact': -11.0,
-        'metrics': 'Temporary 11% radiance reduction',
-        'detail': 'Restricted activity period',
-        'color': '#e74c3c',
-        'y_offset': -1.2
-    },
-    {
-        'year': 2021.5,
-        'period': '2021-2022',
-        'name': 'LED Retrofitting Acceleration',
-        'description': 'Pilot City Programs',
-        'impact': -27.0,
-        'metrics': '23-31% LPI reduction',
-        'detail': 'Pilot cities implementation',
-        'color': '#3498db',
-        'y_offset': 3.5
-    },
-    {
-        'year': 2023,
-        'period': '2023',
-        'name': 'AI-Regulated Management',
-        'description': 'Adaptive Control Phase',
-        'impact': -18.0,
-        'metrics': 'Automated control systems',
-        'detail': 'Smart infrastructure deployment',
-        'color': '#9b59b6',
-        'y_offset': -1.5
-    },
-    {
-        'year': 2024.5,
-        'period': '2024-2025',
-        'name': 'Adaptive Dimming Technologies',
-        'description': 'Steepest Vulnerability Improvements',
-        'impact': -42.0,
-        'metrics': 'Hospital exceedances: -57.4%',
-        'detail': 'Elderly: -38.9% | Residential: -36.1%',
-        'color': '#f39c12',
-        'y_offset': 4.2
-    }
-]
-
-# Plot each event
-for i, event in enumerate(events):
-    year = event['year']
-    y_offset = event['y_offset']
-    color = event['color']
-    
-    # Timeline marker (large circle)
-    circle = plt.Circle((year, 0), 0.12, color=color, zorder=5, 
-                       edgecolor='black', linewidth=2)
-    ax.add_patch(circle)
-    
-    # Vertical line to event box
-    if y_offset > 0:
-        ax.plot([year, year], [0.12, y_offset - 0.3], color=color, 
-               linewidth=2, linestyle='--', alpha=0.6, zorder=3)
-    else:
-        ax.plot([year, year], [-0.12, y_offset + 0.3], color=color, 
-               linewidth=2, linestyle='--', alpha=0.6, zorder=3)
-    
-    # Event information box
-    box_height = 1.0
-    box_width = 1.6
-    
-    event_box = FancyBboxPatch(
-        (year - box_width/2, y_offset - box_height/2),
-        box_width, box_height,
-        boxstyle="round,pad=0.08",
-        edgecolor=color,
-        facecolor='white',
+STYLE = {
+    'font.family': 'sans-serif',
+    'font.sans-serif': ['Arial', 'DejaVu Sans'],
+    'font.size': 10,
+    'figure.dpi': 300,
+}
+plt.rcParams.update(STYLE)
+
+
+def generate_figure12_policy_effectiveness(output_dir=OUTPUT_DIR, data=None):
+    """Figure 12: Policy Effectiveness Timeline"""
+    print("\n🎨 Generating Figure 12: Policy Effectiveness Timeline...")
+    output_dir = Path(output_dir)
+
+    # Create figure
+    fig, ax = plt.subplots(figsize=(16, 9))
+    ax.set_xlim(2015.5, 2025.5)
+    ax.set_ylim(-2, 6)
+
+    # Draw main timeline
+    ax.axhline(y=0, color='black', linewidth=3, zorder=1)
+
+    # Year markers on timeline
+    for year in range(2016, 2026):
+        ax.plot([year, year], [-0.1, 0.1], 'k-', linewidth=2, zorder=2)
+        ax.text(year, -0.4, str(year), ha='center', va='top', fontsize=9, fontweight='bold')
+
+    # Policy events with detailed specifications
+    events = [
+        {
+            'year': 2017,
+            'period': '2016-2018',
+            'name': 'Pre-LED Era',
+            'description': 'Baseline Monitoring',
+            'impact': None,
+            'metrics': 'Establishing baseline metrics',
+            'detail': 'No intervention',
+            'color': '#95a5a6',
+            'y_offset': 0
+        },
+        {
+            'year': 2019,
+            'period': '2019',
+            'name': 'LED Policy Implementation',
+            'description': 'Energy-Radiance Decoupling',
+            'impact': -8.0,
+            'metrics': 'Correlation drops: 0.84 → 0.76',
+            'detail': '20.8% decoupling by 2025',
+            'color': '#2ecc71',
+            'y_offset': 2.5
+        },
+        {
+            'year': 2020,
+            'period': '2020',
+            'name': 'COVID-19 Lockdown',
+            'description': 'Natural Experiment',
+            'impact': -11.0,
+            'metrics': 'Temporary 11% radiance reduction',
+            'detail': 'Restricted activity period',
+            'color': '#e74c3c',
+            'y_offset': -1.2
+        },
+        {
+            'year': 2021.5,
+            'period': '2021-2022',
+            'name': 'LED Retrofitting Acceleration',
+            'description': 'Pilot City Programs',
+            'impact': -27.0,
+            'metrics': '23-31% LPI reduction',
+            'detail': 'Pilot cities implementation',
+            'color': '#3498db',
+            'y_offset': 3.5
+        },
+        {
+            'year': 2023,
+            'period': '2023',
+            'name': 'AI-Regulated Management',
+            'description': 'Adaptive Control Phase',
+            'impact': -18.0,
+            'metrics': 'Automated control systems',
+            'detail': 'Smart infrastructure deployment',
+            'color': '#9b59b6',
+            'y_offset': -1.5
+        },
+        {
+            'year': 2024.5,
+            'period': '2024-2025',
+            'name': 'Adaptive Dimming Technologies',
+            'description': 'Steepest Vulnerability Improvements',
+            'impact': -42.0,
+            'metrics': 'Hospital exceedances: -57.4%',
+            'detail': 'Elderly: -38.9% | Residential: -36.1%',
+            'color': '#f39c12',
+            'y_offset': 4.2
+        }
+    ]
+
+    # Plot each event
+    for i, event in enumerate(events):
+        year = event['year']
+        y_offset = event['y_offset']
+        color = event['color']
+
+        # Timeline marker (large circle)
+        circle = plt.Circle((year, 0), 0.12, color=color, zorder=5, 
+                           edgecolor='black', linewidth=2)
+        ax.add_patch(circle)
+
+        # Vertical line to event box
+        if y_offset > 0:
+            ax.plot([year, year], [0.12, y_offset - 0.3], color=color, 
+                   linewidth=2, linestyle='--', alpha=0.6, zorder=3)
+        else:
+            ax.plot([year, year], [-0.12, y_offset + 0.3], color=color, 
+                   linewidth=2, linestyle='--', alpha=0.6, zorder=3)
+
+        # Event information box
+        box_height = 1.0
+        box_width = 1.6
+
+        event_box = FancyBboxPatch(
+            (year - box_width/2, y_offset - box_height/2),
+            box_width, box_height,
+            boxstyle="round,pad=0.08",
+            edgecolor=color,
+            facecolor='white',
+            linewidth=2.5,
+            zorder=4
+        )
+        ax.add_patch(event_box)
+
+        # Event name (bold)
+        ax.text(year, y_offset + 0.35, event['name'],
+               ha='center', va='center', fontsize=10, fontweight='bold',
+               color=color, wrap=True)
+
+        # Description (italic)
+        ax.text(year, y_offset + 0.15, event['description'],
+               ha='center', va='center', fontsize=8, style='italic',
+               color='#2c3e50')
+
+        # Impact percentage (if exists)
+        if event['impact'] is not None:
+            impact_text = f"{event['impact']:.1f}%"
+            ax.text(year, y_offset - 0.05, impact_text,
+                   ha='center', va='center', fontsize=12, fontweight='bold',
+                   color=color)
+        else:
+            ax.text(year, y_offset - 0.05, 'Baseline',
+                   ha='center', va='center', fontsize=10, fontweight='bold',
+                   color=color)
+
+        # Metrics (below impact)
+        ax.text(year, y_offset - 0.25, event['metrics'],
+               ha='center', va='center', fontsize=7,
+               color='#34495e', style='italic')
+
+        # Additional detail
+        ax.text(year, y_offset - 0.38, event['detail'],
+               ha='center', va='center', fontsize=6,
+               color='#7f8c8d', style='italic')
+
+    # Error bars (95% CI) for events with impacts
+    error_bar_events = [
+        {'year': 2019, 'impact': -8.0, 'ci': 1.8},
+        {'year': 2020, 'impact': -11.0, 'ci': 1.5},
+        {'year': 2021.5, 'impact': -27.0, 'ci': 3.5},
+        {'year': 2023, 'impact': -18.0, 'ci': 2.8},
+        {'year': 2024.5, 'impact': -42.0, 'ci': 3.5},
+    ]
+
+    for eb in error_bar_events:
+        # Small error bar near the timeline marker
+        ax.errorbar(eb['year'], 0, yerr=0.15, fmt='none', 
+                   ecolor='black', capsize=4, capthick=2, zorder=6)
+
+    # Overall effectiveness summary box
+    summary_box = FancyBboxPatch(
+        (2016, 4.8), 4.0, 1.0,
+        boxstyle="round,pad=0.1",
+        edgecolor='#2c3e50',
+        facecolor='#ecf0f1',
         linewidth=2.5,
-        zorder=4
+        alpha=0.95,
+        zorder=7
     )
-    ax.add_patch(event_box)
-    
-    # Event name (bold)
-    ax.text(year, y_offset + 0.35, event['name'],
-           ha='center', va='center', fontsize=10, fontweight='bold',
-           color=color, wrap=True)
-    
-    # Description (italic)
-    ax.text(year, y_offset + 0.15, event['description'],
-           ha='center', va='center', fontsize=8, style='italic',
-           color='#2c3e50')
-    
-    # Impact percentage (if exists)
-    if event['impact'] is not None:
-        impact_text = f"{event['impact']:.1f}%"
-        ax.text(year, y_offset - 0.05, impact_text,
-               ha='center', va='center', fontsize=12, fontweight='bold',
-               color=color)
-    else:
-        ax.text(year, y_offset - 0.05, 'Baseline',
-               ha='center', va='center', fontsize=10, fontweight='bold',
-               color=color)
-    
-    # Metrics (below impact)
-    ax.text(year, y_offset - 0.25, event['metrics'],
-           ha='center', va='center', fontsize=7,
-           color='#34495e', style='italic')
-    
-    # Additional detail
-    ax.text(year, y_offset - 0.38, event['detail'],
-           ha='center', va='center', fontsize=6,
-           color='#7f8c8d', style='italic')
-
-# Error bars (95% CI) for events with impacts
-error_bar_events = [
-    {'year': 2019, 'impact': -8.0, 'ci': 1.8},
-    {'year': 2020, 'impact': -11.0, 'ci': 1.5},
-    {'year': 2021.5, 'impact': -27.0, 'ci': 3.5},
-    {'year': 2023, 'impact': -18.0, 'ci': 2.8},
-    {'year': 2024.5, 'impact': -42.0, 'ci': 3.5},
-]
-
-for eb in error_bar_events:
-    # Small error bar near the timeline marker
-    ax.errorbar(eb['year'], 0, yerr=0.15, fmt='none', 
-               ecolor='black', capsize=4, capthick=2, zorder=6)
-
-# Overall effectiveness summary box
-summary_box = FancyBboxPatch(
-    (2016, 4.8), 4.0, 1.0,
-    boxstyle="round,pad=0.1",
-    edgecolor='#2c3e50',
-    facecolor='#ecf0f1',
-    linewidth=2.5,
-    alpha=0.95,
-    zorder=7
-)
-ax.add_patch(summary_box)
-
-ax.text(2018, 5.6, 'Overall Effectiveness Summary', 
-       fontsize=11, fontweight='bold', ha='center', color='#2c3e50')
-
-summary_stats = [
-    'Total cumulative reduction: 106%',
-    'Energy-Radiance decoupling: 20.8%',
-    'Peak vulnerability reduction: 57.4%',
-    'Steepest phase: 2024-2025 (adaptive dimming)'
-]
-
-summary_y = 5.35
-for stat in summary_stats:
-    ax.text(2018, summary_y, f'• {stat}', fontsize=8, ha='center', color='#34495e')
-    summary_y -= 0.18
-
-# Statistical notes box
-notes_box = FancyBboxPatch(
-    (2021.5, 4.8), 3.5, 1.0,
-    boxstyle="round,pad=0.1",
-    edgecolor='#34495e',
-    facecolor='#ecf0f1',
-    linewidth=2.5,
-    alpha=0.95,
-    zorder=7
-)
-ax.add_patch(notes_box)
-
-ax.text(2023.25, 5.6, 'Statistical Notes', 
-       fontsize=11, fontweight='bold', ha='center', color='#34495e')
-
-notes = [
-    'Error bars: 95% confidence intervals',
-    'Bootstrap analysis: 10,000 iterations',
-    'Natural experiment: COVID-19 (2020)',
-    'All metrics: District-level aggregation'
-]
-
-notes_y = 5.35
-for note in notes:
-    ax.text(2023.25, notes_y, f'• {note}', fontsize=7, ha='center', 
-           style='italic', color='#34495e')
-    notes_y -= 0.18
-
-# Legend
-legend_elements = [
-    mpatches.Patch(facecolor='#2ecc71', edgecolor='black', linewidth=1.5,
-                  label='LED Policy (2019)'),
-    mpatches.Patch(facecolor='#e74c3c', edgecolor='black', linewidth=1.5,
-                  label='COVID-19 Natural Experiment (2020)'),
-    mpatches.Patch(facecolor='#3498db', edgecolor='black', linewidth=1.5,
-                  label='LED Retrofitting (2021-2022)'),
-    mpatches.Patch(facecolor='#9b59b6', edgecolor='black', linewidth=1.5,
-                  label='AI-Regulated Management (2023)'),
-    mpatches.Patch(facecolor='#f39c12', edgecolor='black', linewidth=1.5,
-                  label='Adaptive Dimming (2024-2025)'),
-]
-
-ax.legend(handles=legend_elements, loc='lower left', fontsize=8, 
-         framealpha=0.95, ncol=2)
-
-# Remove axis spines and ticks
-ax.spines['top'].set_visible(False)
-ax.spines['right'].set_visible(False)
-ax.spines['left'].set_visible(False)
-ax.spines['bottom'].set_visible(False)
-ax.set_yticks([])
-ax.set_xticks([])
-
-# Title
-fig.suptitle('Figure 12: Policy Intervention Timeline and Effectiveness Metrics (2016-2025)',
-            fontsize=14, fontweight='bold', y=0.96)
-
-subtitle = (
-    'Chronological diagram showing major policy milestones with quantified impacts and 95% confidence intervals. '
-    'LED policy (2019) triggered 20.8% energy-radiance decoupling. AI-regulated phase (2023-2025) achieved '
-    'steepest vulnerability reductions: hospital exceedances -57.4%, elderly exposure -38.9%, residential -36.1%.'
-)
-ax.text(2020.5, -1.2, subtitle, fontsize=9, ha='center', style='italic', wrap=True)
-
-# Caption
-caption = (
-    "Figure 12. Policy Intervention Timeline and Effectiveness Metrics. Annotated chronological diagram illustrating "
-    "major policy milestones and quantified impacts from 2016-2025. LED policy implementation (2019) triggered 20.8% "
-    "energy-radiance decoupling by 2025. COVID-19 lockdown (2020) provided natural experiment demonstrating 11% radiance "
-    "reduction potential during restricted activity periods. AI-regulated management phase (2023-2025) achieved steepest "
-    "improvements in vulnerability reduction: hospital-proximate exceedances declined 57.4%, elderly exposure decreased "
-    "38.9%, and residential areas improved 36.1%. Error bars represent 95% confidence intervals from bootstrap analysis "
-    "(10,000 iterations). All metrics derived from district-level aggregation across 742 monitored regions."
-)
-fig.text(0.5, 0.02, caption, wrap=True, ha='center', fontsize=8, style='italic')
-
-plt.tight_layout(rect=[0, 0.06, 1, 0.94])
-
-# Save
-output_pdf = 'd:/agentic-light-sentinel/tmp/exports/figures/figure12_policy_effectiveness.pdf'
-output_png = 'd:/agentic-light-sentinel/tmp/exports/figures/figure12_policy_effectiveness.png'
-
-plt.savefig(output_pdf, dpi=300, bbox_inches='tight')
-print(f"✅ Saved: {output_pdf}")
-
-plt.savefig(output_png, dpi=300, bbox_inches='tight')
-print(f"✅ Saved: {output_png}")
-
-plt.close()
-
-print("\n🎯 Figure 12 (Policy Effectiveness Timeline) FIXED VERSION generated successfully!")
-print("   ✓ Clean timeline layout (2016-2025)")
-print("   ✓ 6 major policy interventions:")
-print("     • 2016-2018: Pre-LED baseline monitoring")
-print("     • 2019: LED policy → 0.84→0.76 correlation drop (-8.0%)")
-print("     • 2020: COVID-19 lockdown → 11% reduction")
-print("     • 2021-2022: LED retrofitting → 23-31% LPI reduction (-27.0%)")
-print("     • 2023: AI-regulated management (-18.0%)")
-print("     • 2024-2025: Adaptive dimming → -57.4% hospital exceedances (-42.0%)")
-print("   ✓ 95% confidence intervals (error bars)")
-print("   ✓ Overall effectiveness summary panel")
-print("   ✓ Statistical notes panel")
-print("   ✓ Color-coded event boxes with detailed metrics")
-print("   ✓ Format: PNG at 300 DPI (IEEE compliant)")
-print("   ✓ No emoji warnings - publication ready!")
+    ax.add_patch(summary_box)
+
+    ax.text(2018, 5.6, 'Overall Effectiveness Summary', 
+           fontsize=11, fontweight='bold', ha='center', color='#2c3e50')
+
+    summary_stats = [
+        'Total cumulative reduction: 106%',
+        'Energy-Radiance decoupling: 20.8%',
+        'Peak vulnerability reduction: 57.4%',
+        'Steepest phase: 2024-2025 (adaptive dimming)'
+    ]
+
+    summary_y = 5.35
+    for stat in summary_stats:
+        ax.text(2018, summary_y, f'• {stat}', fontsize=8, ha='center', color='#34495e')
+        summary_y -= 0.18
+
+    # Statistical notes box
+    notes_box = FancyBboxPatch(
+        (2021.5, 4.8), 3.5, 1.0,
+        boxstyle="round,pad=0.1",
+        edgecolor='#34495e',
+        facecolor='#ecf0f1',
+        linewidth=2.5,
+        alpha=0.95,
+        zorder=7
+    )
+    ax.add_patch(notes_box)
+
+    ax.text(2023.25, 5.6, 'Statistical Notes', 
+           fontsize=11, fontweight='bold', ha='center', color='#34495e')
+
+    notes = [
+        'Error bars: 95% confidence intervals',
+        'Bootstrap analysis: 10,000 iterations',
+        'Natural experiment: COVID-19 (2020)',
+        'All metrics: District-level aggregation'
+    ]
+
+    notes_y = 5.35
+    for note in notes:
+        ax.text(2023.25, notes_y, f'• {note}', fontsize=7, ha='center', 
+               style='italic', color='#34495e')
+        notes_y -= 0.18
+
+    # Legend
+    legend_elements = [
+        mpatches.Patch(facecolor='#2ecc71', edgecolor='black', linewidth=1.5,
+                      label='LED Policy (2019)'),
+        mpatches.Patch(facecolor='#e74c3c', edgecolor='black', linewidth=1.5,
+                      label='COVID-19 Natural Experiment (2020)'),
+        mpatches.Patch(facecolor='#3498db', edgecolor='black', linewidth=1.5,
+                      label='LED Retrofitting (2021-2022)'),
+        mpatches.Patch(facecolor='#9b59b6', edgecolor='black', linewidth=1.5,
+                      label='AI-Regulated Management (2023)'),
+        mpatches.Patch(facecolor='#f39c12', edgecolor='black', linewidth=1.5,
+                      label='Adaptive Dimming (2024-2025)'),
+    ]
+
+    ax.legend(handles=legend_elements, loc='lower left', fontsize=8, 
+             framealpha=0.95, ncol=2)
+
+    # Remove axis spines and ticks
+    ax.spines['top'].set_visible(False)
+    ax.spines['right'].set_visible(False)
+    ax.spines['left'].set_visible(False)
+    ax.spines['bottom'].set_visible(False)
+    ax.set_yticks([])
+    ax.set_xticks([])
+
+    # Title
+    fig.suptitle('Figure 12: Policy Intervention Timeline and Effectiveness Metrics (2016-2025)',
+                fontsize=14, fontweight='bold', y=0.96)
+
+    subtitle = (
+        'Chronological diagram showing major policy milestones with quantified impacts and 95% confidence intervals. '
+        'LED policy (2019) triggered 20.8% energy-radiance decoupling. AI-regulated phase (2023-2025) achieved '
+        'steepest vulnerability reductions: hospital exceedances -57.4%, elderly exposure -38.9%, residential -36.1%.'
+    )
+    ax.text(2020.5, -1.2, subtitle, fontsize=9, ha='center', style='italic', wrap=True)
+
+    # Caption
+    caption = (
+        "Figure 12. Policy Intervention Timeline and Effectiveness Metrics. Annotated chronological diagram illustrating "
+        "major policy milestones and quantified impacts from 2016-2025. LED policy implementation (2019) triggered 20.8% "
+        "energy-radiance decoupling by 2025. COVID-19 lockdown (2020) provided natural experiment demonstrating 11% radiance "
+        "reduction potential during restricted activity periods. AI-regulated management phase (2023-2025) achieved steepest "
+        "improvements in vulnerability reduction: hospital-proximate exceedances declined 57.4%, elderly exposure decreased "
+        "38.9%, and residential areas improved 36.1%. Error bars represent 95% confidence intervals from bootstrap analysis "
+        "(10,000 iterations). All metrics derived from district-level aggregation across 742 monitored regions."
+    )
+    fig.text(0.5, 0.02, caption, wrap=True, ha='center', fontsize=8, style='italic')
+
+    plt.tight_layout(rect=[0, 0.06, 1, 0.94])
+
+    # Save every format from a single render
+    for path in export(fig, output_dir, 'figure12_policy_effectiveness'):
+        print(f"✅ Saved: {path}")
+
+    plt.close()
+
+
+if __name__ == '__main__':
+    generate_figure12_policy_effectiveness()
+    print("\n🎯 Figure 12 (Policy Effectiveness Timeline) FIXED VERSION generated successfully!")
+    print("   ✓ Clean timeline layout (2016-2025)")
+    print("   ✓ 6 major policy interventions:")
+    print("     • 2016-2018: Pre-LED baseline monitoring")
+    print("     • 2019: LED policy → 0.84→0.76 correlation drop (-8.0%)")
+    print("     • 2020: COVID-19 lockdown → 11% reduction")
+    print("     • 2021-2022: LED retrofitting → 23-31% LPI reduction (-27.0%)")
+    print("     • 2023: AI-regulated management (-18.0%)")
+    print("     • 2024-2025: Adaptive dimming → -57.4% hospital exceedances (-42.0%)")
+    print("   ✓ 95% confidence intervals (error bars)")
+    print("   ✓ Overall effectiveness summary panel")
+    print("   ✓ Statistical notes panel")
+    print("   ✓ Color-coded event boxes with detailed metrics")
+    print("   ✓ Format: PNG at 300 DPI (IEEE compliant)")
+    print("   ✓ No emoji warnings - publication ready!")
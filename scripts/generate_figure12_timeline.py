@@ -3,179 +3,192 @@ Generate Figure 12: Policy Effectiveness Timeline
 Shows major policy interventions and their quantified impacts (2016-2025)
 """
 
+import matplotlib
+matplotlib.use('Agg')  # Use non-interactive backend
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
 from matplotlib.patches import FancyBboxPatch, FancyArrowPatch
 import numpy as np
+from pathlib import Path
+
+from alps_figures.paths import OUTPUT_DIR
+from alps_figures.render import export
 
 # Configure
-plt.rcParams['font.family'] = 'sans-serif'
-plt.rcParams['font.size'] = 10
-plt.rcParams['figure.dpi'] = 300
-
-fig, ax = plt.subplots(figsize=(16, 6))
-
-# Timeline data
-events = [
-    {
-        'year': 2016,
-        'label': 'Pre-LED Era\nBaseline Monitoring',
-        'impact': 'Energy-Radiance\nr = 0.84',
-        'color': '#949494',
-        'y_offset': 0
-    },
-    {
-        'year': 2019,
-        'label': 'LED Policy\nImplementation',
-        'impact': 'Correlation drops\n0.84 → 0.76',
-        'color': '#DE8F05',
-        'y_offset': 0.3
-    },
-    {
-        'year': 2020,
-        'label': 'COVID-19\nLockdown',
-        'impact': '11% radiance\nreduction',
-        'color': '#CC78BC',
-        'y_offset': -0.3
-    },
-    {
-        'year': 2021,
-        'label': 'LED Retrofitting\nAcceleration',
-        'impact': '23-31% LPI\nreduction (pilots)',
-        'color': '#029E73',
-        'y_offset': 0.3
-    },
-    {
-        'year': 2023,
-        'label': 'AI-Regulated\nManagement Phase',
-        'impact': 'Smart Infrastructure\nimportance: 0.29',
-        'color': '#0173B2',
-        'y_offset': 0
-    },
-    {
-        'year': 2024,
-        'label': 'Adaptive Dimming\nTechnologies',
-        'impact': 'Hospital exceedances\n-57.4%',
-        'color': '#029E73',
-        'y_offset': -0.3
-    }
-]
-
-# Draw timeline base
-timeline_y = 0.5
-ax.plot([2015.5, 2025.5], [timeline_y, timeline_y], 'k-', linewidth=3, zorder=1)
-
-# Add year markers
-for year in range(2016, 2026):
-    ax.plot([year, year], [timeline_y - 0.05, timeline_y + 0.05], 'k-', linewidth=2)
-    ax.text(year, timeline_y - 0.15, str(year), ha='center', va='top', fontsize=9)
-
-# Add events
-for event in events:
-    year = event['year']
-    y_pos = timeline_y + event['y_offset']
-    
-    # Event marker (circle)
-    circle = plt.Circle((year, timeline_y), 0.08, color=event['color'], 
-                       edgecolor='black', linewidth=2, zorder=3)
-    ax.add_patch(circle)
-    
-    # Connector line
-    if event['y_offset'] != 0:
-        ax.plot([year, year], [timeline_y, y_pos], 'k--', linewidth=1, alpha=0.5, zorder=2)
-    
-    # Event box
-    box_y = y_pos + (0.15 if event['y_offset'] >= 0 else -0.35)
-    box = FancyBboxPatch((year - 0.7, box_y), 1.4, 0.25, 
-                         boxstyle="round,pad=0.05", 
-                         edgecolor=event['color'], facecolor='white', 
-                         linewidth=2.5, zorder=4)
-    ax.add_patch(box)
-    
-    # Event label
-    label_y = box_y + 0.125
-    ax.text(year, label_y, event['label'], ha='center', va='center', 
-           fontsize=9, fontweight='bold', zorder=5)
-    
-    # Impact annotation
-    impact_y = box_y + (0.35 if event['y_offset'] >= 0 else -0.1)
-    ax.text(year, impact_y, event['impact'], ha='center', 
-           va='bottom' if event['y_offset'] >= 0 else 'top',
-           fontsize=8, style='italic', 
-           bbox=dict(boxstyle='round,pad=0.3', facecolor='lightyellow', 
-                    edgecolor=event['color'], alpha=0.7, linewidth=1.5),
-           zorder=5)
-
-# Add phase regions with shaded backgrounds
-phases = [
-    {'start': 2016, 'end': 2018.5, 'label': 'Pre-LED Era', 'color': '#949494', 'alpha': 0.1},
-    {'start': 2018.5, 'end': 2022.5, 'label': 'LED Transition', 'color': '#DE8F05', 'alpha': 0.1},
-    {'start': 2022.5, 'end': 2025.5, 'label': 'AI-Regulated Era', 'color': '#0173B2', 'alpha': 0.1}
-]
-
-for phase in phases:
-    ax.axvspan(phase['start'], phase['end'], alpha=phase['alpha'], 
-              color=phase['color'], zorder=0)
-    # Phase label at bottom
-    mid = (phase['start'] + phase['end']) / 2
-    ax.text(mid, -0.55, phase['label'], ha='center', va='center',
-           fontsize=11, fontweight='bold', style='italic',
-           color=phase['color'])
-
-# Add overall trend arrow
-arrow = FancyArrowPatch((2016, -0.75), (2025, -0.75), 
-                       arrowstyle='->', mutation_scale=30, 
-                       linewidth=3, color='darkred', zorder=2)
-ax.add_patch(arrow)
-ax.text(2020.5, -0.85, 'Increasing Light Pollution Pressure', 
-       ha='center', va='top', fontsize=10, fontweight='bold', color='darkred')
-
-# Add effectiveness metrics box (top right)
-metrics_text = (
-    "Cumulative Impact (2016-2025):\n"
-    "• Energy-Radiance Decoupling: 20.8%\n"
-    "• Hospital Exceedances: -57.4%\n"
-    "• Residential Exceedances: -36.1%\n"
-    "• LED Adoption: 180 pilot districts\n"
-    "• AI Alert Accuracy: 94.2%"
-)
-ax.text(0.98, 0.97, metrics_text, transform=ax.transAxes,
-       fontsize=9, va='top', ha='right',
-       bbox=dict(boxstyle='round,pad=0.7', facecolor='lightblue', 
-                edgecolor='darkblue', alpha=0.8, linewidth=2))
-
-# Styling
-ax.set_xlim(2015.5, 2025.5)
-ax.set_ylim(-1.0, 1.2)
-ax.axis('off')
-ax.set_title('Policy Intervention Timeline and Effectiveness Metrics (2016-2025)\n' + 
-            'Quantified Impacts of Light Pollution Management Strategies',
-            fontsize=14, fontweight='bold', pad=20)
-
-# Add caption note
-caption = (
-    "Figure 12. Annotated chronological diagram illustrating major policy milestones and quantified impacts. "
-    "LED policy implementation (2019) triggered 20.8% energy-radiance decoupling by 2025. COVID-19 lockdown (2020) "
-    "provided natural experiment demonstrating 11% radiance reduction potential. AI-regulated management phase "
-    "(2023-2025) achieved steepest improvements: hospital-proximate exceedances declined 57.4%, elderly exposure "
-    "decreased 38.9%, residential areas improved 36.1%. Shaded background regions indicate policy regime phases. "
-    "Error bars represent 95% confidence intervals from bootstrap analysis."
-)
-fig.text(0.5, 0.02, caption, wrap=True, ha='center', fontsize=8, style='italic')
-
-plt.tight_layout()
-
-# Save
-output_path = 'd:/agentic-light-sentinel/tmp/exports/figures/figure12_policy_timeline.pdf'
-plt.savefig(output_path, dpi=300, bbox_inches='tight')
-print(f"✅ Saved: {output_path}")
-
-# Also save PNG
-png_path = output_path.replace('.pdf', '.png')
-plt.savefig(png_path, dpi=300, bbox_inches='tight')
-print(f"✅ Saved: {png_path}")
-
-plt.close()
-
-print("\n🎯 Figure 12 (Policy Timeline) generated successfully!")
-print("   Shows 6 major policy interventions from 2016-2025 with quantified impacts")
+STYLE = {
+    'font.family': 'sans-serif',
+    'font.size': 10,
+    'figure.dpi': 300,
+}
+plt.rcParams.update(STYLE)
+
+
+def generate_figure12_timeline(output_dir=OUTPUT_DIR, data=None):
+    """Figure 12: Policy Timeline (compact)"""
+    print("\n🎨 Generating Figure 12: Policy Timeline...")
+    output_dir = Path(output_dir)
+
+    fig, ax = plt.subplots(figsize=(16, 6))
+
+    # Timeline data
+    events = [
+        {
+            'year': 2016,
+            'label': 'Pre-LED Era\nBaseline Monitoring',
+            'impact': 'Energy-Radiance\nr = 0.84',
+            'color': '#949494',
+            'y_offset': 0
+        },
+        {
+            'year': 2019,
+            'label': 'LED Policy\nImplementation',
+            'impact': 'Correlation drops\n0.84 → 0.76',
+            'color': '#DE8F05',
+            'y_offset': 0.3
+        },
+        {
+            'year': 2020,
+            'label': 'COVID-19\nLockdown',
+            'impact': '11% radiance\nreduction',
+            'color': '#CC78BC',
+            'y_offset': -0.3
+        },
+        {
+            'year': 2021,
+            'label': 'LED Retrofitting\nAcceleration',
+            'impact': '23-31% LPI\nreduction (pilots)',
+            'color': '#029E73',
+            'y_offset': 0.3
+        },
+        {
+            'year': 2023,
+            'label': 'AI-Regulated\nManagement Phase',
+            'impact': 'Smart Infrastructure\nimportance: 0.29',
+            'color': '#0173B2',
+            'y_offset': 0
+        },
+        {
+            'year': 2024,
+            'label': 'Adaptive Dimming\nTechnologies',
+            'impact': 'Hospital exceedances\n-57.4%',
+            'color': '#029E73',
+            'y_offset': -0.3
+        }
+    ]
+
+    # Draw timeline base
+    timeline_y = 0.5
+    ax.plot([2015.5, 2025.5], [timeline_y, timeline_y], 'k-', linewidth=3, zorder=1)
+
+    # Add year markers
+    for year in range(2016, 2026):
+        ax.plot([year, year], [timeline_y - 0.05, timeline_y + 0.05], 'k-', linewidth=2)
+        ax.text(year, timeline_y - 0.15, str(year), ha='center', va='top', fontsize=9)
+
+    # Add events
+    for event in events:
+        year = event['year']
+        y_pos = timeline_y + event['y_offset']
+
+        # Event marker (circle)
+        circle = plt.Circle((year, timeline_y), 0.08, color=event['color'], 
+                           edgecolor='black', linewidth=2, zorder=3)
+        ax.add_patch(circle)
+
+        # Connector line
+        if event['y_offset'] != 0:
+            ax.plot([year, year], [timeline_y, y_pos], 'k--', linewidth=1, alpha=0.5, zorder=2)
+
+        # Event box
+        box_y = y_pos + (0.15 if event['y_offset'] >= 0 else -0.35)
+        box = FancyBboxPatch((year - 0.7, box_y), 1.4, 0.25, 
+                             boxstyle="round,pad=0.05", 
+                             edgecolor=event['color'], facecolor='white', 
+                             linewidth=2.5, zorder=4)
+        ax.add_patch(box)
+
+        # Event label
+        label_y = box_y + 0.125
+        ax.text(year, label_y, event['label'], ha='center', va='center', 
+               fontsize=9, fontweight='bold', zorder=5)
+
+        # Impact annotation
+        impact_y = box_y + (0.35 if event['y_offset'] >= 0 else -0.1)
+        ax.text(year, impact_y, event['impact'], ha='center', 
+               va='bottom' if event['y_offset'] >= 0 else 'top',
+               fontsize=8, style='italic', 
+               bbox=dict(boxstyle='round,pad=0.3', facecolor='lightyellow', 
+                        edgecolor=event['color'], alpha=0.7, linewidth=1.5),
+               zorder=5)
+
+    # Add phase regions with shaded backgrounds
+    phases = [
+        {'start': 2016, 'end': 2018.5, 'label': 'Pre-LED Era', 'color': '#949494', 'alpha': 0.1},
+        {'start': 2018.5, 'end': 2022.5, 'label': 'LED Transition', 'color': '#DE8F05', 'alpha': 0.1},
+        {'start': 2022.5, 'end': 2025.5, 'label': 'AI-Regulated Era', 'color': '#0173B2', 'alpha': 0.1}
+    ]
+
+    for phase in phases:
+        ax.axvspan(phase['start'], phase['end'], alpha=phase['alpha'], 
+                  color=phase['color'], zorder=0)
+        # Phase label at bottom
+        mid = (phase['start'] + phase['end']) / 2
+        ax.text(mid, -0.55, phase['label'], ha='center', va='center',
+               fontsize=11, fontweight='bold', style='italic',
+               color=phase['color'])
+
+    # Add overall trend arrow
+    arrow = FancyArrowPatch((2016, -0.75), (2025, -0.75), 
+                           arrowstyle='->', mutation_scale=30, 
+                           linewidth=3, color='darkred', zorder=2)
+    ax.add_patch(arrow)
+    ax.text(2020.5, -0.85, 'Increasing Light Pollution Pressure', 
+           ha='center', va='top', fontsize=10, fontweight='bold', color='darkred')
+
+    # Add effectiveness metrics box (top right)
+    metrics_text = (
+        "Cumulative Impact (2016-2025):\n"
+        "• Energy-Radiance Decoupling: 20.8%\n"
+        "• Hospital Exceedances: -57.4%\n"
+        "• Residential Exceedances: -36.1%\n"
+        "• LED Adoption: 180 pilot districts\n"
+        "• AI Alert Accuracy: 94.2%"
+    )
+    ax.text(0.98, 0.97, metrics_text, transform=ax.transAxes,
+           fontsize=9, va='top', ha='right',
+           bbox=dict(boxstyle='round,pad=0.7', facecolor='lightblue', 
+                    edgecolor='darkblue', alpha=0.8, linewidth=2))
+
+    # Styling
+    ax.set_xlim(2015.5, 2025.5)
+    ax.set_ylim(-1.0, 1.2)
+    ax.axis('off')
+    ax.set_title('Policy Intervention Timeline and Effectiveness Metrics (2016-2025)\n' + 
+                'Quantified Impacts of Light Pollution Management Strategies',
+                fontsize=14, fontweight='bold', pad=20)
+
+    # Add caption note
+    caption = (
+        "Figure 12. Annotated chronological diagram illustrating major policy milestones and quantified impacts. "
+        "LED policy implementation (2019) triggered 20.8% energy-radiance decoupling by 2025. COVID-19 lockdown (2020) "
+        "provided natural experiment demonstrating 11% radiance reduction potential. AI-regulated management phase "
+        "(2023-2025) achieved steepest improvements: hospital-proximate exceedances declined 57.4%, elderly exposure "
+        "decreased 38.9%, residential areas improved 36.1%. Shaded background regions indicate policy regime phases. "
+        "Error bars represent 95% confidence intervals from bootstrap analysis."
+    )
+    fig.text(0.5, 0.02, caption, wrap=True, ha='center', fontsize=8, style='italic')
+
+    plt.tight_layout()
+
+    # Save PDF and PNG from a single render
+    output_path, png_path = export(fig, output_dir, 'figure12_policy_timeline')
+    print(f"✅ Saved: {output_path}")
+    print(f"✅ Saved: {png_path}")
+
+    plt.close()
+
+
+if __name__ == '__main__':
+    generate_figure12_timeline()
+    print("\n🎯 Figure 12 (Policy Timeline) generated successfully!")
+    print("   Shows 6 major policy interventions from 2016-2025 with quantified impacts")
@@ -9,372 +9,394 @@ import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
 from matplotlib.patches import Rectangle, Polygon, FancyBboxPatch
 import numpy as np
+from pathlib import Path
+from types import SimpleNamespace
+
+from alps_analytics.spatial.polygon import INDIA_OUTLINE, PolygonIndex
+from alps_figures.paths import OUTPUT_DIR
+from alps_figures.render import export
 
 # Configure
-plt.rcParams['font.family'] = 'sans-serif'
-plt.rcParams['font.sans-serif'] = ['Arial', 'DejaVu Sans']
-plt.rcParams['font.size'] = 10
-plt.rcParams['figure.dpi'] = 300
-
-# Create figure with 3 panels
-fig = plt.figure(figsize=(18, 6))
-
-# Color scheme for coverage levels
-colors = {
-    'high': '#029E73',      # Green (>90%)
-    'medium': '#ECE133',    # Yellow (60-90%)
-    'low': '#CC78BC',       # Red (<60%)
-    'border': '#000000'
+STYLE = {
+    'font.family': 'sans-serif',
+    'font.sans-serif': ['Arial', 'DejaVu Sans'],
+    'font.size': 10,
+    'figure.dpi': 300,
 }
-
-# ============================================================================
-# PANEL (a): Geographic Distribution of Districts
-# ============================================================================
-ax1 = plt.subplot(131)
-
-# Simplified India outline (approximate coordinates)
-# Using normalized coordinates for India's shape
-india_x = np.array([70, 71, 73, 75, 77, 80, 83, 86, 88, 92, 95, 97, 97, 95, 93, 90, 
-                   88, 85, 83, 80, 77, 75, 73, 72, 71, 70, 68, 68, 69, 70])
-india_y = np.array([35, 33, 31, 30, 29, 28, 27, 26, 25, 24, 23, 22, 20, 18, 16, 14, 
-                   12, 10, 9, 8, 8, 9, 10, 12, 15, 20, 25, 30, 33, 35])
-
-# Draw India outline
-ax1.plot(india_x, india_y, 'k-', linewidth=2.5, zorder=3)
-ax1.fill(india_x, india_y, color='lightgray', alpha=0.3, zorder=1)
-
-# Simulate district distribution with coverage levels
-np.random.seed(42)
-
-# Generate districts with coverage levels
-n_districts = 742
-district_data = []
-
-# Distribution: 680 high (91.6%), 45 medium, 17 low
-coverage_levels = (['high'] * 680 + ['medium'] * 45 + ['low'] * 17)
-np.random.shuffle(coverage_levels)
-
-# Generate random district locations within India boundaries
-for i, coverage in enumerate(coverage_levels):
-    # Random point within India bounds
-    while True:
-        x = np.random.uniform(68, 97)
-        y = np.random.uniform(8, 35)
-        # Check if roughly within India outline (simplified)
-        if 68 <= x <= 97 and 8 <= y <= 35:
-            # Add some concentration in major regions
-            if np.random.random() < 0.3:  # 30% in northern plains
-                x = np.random.uniform(75, 85)
-                y = np.random.uniform(23, 30)
-            elif np.random.random() < 0.3:  # 30% in southern peninsula
-                x = np.random.uniform(75, 80)
-                y = np.random.uniform(10, 18)
-            break
-    
-    district_data.append({'x': x, 'y': y, 'coverage': coverage})
-
-# Plot districts
-for district in district_data:
-    color = colors[district['coverage']]
-    ax1.scatter(district['x'], district['y'], c=color, s=15, alpha=0.7, 
-               edgecolors='black', linewidth=0.3, zorder=2)
-
-# Add major cities as reference points
-cities = [
-    {'name': 'New Delhi', 'x': 77.2, 'y': 28.6},
-    {'name': 'Mumbai', 'x': 72.8, 'y': 19.1},
-    {'name': 'Kolkata', 'x': 88.4, 'y': 22.6},
-    {'name': 'Chennai', 'x': 80.3, 'y': 13.1},
-    {'name': 'Bengaluru', 'x': 77.6, 'y': 13.0}
-]
-
-for city in cities:
-    ax1.scatter(city['x'], city['y'], c='darkred', s=120, marker='*', 
-               edgecolors='black', linewidth=1, zorder=4)
-    ax1.annotate(city['name'], (city['x'], city['y']), 
-                xytext=(3, 3), textcoords='offset points',
-                fontsize=8, fontweight='bold', zorder=5)
-
-# Add VIIRS satellite tile grid overlay (simplified)
-tile_boxes = [
-    {'name': 'h24v06', 'x': 70, 'y': 25, 'w': 10, 'h': 10},
-    {'name': 'h24v07', 'x': 70, 'y': 15, 'w': 10, 'h': 10},
-    {'name': 'h25v06', 'x': 80, 'y': 25, 'w': 10, 'h': 10},
-    {'name': 'h25v07', 'x': 80, 'y': 15, 'w': 10, 'h': 10},
-    {'name': 'h26v06', 'x': 90, 'y': 25, 'w': 10, 'h': 10},
-]
-
-for tile in tile_boxes:
-    rect = Rectangle((tile['x'], tile['y']), tile['w'], tile['h'], 
-                     linewidth=1.5, edgecolor='blue', facecolor='none', 
-                     linestyle='--', alpha=0.4, zorder=0)
-    ax1.add_patch(rect)
-
-# Legend
-legend_elements = [
-    mpatches.Patch(facecolor=colors['high'], edgecolor='black', 
-                  label=f'High Coverage (>90%): 680 districts'),
-    mpatches.Patch(facecolor=colors['medium'], edgecolor='black', 
-                  label=f'Medium Coverage (60-90%): 45 districts'),
-    mpatches.Patch(facecolor=colors['low'], edgecolor='black', 
-                  label=f'Low Coverage (<60%): 17 districts'),
-    plt.Line2D([0], [0], color='blue', linestyle='--', linewidth=1.5, 
-              label='VIIRS Tile Grid')
-]
-ax1.legend(handles=legend_elements, loc='lower left', fontsize=8, framealpha=0.95)
-
-# Add statistics box
-stats_text = (
-    f"Total Districts: 742\n"
-    f"Coverage: 91.6%\n"
-    f"Time Period: 2014-2025\n"
-    f"Observations: 847,250"
-)
-ax1.text(0.98, 0.97, stats_text, transform=ax1.transAxes,
-        fontsize=8, va='top', ha='right', fontweight='bold',
-        bbox=dict(boxstyle='round,pad=0.5', facecolor='white', 
-                 edgecolor='black', alpha=0.9, linewidth=1.5))
-
-ax1.set_xlim(66, 99)
-ax1.set_ylim(6, 37)
-ax1.set_xlabel('Longitude (°E)', fontsize=11, fontweight='bold')
-ax1.set_ylabel('Latitude (°N)', fontsize=11, fontweight='bold')
-ax1.set_title('(a) Geographic Distribution - 742 Districts\nVIIRS Data Coverage (2025)', 
-             fontsize=12, fontweight='bold', pad=10)
-ax1.grid(True, alpha=0.3, linestyle=':', linewidth=0.5)
-ax1.set_aspect('equal')
-
-# ============================================================================
-# PANEL (b): Temporal Expansion Timeline
-# ============================================================================
-ax2 = plt.subplot(132)
-
-# Coverage expansion data (2014-2025)
-years = np.arange(2014, 2026)
-district_counts = np.array([450, 482, 516, 554, 589, 623, 658, 687, 705, 724, 738, 742])
-
-# Calculate growth percentage
-growth_pct = ((district_counts - district_counts[0]) / district_counts[0]) * 100
-
-# Create bar chart
-bars = ax2.bar(years, district_counts, color='#0173B2', alpha=0.7, 
-              edgecolor='black', linewidth=1.5, width=0.7)
-
-# Add trend line
-z = np.polyfit(years, district_counts, 2)  # Quadratic fit
-p = np.poly1d(z)
-years_smooth = np.linspace(2014, 2025, 100)
-ax2.plot(years_smooth, p(years_smooth), 'r--', linewidth=2.5, 
-        label='Quadratic Trend', alpha=0.8)
-
-# Highlight 2014 and 2025
-bars[0].set_color('#029E73')
-bars[0].set_alpha(0.9)
-bars[-1].set_color('#029E73')
-bars[-1].set_alpha(0.9)
-
-# Add target line
-ax2.axhline(742, color='red', linestyle=':', linewidth=2, 
-           label='Target: 742 districts', alpha=0.6)
-
-# Annotate start and end
-ax2.annotate('Initial\n450', xy=(2014, 450), xytext=(2014, 350),
-            fontsize=9, ha='center', fontweight='bold',
-            bbox=dict(boxstyle='round,pad=0.4', facecolor='lightgreen', 
-                     edgecolor='darkgreen', linewidth=2))
-
-ax2.annotate('Final\n742', xy=(2025, 742), xytext=(2025, 650),
-            fontsize=9, ha='center', fontweight='bold',
-            bbox=dict(boxstyle='round,pad=0.4', facecolor='lightgreen', 
-                     edgecolor='darkgreen', linewidth=2))
-
-# Add growth arrow
-ax2.annotate('', xy=(2025, 742), xytext=(2014, 450),
-            arrowprops=dict(arrowstyle='->', lw=3, color='darkred', alpha=0.5))
-ax2.text(2019.5, 600, '+64.9% Growth', fontsize=11, ha='center',
-        fontweight='bold', color='darkred',
-        bbox=dict(boxstyle='round,pad=0.5', facecolor='yellow', alpha=0.6))
-
-# Add value labels on bars
-for i, (year, count) in enumerate(zip(years, district_counts)):
-    if i % 2 == 0:  # Label every other year to avoid crowding
-        ax2.text(year, count + 15, str(count), ha='center', va='bottom',
-                fontsize=8, fontweight='bold')
-
-ax2.set_xlabel('Year', fontsize=11, fontweight='bold')
-ax2.set_ylabel('Number of Districts Monitored', fontsize=11, fontweight='bold')
-ax2.set_title('(b) Temporal Expansion of Monitoring Coverage\n2014-2025 Infrastructure Growth', 
-             fontsize=12, fontweight='bold', pad=10)
-ax2.set_xlim(2013.5, 2025.5)
-ax2.set_ylim(0, 800)
-ax2.legend(fontsize=9, loc='upper left', framealpha=0.95)
-ax2.grid(axis='y', alpha=0.3, linestyle=':', linewidth=0.5)
-
-# Add statistics annotation
-expansion_text = (
-    f"Expansion Rate:\n"
-    f"• Early (2014-2019): +29.3%\n"
-    f"• Late (2020-2025): +26.0%\n"
-    f"• Overall: +64.9%\n"
-    f"• Avg: +26.5 districts/year"
-)
-ax2.text(0.02, 0.97, expansion_text, transform=ax2.transAxes,
-        fontsize=8, va='top', ha='left',
-        bbox=dict(boxstyle='round,pad=0.5', facecolor='lightyellow', 
-                 edgecolor='black', alpha=0.9, linewidth=1))
-
-# ============================================================================
-# PANEL (c): VIIRS Tile Grid with Data Density Heatmap
-# ============================================================================
-ax3 = plt.subplot(133)
-
-# VIIRS tile structure (H-V format)
-tiles = [
-    # (h, v, observation_density_percentage)
-    (24, 6, 95),
-    (24, 7, 92),
-    (25, 6, 98),
-    (25, 7, 89),
-    (26, 6, 78),
-    (26, 7, 65),
-]
-
-# Create grid visualization
-tile_size = 1
-min_h, max_h = 24, 26
-min_v, max_v = 6, 7
-
-# Create heatmap matrix
-heatmap = np.zeros((max_v - min_v + 1, max_h - min_h + 1))
-for h, v, density in tiles:
-    heatmap[v - min_v, h - min_h] = density
-
-# Plot heatmap
-im = ax3.imshow(heatmap, cmap='YlOrRd', aspect='auto', 
-               extent=[min_h - 0.5, max_h + 0.5, max_v + 0.5, min_v - 0.5],
-               vmin=0, vmax=100, alpha=0.8)
-
-# Add colorbar
-cbar = plt.colorbar(im, ax=ax3, pad=0.02, fraction=0.046)
-cbar.set_label('Data Density (%)', fontsize=10, fontweight='bold', rotation=270, labelpad=20)
-cbar.ax.tick_params(labelsize=8)
-
-# Draw grid lines and labels
-for h in range(min_h, max_h + 1):
-    for v in range(min_v, max_v + 1):
-        # Get density value
-        density = heatmap[v - min_v, h - min_h]
-        
-        # Draw tile boundary
-        rect = Rectangle((h - 0.5, v - 0.5), 1, 1, 
-                        linewidth=2, edgecolor='black', facecolor='none')
-        ax3.add_patch(rect)
-        
-        # Add tile name
-        tile_name = f'h{h:02d}v{v:02d}'
-        ax3.text(h, v + 0.25, tile_name, ha='center', va='center',
-                fontsize=10, fontweight='bold', color='black',
-                bbox=dict(boxstyle='round,pad=0.3', facecolor='white', 
-                         edgecolor='black', alpha=0.9))
-        
-        # Add density value
-        ax3.text(h, v - 0.15, f'{density:.0f}%', ha='center', va='center',
-                fontsize=9, fontweight='bold', 
-                color='darkred' if density > 80 else 'black')
-
-# Add India outline overlay (simplified)
-india_overlay_x = np.array([24.3, 24.5, 24.8, 25.2, 25.5, 25.8, 26.2, 26.3, 
-                           26.2, 25.8, 25.3, 24.8, 24.5, 24.3])
-india_overlay_y = np.array([6.2, 6.3, 6.4, 6.5, 6.6, 6.7, 6.8, 7.0, 
-                           7.2, 7.3, 7.2, 7.0, 6.8, 6.2])
-ax3.plot(india_overlay_x, india_overlay_y, 'b-', linewidth=3, 
-        alpha=0.6, label='India Boundary (approx.)')
-
-# Add legend
-legend_elements = [
-    mpatches.Patch(facecolor='#FEE5D9', label='Low Density (60-80%)'),
-    mpatches.Patch(facecolor='#FCAE91', label='Medium Density (80-90%)'),
-    mpatches.Patch(facecolor='#FB6A4A', label='High Density (90-95%)'),
-    mpatches.Patch(facecolor='#CB181D', label='Very High (>95%)'),
-]
-ax3.legend(handles=legend_elements, loc='upper right', fontsize=8, framealpha=0.95)
-
-ax3.set_xlabel('VIIRS Horizontal Tile Index (h)', fontsize=11, fontweight='bold')
-ax3.set_ylabel('VIIRS Vertical Tile Index (v)', fontsize=11, fontweight='bold')
-ax3.set_title('(c) VIIRS VNP46A1 Satellite Tile Grid\nObservation Frequency Heatmap', 
-             fontsize=12, fontweight='bold', pad=10)
-ax3.set_xticks(range(min_h, max_h + 1))
-ax3.set_yticks(range(min_v, max_v + 1))
-ax3.set_xticklabels([f'h{h:02d}' for h in range(min_h, max_h + 1)])
-ax3.set_yticklabels([f'v{v:02d}' for v in range(min_v, max_v + 1)])
-ax3.grid(False)
-
-# Add data source annotation
-source_text = (
-    "Data Source:\n"
-    "NASA VIIRS VNP46A1\n"
-    "Day/Night Band\n"
-    "~500m resolution\n"
-    "Daily acquisition"
-)
-ax3.text(0.02, 0.97, source_text, transform=ax3.transAxes,
-        fontsize=8, va='top', ha='left', style='italic',
-        bbox=dict(boxstyle='round,pad=0.5', facecolor='lightblue', 
-                 edgecolor='black', alpha=0.9, linewidth=1))
-
-# Add observation count annotation
-obs_text = (
-    f"Total Coverage:\n"
-    f"• Tiles: 6 (primary)\n"
-    f"• Observations: 847,250\n"
-    f"• Avg Density: 86.2%\n"
-    f"• Peak Tile: h25v06 (98%)"
-)
-ax3.text(0.98, 0.03, obs_text, transform=ax3.transAxes,
-        fontsize=8, va='bottom', ha='right',
-        bbox=dict(boxstyle='round,pad=0.5', facecolor='lightyellow', 
-                 edgecolor='black', alpha=0.9, linewidth=1))
-
-# ============================================================================
-# Overall Figure Title and Caption
-# ============================================================================
-fig.suptitle('Study Area and Monitoring Infrastructure - ALPS Framework',
-            fontsize=15, fontweight='bold', y=0.98)
-
-# Add caption
-caption = (
-    "Figure 1. Study Area and Monitoring Infrastructure. (a) Geographic distribution of 742 monitored districts "
-    "across India, color-coded by VIIRS data availability (green: >90% coverage, yellow: 60-90%, red: <60%). "
-    "Major cities marked with stars; VIIRS tile boundaries shown as dashed blue lines. (b) Temporal expansion "
-    "of district coverage from 2014 (initial 450 districts) to 2025 (742 districts), demonstrating 64.9% growth "
-    "in monitoring infrastructure with quadratic trend line (R² = 0.998). (c) NASA VIIRS VNP46A1 satellite tile "
-    "grid (h24v06-h26v07) overlaid on study area, with data density heatmap showing observation frequency "
-    "(darker red = higher temporal resolution). Peak coverage achieved in tile h25v06 (98% data availability), "
-    "encompassing central India's densely populated regions."
-)
-fig.text(0.5, 0.01, caption, wrap=True, ha='center', fontsize=8, style='italic')
-
-plt.tight_layout(rect=[0, 0.04, 1, 0.96])
-
-# Save
-output_pdf = 'd:/agentic-light-sentinel/tmp/exports/figures/figure1_study_area.pdf'
-output_png = 'd:/agentic-light-sentinel/tmp/exports/figures/figure1_study_area.png'
-
-plt.savefig(output_pdf, dpi=300, bbox_inches='tight')
-print(f"✅ Saved: {output_pdf}")
-
-plt.savefig(output_png, dpi=300, bbox_inches='tight')
-print(f"✅ Saved: {output_png}")
-
-plt.close()
-
-print("\n🎯 Figure 1 (Study Area & Monitoring Infrastructure) generated successfully!")
-print("   Panel (a): Geographic distribution with 742 districts")
-print("   Panel (b): Temporal expansion timeline (2014-2025)")
-print("   Panel (c): VIIRS satellite tile grid with data density heatmap")
-print(f"\n📊 Statistics included:")
-print(f"   • Total districts: 742")
-print(f"   • Coverage: 91.6% (680 high, 45 medium, 17 low)")
-print(f"   • Growth: 450 → 742 districts (+64.9%)")
-print(f"   • VIIRS tiles: 6 primary tiles covering India")
-print(f"   • Peak tile density: 98% (h25v06)")
+plt.rcParams.update(STYLE)
+
+# Coverage classes by share of days with a VIIRS observation
+COVERAGE_LEVELS = ('high', 'medium', 'low')
+COVERAGE_BINS = (0.6, 0.9)
+
+
+def district_coverage(data=None, seed=42):
+    """District centroids (lon/lat) and coverage class as arrays.
+
+    With exported district polygons and daily metrics, coverage is each
+    district's share of days with an observation. Otherwise 742 districts are
+    simulated (680 high, 45 medium, 17 low) inside the India outline, 30% of them
+    concentrated in the northern plains and a further 30% of the rest in the
+    southern peninsula.
+    """
+    geoms = data.districts if data is not None else None
+    daily = data.district_daily(columns=('code', 'date')) if geoms is not None else None
+    if daily is not None and not daily.empty:
+        days = daily['date'].nunique()
+        share = (daily['code'].value_counts() / days).reindex(geoms.codes, fill_value=0.0)
+        level = np.digitize(share.to_numpy(), COVERAGE_BINS)   # 0 low, 1 medium, 2 high
+        centroids = geoms.centroids()
+        return SimpleNamespace(x=centroids[:, 0], y=centroids[:, 1],
+                               coverage=np.array(COVERAGE_LEVELS[::-1])[level])
+
+    rng = np.random.default_rng(seed)
+    coverage = rng.permutation(np.repeat(COVERAGE_LEVELS, (680, 45, 17)))
+    n = len(coverage)
+    india = PolygonIndex.from_ring(INDIA_OUTLINE)
+    x, y = india.sample(n, rng)
+    north = rng.random(n) < 0.3
+    south = ~north & (rng.random(n) < 0.3)
+    x[north], y[north] = india.sample(north.sum(), rng, bounds=(75, 23, 85, 30))
+    x[south], y[south] = india.sample(south.sum(), rng, bounds=(75, 10, 80, 18))
+    return SimpleNamespace(x=x, y=y, coverage=coverage)
+
+
+def plot_district_coverage(ax, layer, colors):
+    """Draw districts as one scatter collection per coverage class"""
+    for level in COVERAGE_LEVELS:
+        mask = layer.coverage == level
+        ax.scatter(layer.x[mask], layer.y[mask], c=colors[level], s=15, alpha=0.7,
+                   edgecolors='black', linewidth=0.3, zorder=2)
+
+
+def generate_figure1_study_area(output_dir=OUTPUT_DIR, data=None):
+    """Figure 1: Study Area and Monitoring Infrastructure (3 panels)"""
+    print("\n🎨 Generating Figure 1: Study Area and Monitoring Infrastructure...")
+    output_dir = Path(output_dir)
+
+    # Create figure with 3 panels
+    fig = plt.figure(figsize=(18, 6))
+
+    # Color scheme for coverage levels
+    colors = {
+        'high': '#029E73',      # Green (>90%)
+        'medium': '#ECE133',    # Yellow (60-90%)
+        'low': '#CC78BC',       # Red (<60%)
+        'border': '#000000'
+    }
+
+    # ============================================================================
+    # PANEL (a): Geographic Distribution of Districts
+    # ============================================================================
+    ax1 = plt.subplot(131)
+
+    # Simplified India outline (approximate coordinates)
+    # Using normalized coordinates for India's shape
+    india_x, india_y = INDIA_OUTLINE.T
+
+    # Draw India outline
+    ax1.plot(india_x, india_y, 'k-', linewidth=2.5, zorder=3)
+    ax1.fill(india_x, india_y, color='lightgray', alpha=0.3, zorder=1)
+
+    # Districts by coverage class, one collection per class
+    layer = district_coverage(data)
+    plot_district_coverage(ax1, layer, colors)
+    counts = {level: int((layer.coverage == level).sum()) for level in COVERAGE_LEVELS}
+    n_districts = len(layer.coverage)
+
+    # Add major cities as reference points
+    cities = [
+        {'name': 'New Delhi', 'x': 77.2, 'y': 28.6},
+        {'name': 'Mumbai', 'x': 72.8, 'y': 19.1},
+        {'name': 'Kolkata', 'x': 88.4, 'y': 22.6},
+        {'name': 'Chennai', 'x': 80.3, 'y': 13.1},
+        {'name': 'Bengaluru', 'x': 77.6, 'y': 13.0}
+    ]
+
+    ax1.scatter([c['x'] for c in cities], [c['y'] for c in cities], c='darkred', s=120,
+               marker='*', edgecolors='black', linewidth=1, zorder=4)
+    for city in cities:
+        ax1.annotate(city['name'], (city['x'], city['y']), 
+                    xytext=(3, 3), textcoords='offset points',
+                    fontsize=8, fontweight='bold', zorder=5)
+
+    # Add VIIRS satellite tile grid overlay (simplified)
+    tile_boxes = [
+        {'name': 'h24v06', 'x': 70, 'y': 25, 'w': 10, 'h': 10},
+        {'name': 'h24v07', 'x': 70, 'y': 15, 'w': 10, 'h': 10},
+        {'name': 'h25v06', 'x': 80, 'y': 25, 'w': 10, 'h': 10},
+        {'name': 'h25v07', 'x': 80, 'y': 15, 'w': 10, 'h': 10},
+        {'name': 'h26v06', 'x': 90, 'y': 25, 'w': 10, 'h': 10},
+    ]
+
+    for tile in tile_boxes:
+        rect = Rectangle((tile['x'], tile['y']), tile['w'], tile['h'], 
+                         linewidth=1.5, edgecolor='blue', facecolor='none', 
+                         linestyle='--', alpha=0.4, zorder=0)
+        ax1.add_patch(rect)
+
+    # Legend
+    legend_elements = [
+        mpatches.Patch(facecolor=colors['high'], edgecolor='black', 
+                      label=f"High Coverage (>90%): {counts['high']} districts"),
+        mpatches.Patch(facecolor=colors['medium'], edgecolor='black', 
+                      label=f"Medium Coverage (60-90%): {counts['medium']} districts"),
+        mpatches.Patch(facecolor=colors['low'], edgecolor='black', 
+                      label=f"Low Coverage (<60%): {counts['low']} districts"),
+        plt.Line2D([0], [0], color='blue', linestyle='--', linewidth=1.5, 
+                  label='VIIRS Tile Grid')
+    ]
+    ax1.legend(handles=legend_elements, loc='lower left', fontsize=8, framealpha=0.95)
+
+    # Add statistics box
+    stats_text = (
+        f"Total Districts: {n_districts}\n"
+        f"Coverage: {100 * counts['high'] / n_districts:.1f}%\n"
+        f"Time Period: 2014-2025\n"
+        f"Observations: 847,250"
+    )
+    ax1.text(0.98, 0.97, stats_text, transform=ax1.transAxes,
+            fontsize=8, va='top', ha='right', fontweight='bold',
+            bbox=dict(boxstyle='round,pad=0.5', facecolor='white', 
+                     edgecolor='black', alpha=0.9, linewidth=1.5))
+
+    ax1.set_xlim(66, 99)
+    ax1.set_ylim(6, 37)
+    ax1.set_xlabel('Longitude (°E)', fontsize=11, fontweight='bold')
+    ax1.set_ylabel('Latitude (°N)', fontsize=11, fontweight='bold')
+    ax1.set_title(f'(a) Geographic Distribution - {n_districts} Districts\nVIIRS Data Coverage (2025)', 
+                 fontsize=12, fontweight='bold', pad=10)
+    ax1.grid(True, alpha=0.3, linestyle=':', linewidth=0.5)
+    ax1.set_aspect('equal')
+
+    # ============================================================================
+    # PANEL (b): Temporal Expansion Timeline
+    # ============================================================================
+    ax2 = plt.subplot(132)
+
+    # Coverage expansion data (2014-2025)
+    years = np.arange(2014, 2026)
+    district_counts = np.array([450, 482, 516, 554, 589, 623, 658, 687, 705, 724, 738, 742])
+
+    # Calculate growth percentage
+    growth_pct = ((district_counts - district_counts[0]) / district_counts[0]) * 100
+
+    # Create bar chart
+    bars = ax2.bar(years, district_counts, color='#0173B2', alpha=0.7, 
+                  edgecolor='black', linewidth=1.5, width=0.7)
+
+    # Add trend line
+    z = np.polyfit(years, district_counts, 2)  # Quadratic fit
+    p = np.poly1d(z)
+    years_smooth = np.linspace(2014, 2025, 100)
+    ax2.plot(years_smooth, p(years_smooth), 'r--', linewidth=2.5, 
+            label='Quadratic Trend', alpha=0.8)
+
+    # Highlight 2014 and 2025
+    bars[0].set_color('#029E73')
+    bars[0].set_alpha(0.9)
+    bars[-1].set_color('#029E73')
+    bars[-1].set_alpha(0.9)
+
+    # Add target line
+    ax2.axhline(742, color='red', linestyle=':', linewidth=2, 
+               label='Target: 742 districts', alpha=0.6)
+
+    # Annotate start and end
+    ax2.annotate('Initial\n450', xy=(2014, 450), xytext=(2014, 350),
+                fontsize=9, ha='center', fontweight='bold',
+                bbox=dict(boxstyle='round,pad=0.4', facecolor='lightgreen', 
+                         edgecolor='darkgreen', linewidth=2))
+
+    ax2.annotate('Final\n742', xy=(2025, 742), xytext=(2025, 650),
+                fontsize=9, ha='center', fontweight='bold',
+                bbox=dict(boxstyle='round,pad=0.4', facecolor='lightgreen', 
+                         edgecolor='darkgreen', linewidth=2))
+
+    # Add growth arrow
+    ax2.annotate('', xy=(2025, 742), xytext=(2014, 450),
+                arrowprops=dict(arrowstyle='->', lw=3, color='darkred', alpha=0.5))
+    ax2.text(2019.5, 600, '+64.9% Growth', fontsize=11, ha='center',
+            fontweight='bold', color='darkred',
+            bbox=dict(boxstyle='round,pad=0.5', facecolor='yellow', alpha=0.6))
+
+    # Add value labels on bars
+    for i, (year, count) in enumerate(zip(years, district_counts)):
+        if i % 2 == 0:  # Label every other year to avoid crowding
+            ax2.text(year, count + 15, str(count), ha='center', va='bottom',
+                    fontsize=8, fontweight='bold')
+
+    ax2.set_xlabel('Year', fontsize=11, fontweight='bold')
+    ax2.set_ylabel('Number of Districts Monitored', fontsize=11, fontweight='bold')
+    ax2.set_title('(b) Temporal Expansion of Monitoring Coverage\n2014-2025 Infrastructure Growth', 
+                 fontsize=12, fontweight='bold', pad=10)
+    ax2.set_xlim(2013.5, 2025.5)
+    ax2.set_ylim(0, 800)
+    ax2.legend(fontsize=9, loc='upper left', framealpha=0.95)
+    ax2.grid(axis='y', alpha=0.3, linestyle=':', linewidth=0.5)
+
+    # Add statistics annotation
+    expansion_text = (
+        f"Expansion Rate:\n"
+        f"• Early (2014-2019): +29.3%\n"
+        f"• Late (2020-2025): +26.0%\n"
+        f"• Overall: +64.9%\n"
+        f"• Avg: +26.5 districts/year"
+    )
+    ax2.text(0.02, 0.97, expansion_text, transform=ax2.transAxes,
+            fontsize=8, va='top', ha='left',
+            bbox=dict(boxstyle='round,pad=0.5', facecolor='lightyellow', 
+                     edgecolor='black', alpha=0.9, linewidth=1))
+
+    # ============================================================================
+    # PANEL (c): VIIRS Tile Grid with Data Density Heatmap
+    # ============================================================================
+    ax3 = plt.subplot(133)
+
+    # VIIRS tile structure (H-V format)
+    tiles = [
+        # (h, v, observation_density_percentage)
+        (24, 6, 95),
+        (24, 7, 92),
+        (25, 6, 98),
+        (25, 7, 89),
+        (26, 6, 78),
+        (26, 7, 65),
+    ]
+
+    # Create grid visualization
+    tile_size = 1
+    min_h, max_h = 24, 26
+    min_v, max_v = 6, 7
+
+    # Create heatmap matrix
+    heatmap = np.zeros((max_v - min_v + 1, max_h - min_h + 1))
+    for h, v, density in tiles:
+        heatmap[v - min_v, h - min_h] = density
+
+    # Plot heatmap
+    im = ax3.imshow(heatmap, cmap='YlOrRd', aspect='auto', 
+                   extent=[min_h - 0.5, max_h + 0.5, max_v + 0.5, min_v - 0.5],
+                   vmin=0, vmax=100, alpha=0.8)
+
+    # Add colorbar
+    cbar = plt.colorbar(im, ax=ax3, pad=0.02, fraction=0.046)
+    cbar.set_label('Data Density (%)', fontsize=10, fontweight='bold', rotation=270, labelpad=20)
+    cbar.ax.tick_params(labelsize=8)
+
+    # Draw grid lines and labels
+    for h in range(min_h, max_h + 1):
+        for v in range(min_v, max_v + 1):
+            # Get density value
+            density = heatmap[v - min_v, h - min_h]
+
+            # Draw tile boundary
+            rect = Rectangle((h - 0.5, v - 0.5), 1, 1, 
+                            linewidth=2, edgecolor='black', facecolor='none')
+            ax3.add_patch(rect)
+
+            # Add tile name
+            tile_name = f'h{h:02d}v{v:02d}'
+            ax3.text(h, v + 0.25, tile_name, ha='center', va='center',
+                    fontsize=10, fontweight='bold', color='black',
+                    bbox=dict(boxstyle='round,pad=0.3', facecolor='white', 
+                             edgecolor='black', alpha=0.9))
+
+            # Add density value
+            ax3.text(h, v - 0.15, f'{density:.0f}%', ha='center', va='center',
+                    fontsize=9, fontweight='bold', 
+                    color='darkred' if density > 80 else 'black')
+
+    # Add India outline overlay (simplified)
+    india_overlay_x = np.array([24.3, 24.5, 24.8, 25.2, 25.5, 25.8, 26.2, 26.3, 
+                               26.2, 25.8, 25.3, 24.8, 24.5, 24.3])
+    india_overlay_y = np.array([6.2, 6.3, 6.4, 6.5, 6.6, 6.7, 6.8, 7.0, 
+                               7.2, 7.3, 7.2, 7.0, 6.8, 6.2])
+    ax3.plot(india_overlay_x, india_overlay_y, 'b-', linewidth=3, 
+            alpha=0.6, label='India Boundary (approx.)')
+
+    # Add legend
+    legend_elements = [
+        mpatches.Patch(facecolor='#FEE5D9', label='Low Density (60-80%)'),
+        mpatches.Patch(facecolor='#FCAE91', label='Medium Density (80-90%)'),
+        mpatches.Patch(facecolor='#FB6A4A', label='High Density (90-95%)'),
+        mpatches.Patch(facecolor='#CB181D', label='Very High (>95%)'),
+    ]
+    ax3.legend(handles=legend_elements, loc='upper right', fontsize=8, framealpha=0.95)
+
+    ax3.set_xlabel('VIIRS Horizontal Tile Index (h)', fontsize=11, fontweight='bold')
+    ax3.set_ylabel('VIIRS Vertical Tile Index (v)', fontsize=11, fontweight='bold')
+    ax3.set_title('(c) VIIRS VNP46A1 Satellite Tile Grid\nObservation Frequency Heatmap', 
+                 fontsize=12, fontweight='bold', pad=10)
+    ax3.set_xticks(range(min_h, max_h + 1))
+    ax3.set_yticks(range(min_v, max_v + 1))
+    ax3.set_xticklabels([f'h{h:02d}' for h in range(min_h, max_h + 1)])
+    ax3.set_yticklabels([f'v{v:02d}' for v in range(min_v, max_v + 1)])
+    ax3.grid(False)
+
+    # Add data source annotation
+    source_text = (
+        "Data Source:\n"
+        "NASA VIIRS VNP46A1\n"
+        "Day/Night Band\n"
+        "~500m resolution\n"
+        "Daily acquisition"
+    )
+    ax3.text(0.02, 0.97, source_text, transform=ax3.transAxes,
+            fontsize=8, va='top', ha='left', style='italic',
+            bbox=dict(boxstyle='round,pad=0.5', facecolor='lightblue', 
+                     edgecolor='black', alpha=0.9, linewidth=1))
+
+    # Add observation count annotation
+    obs_text = (
+        f"Total Coverage:\n"
+        f"• Tiles: 6 (primary)\n"
+        f"• Observations: 847,250\n"
+        f"• Avg Density: 86.2%\n"
+        f"• Peak Tile: h25v06 (98%)"
+    )
+    ax3.text(0.98, 0.03, obs_text, transform=ax3.transAxes,
+            fontsize=8, va='bottom', ha='right',
+            bbox=dict(boxstyle='round,pad=0.5', facecolor='lightyellow', 
+                     edgecolor='black', alpha=0.9, linewidth=1))
+
+    # ============================================================================
+    # Overall Figure Title and Caption
+    # ============================================================================
+    fig.suptitle('Study Area and Monitoring Infrastructure - ALPS Framework',
+                fontsize=15, fontweight='bold', y=0.98)
+
+    # Add caption
+    caption = (
+        "Figure 1. Study Area and Monitoring Infrastructure. (a) Geographic distribution of 742 monitored districts "
+        "across India, color-coded by VIIRS data availability (green: >90% coverage, yellow: 60-90%, red: <60%). "
+        "Major cities marked with stars; VIIRS tile boundaries shown as dashed blue lines. (b) Temporal expansion "
+        "of district coverage from 2014 (initial 450 districts) to 2025 (742 districts), demonstrating 64.9% growth "
+        "in monitoring infrastructure with quadratic trend line (R² = 0.998). (c) NASA VIIRS VNP46A1 satellite tile "
+        "grid (h24v06-h26v07) overlaid on study area, with data density heatmap showing observation frequency "
+        "(darker red = higher temporal resolution). Peak coverage achieved in tile h25v06 (98% data availability), "
+        "encompassing central India's densely populated regions."
+    )
+    fig.text(0.5, 0.01, caption, wrap=True, ha='center', fontsize=8, style='italic')
+
+    plt.tight_layout(rect=[0, 0.04, 1, 0.96])
+
+    # Save every format from a single render
+    for path in export(fig, output_dir, 'figure1_study_area'):
+        print(f"✅ Saved: {path}")
+
+    plt.close()
+
+
+if __name__ == '__main__':
+    generate_figure1_study_area()
+    print("\n🎯 Figure 1 (Study Area & Monitoring Infrastructure) generated successfully!")
+    print("   Panel (a): Geographic distribution with 742 districts")
+    print("   Panel (b): Temporal expansion timeline (2014-2025)")
+    print("   Panel (c): VIIRS satellite tile grid with data density heatmap")
+    print(f"\n📊 Statistics included:")
+    print(f"   • Total districts: 742")
+    print(f"   • Coverage: 91.6% (680 high, 45 medium, 17 low)")
+    print(f"   • Growth: 450 → 742 districts (+64.9%)")
+    print(f"   • VIIRS tiles: 6 primary tiles covering India")
+    print(f"   • Peak tile density: 98% (h25v06)")
@@ -10,513 +10,522 @@ import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
 from matplotlib.patches import FancyBboxPatch, Rectangle, Circle, FancyArrowPatch, Wedge
 import numpy as np
+from pathlib import Path
+
+from alps_analytics.spatial.polygon import INDIA_OUTLINE, PolygonIndex
+from alps_figures.paths import OUTPUT_DIR
+from alps_figures.render import export
 
 # Configure
-plt.rcParams['font.family'] = 'sans-serif'
-plt.rcParams['font.sans-serif'] = ['Arial', 'DejaVu Sans']
-plt.rcParams['font.size'] = 9
-plt.rcParams['figure.dpi'] = 300
-
-# Create figure (dashboard layout)
-fig = plt.figure(figsize=(18, 12))
-ax = plt.subplot(111)
-ax.set_xlim(0, 18)
-ax.set_ylim(0, 12)
-ax.axis('off')
-
-# Background (browser/app window)
-browser_bg = Rectangle((0, 0), 18, 12, facecolor='#f5f5f5', edgecolor='none')
-ax.add_patch(browser_bg)
-
-# ============================================================================
-# TOP NAVIGATION BAR
-# ============================================================================
-navbar = Rectangle((0, 11), 18, 1, facecolor='#2c3e50', edgecolor='none', zorder=2)
-ax.add_patch(navbar)
-
-# ALPS Logo
-ax.text(0.5, 11.5, 'ALPS', fontsize=24, fontweight='bold', 
-       color='white', va='center', ha='left')
-ax.text(1.5, 11.5, 'Autonomous Light Pollution Sentinel', fontsize=11, 
-       color='#ecf0f1', va='center', ha='left', style='italic')
-
-# Nav menu items
-nav_items = ['Dashboard', 'Analytics', 'Alerts', 'Settings']
-nav_x = 10
-for item in nav_items:
-    is_active = (item == 'Dashboard')
-    bg_color = '#3498db' if is_active else '#34495e'
-    
-    nav_btn = FancyBboxPatch((nav_x, 11.15), 1.5, 0.7,
-                            boxstyle="round,pad=0.05",
-                            edgecolor='none',
-                            facecolor=bg_color,
-                            zorder=3)
-    ax.add_patch(nav_btn)
-    
-    ax.text(nav_x + 0.75, 11.5, item, fontsize=10, fontweight='bold' if is_active else 'normal',
-           color='white', va='center', ha='center')
-    nav_x += 1.7
-
-# User info
-ax.text(17.5, 11.5, '👤 Admin', fontsize=10, color='white', 
-       va='center', ha='right', fontweight='bold')
-
-# ============================================================================
-# MAIN CONTENT AREA - 4 QUADRANTS
-# ============================================================================
-
-# --- QUADRANT 1: Interactive Map (Top Left) ---
-map_box = FancyBboxPatch((0.3, 6.5), 8.5, 4.2,
-                        boxstyle="round,pad=0.1",
-                        edgecolor='#bdc3c7',
-                        facecolor='white',
-                        linewidth=2, zorder=4)
-ax.add_patch(map_box)
-
-# Map title bar
-map_title_bar = Rectangle((0.3, 10.5), 8.5, 0.4, facecolor='#3498db', 
-                          edgecolor='none', zorder=5)
-ax.add_patch(map_title_bar)
-ax.text(4.55, 10.7, '(a) Interactive District-Level Hotspot Map', 
-       fontsize=11, fontweight='bold', color='white', va='center', ha='center')
-
-# Simplified India map background
-india_x_norm = np.array([70, 71, 73, 75, 77, 80, 83, 86, 88, 92, 95, 97, 97, 95, 93, 90, 
-                        88, 85, 83, 80, 77, 75, 73, 72, 71, 70, 68, 68, 69, 70])
-india_y_norm = np.array([35, 33, 31, 30, 29, 28, 27, 26, 25, 24, 23, 22, 20, 18, 16, 14, 
-                        12, 10, 9, 8, 8, 9, 10, 12, 15, 20, 25, 30, 33, 35])
-
-# Scale to fit in map box
-india_x_scaled = 0.8 + (india_x_norm - 68) / (97 - 68) * 7.5
-india_y_scaled = 7.0 + (india_y_norm - 8) / (35 - 8) * 3.2
-
-ax.fill(india_x_scaled, india_y_scaled, color='#e8f5e9', alpha=0.5, zorder=5)
-ax.plot(india_x_scaled, india_y_scaled, 'k-', linewidth=1.5, zorder=6)
-
-# Add hotspot markers (red markers for high-severity events)
-np.random.seed(42)
-n_hotspots = 15
-
-for i in range(n_hotspots):
-    # Random locations on map
-    x = np.random.uniform(1.5, 7.5)
-    y = np.random.uniform(7.2, 10.0)
-    
-    # Severity-based coloring
-    severity = np.random.choice(['high', 'medium', 'low'], p=[0.3, 0.5, 0.2])
-    
-    if severity == 'high':
-        color = '#e74c3c'
-        size = 200
-        alpha = 0.9
-    elif severity == 'medium':
-        color = '#f39c12'
-        size = 150
-        alpha = 0.7
-    else:
-        color = '#f1c40f'
-        size = 100
-        alpha = 0.6
-    
-    # Marker (pin style)
-    marker = Circle((x, y), 0.15, color=color, alpha=alpha, 
-                   edgecolor='darkred' if severity == 'high' else 'black', 
-                   linewidth=1.5, zorder=7)
-    ax.add_patch(marker)
-
-# Map legend
-legend_y = 7.0
-ax.text(1.0, legend_y, '●', fontsize=20, color='#e74c3c', fontweight='bold')
-ax.text(1.4, legend_y, 'High Severity', fontsize=8)
-ax.text(1.0, legend_y - 0.3, '●', fontsize=16, color='#f39c12', fontweight='bold')
-ax.text(1.4, legend_y - 0.3, 'Medium', fontsize=8)
-ax.text(1.0, legend_y - 0.6, '●', fontsize=12, color='#f1c40f', fontweight='bold')
-ax.text(1.4, legend_y - 0.6, 'Low', fontsize=8)
-
-# Map controls (zoom buttons)
-zoom_in = Circle((8.3, 9.8), 0.15, color='white', edgecolor='#2c3e50', linewidth=1.5, zorder=7)
-ax.add_patch(zoom_in)
-ax.text(8.3, 9.8, '+', fontsize=14, fontweight='bold', ha='center', va='center')
-
-zoom_out = Circle((8.3, 9.4), 0.15, color='white', edgecolor='#2c3e50', linewidth=1.5, zorder=7)
-ax.add_patch(zoom_out)
-ax.text(8.3, 9.4, '−', fontsize=14, fontweight='bold', ha='center', va='center')
-
-# --- QUADRANT 2: MetricsPanel Health Score (Top Right) ---
-metrics_box = FancyBboxPatch((9.2, 6.5), 8.5, 4.2,
+STYLE = {
+    'font.family': 'sans-serif',
+    'font.sans-serif': ['Arial', 'DejaVu Sans'],
+    'font.size': 9,
+    'figure.dpi': 300,
+}
+plt.rcParams.update(STYLE)
+
+
+def generate_figure9_dashboard(output_dir=OUTPUT_DIR, data=None):
+    """Figure 9: ALPS Dashboard Real-Time Analytics"""
+    print("\n🎨 Generating Figure 9: ALPS Dashboard Interface...")
+    output_dir = Path(output_dir)
+
+    # Create figure (dashboard layout)
+    fig = plt.figure(figsize=(18, 12))
+    ax = plt.subplot(111)
+    ax.set_xlim(0, 18)
+    ax.set_ylim(0, 12)
+    ax.axis('off')
+
+    # Background (browser/app window)
+    browser_bg = Rectangle((0, 0), 18, 12, facecolor='#f5f5f5', edgecolor='none')
+    ax.add_patch(browser_bg)
+
+    # ============================================================================
+    # TOP NAVIGATION BAR
+    # ============================================================================
+    navbar = Rectangle((0, 11), 18, 1, facecolor='#2c3e50', edgecolor='none', zorder=2)
+    ax.add_patch(navbar)
+
+    # ALPS Logo
+    ax.text(0.5, 11.5, 'ALPS', fontsize=24, fontweight='bold', 
+           color='white', va='center', ha='left')
+    ax.text(1.5, 11.5, 'Autonomous Light Pollution Sentinel', fontsize=11, 
+           color='#ecf0f1', va='center', ha='left', style='italic')
+
+    # Nav menu items
+    nav_items = ['Dashboard', 'Analytics', 'Alerts', 'Settings']
+    nav_x = 10
+    for item in nav_items:
+        is_active = (item == 'Dashboard')
+        bg_color = '#3498db' if is_active else '#34495e'
+
+        nav_btn = FancyBboxPatch((nav_x, 11.15), 1.5, 0.7,
+                                boxstyle="round,pad=0.05",
+                                edgecolor='none',
+                                facecolor=bg_color,
+                                zorder=3)
+        ax.add_patch(nav_btn)
+
+        ax.text(nav_x + 0.75, 11.5, item, fontsize=10, fontweight='bold' if is_active else 'normal',
+               color='white', va='center', ha='center')
+        nav_x += 1.7
+
+    # User info
+    ax.text(17.5, 11.5, '👤 Admin', fontsize=10, color='white', 
+           va='center', ha='right', fontweight='bold')
+
+    # ============================================================================
+    # MAIN CONTENT AREA - 4 QUADRANTS
+    # ============================================================================
+
+    # --- QUADRANT 1: Interactive Map (Top Left) ---
+    map_box = FancyBboxPatch((0.3, 6.5), 8.5, 4.2,
                             boxstyle="round,pad=0.1",
                             edgecolor='#bdc3c7',
                             facecolor='white',
                             linewidth=2, zorder=4)
-ax.add_patch(metrics_box)
-
-# Metrics title bar
-metrics_title_bar = Rectangle((9.2, 10.5), 8.5, 0.4, facecolor='#2ecc71', 
-                             edgecolor='none', zorder=5)
-ax.add_patch(metrics_title_bar)
-ax.text(13.45, 10.7, '(b) System Health & Performance Metrics', 
-       fontsize=11, fontweight='bold', color='white', va='center', ha='center')
-
-# Health score gauge (circular)
-gauge_center_x, gauge_center_y = 13.45, 9.0
-gauge_radius = 0.8
-
-# Background circle
-bg_circle = Circle((gauge_center_x, gauge_center_y), gauge_radius, 
-                  color='#ecf0f1', zorder=5)
-ax.add_patch(bg_circle)
-
-# Health score arc (87/100 = 313 degrees)
-health_score = 87
-theta = health_score / 100 * 360
-
-wedge = Wedge((gauge_center_x, gauge_center_y), gauge_radius, 0, theta, 
-             facecolor='#2ecc71', edgecolor='none', zorder=6)
-ax.add_patch(wedge)
-
-# Center white circle (donut effect)
-center_circle = Circle((gauge_center_x, gauge_center_y), gauge_radius * 0.65, 
-                       color='white', zorder=7)
-ax.add_patch(center_circle)
-
-# Score text
-ax.text(gauge_center_x, gauge_center_y + 0.15, '87', fontsize=28, 
-       fontweight='bold', color='#2ecc71', ha='center', va='center', zorder=8)
-ax.text(gauge_center_x, gauge_center_y - 0.2, '/100', fontsize=12, 
-       color='#7f8c8d', ha='center', va='center', zorder=8)
-ax.text(gauge_center_x, gauge_center_y - 0.5, 'Health Score', fontsize=10, 
-       fontweight='bold', ha='center', va='center', zorder=8)
-
-# Component metrics (below gauge)
-metrics_data = [
-    {'label': 'Detection Precision', 'value': '92%', 'color': '#3498db'},
-    {'label': 'Detection Recall', 'value': '89%', 'color': '#9b59b6'},
-    {'label': 'District Coverage', 'value': '91.6%', 'color': '#e67e22'},
-]
-
-metric_y = 7.8
-for metric in metrics_data:
-    # Metric bar
-    bar = Rectangle((10.0, metric_y), 7.0, 0.35, 
-                   facecolor='#ecf0f1', edgecolor='#bdc3c7', linewidth=1, zorder=5)
-    ax.add_patch(bar)
-    
-    # Progress fill
-    value_pct = float(metric['value'].rstrip('%')) / 100
-    fill = Rectangle((10.0, metric_y), 7.0 * value_pct, 0.35, 
-                    facecolor=metric['color'], edgecolor='none', zorder=6)
-    ax.add_patch(fill)
-    
-    # Label and value
-    ax.text(10.1, metric_y + 0.175, metric['label'], fontsize=9, 
-           fontweight='bold', va='center', ha='left', color='white', zorder=7)
-    ax.text(16.8, metric_y + 0.175, metric['value'], fontsize=9, 
-           fontweight='bold', va='center', ha='right', color='white', zorder=7)
-    
-    metric_y -= 0.5
-
-# Key statistics
-stats_y = 7.0
-stats = [
-    '📊 Observations Processed: 847,250',
-    '🎯 Alert Accuracy: 94.2%',
-    '⏱️ Predictive Lead Time: 18-36 hours',
-    '🔔 Alerts Generated (2024-2025): 419'
-]
-
-for stat in stats:
-    ax.text(13.45, stats_y, stat, fontsize=9, fontweight='bold', 
-           ha='center', va='center',
-           bbox=dict(boxstyle='round,pad=0.3', facecolor='#ecf0f1', 
-                    edgecolor='#bdc3c7', linewidth=1))
-    stats_y -= 0.4
-
-# --- QUADRANT 3: Autonomous Loop Status (Bottom Left) ---
-loop_box = FancyBboxPatch((0.3, 0.5), 8.5, 5.7,
-                         boxstyle="round,pad=0.1",
-                         edgecolor='#bdc3c7',
-                         facecolor='white',
-                         linewidth=2, zorder=4)
-ax.add_patch(loop_box)
-
-# Loop title bar
-loop_title_bar = Rectangle((0.3, 5.9), 8.5, 0.4, facecolor='#9b59b6', 
-                          edgecolor='none', zorder=5)
-ax.add_patch(loop_title_bar)
-ax.text(4.55, 6.1, '(c) Autonomous Loop Status - Live Processing', 
-       fontsize=11, fontweight='bold', color='white', va='center', ha='center')
-
-# Loop phases with status
-phases = [
-    {
-        'name': 'SENSE',
-        'subtitle': 'Satellite Data Ingestion',
-        'status': 'Active',
-        'timestamp': '2025-10-11 14:23:15',
-        'color': '#3498db',
-        'icon': '🛰️',
-        'y_pos': 5.2
-    },
-    {
-        'name': 'REASON',
-        'subtitle': 'ML Analysis & Prediction',
-        'status': 'Processing',
-        'timestamp': '2025-10-11 14:23:18',
-        'color': '#e74c3c',
-        'icon': '🧠',
-        'y_pos': 4.0
-    },
-    {
-        'name': 'ACT',
-        'subtitle': 'Alert Generation',
-        'status': 'Standby',
-        'timestamp': '2025-10-11 14:20:42',
-        'color': '#2ecc71',
-        'icon': '⚡',
-        'y_pos': 2.8
-    },
-    {
-        'name': 'LEARN',
-        'subtitle': 'Model Adaptation',
-        'status': 'Scheduled',
-        'timestamp': 'Next: 2025-11-01',
-        'color': '#f39c12',
-        'icon': '🔄',
-        'y_pos': 1.6
-    }
-]
-
-for phase in phases:
-    # Phase box
-    phase_bg = FancyBboxPatch((0.8, phase['y_pos'] - 0.4), 7.5, 0.9,
+    ax.add_patch(map_box)
+
+    # Map title bar
+    map_title_bar = Rectangle((0.3, 10.5), 8.5, 0.4, facecolor='#3498db', 
+                              edgecolor='none', zorder=5)
+    ax.add_patch(map_title_bar)
+    ax.text(4.55, 10.7, '(a) Interactive District-Level Hotspot Map', 
+           fontsize=11, fontweight='bold', color='white', va='center', ha='center')
+
+    # Simplified India map background
+    india_x_norm, india_y_norm = INDIA_OUTLINE.T
+
+    # Scale to fit in map box
+    def to_map(lon, lat):
+        return 0.8 + (lon - 68) / (97 - 68) * 7.5, 7.0 + (lat - 8) / (35 - 8) * 3.2
+
+    india_x_scaled, india_y_scaled = to_map(india_x_norm, india_y_norm)
+
+    ax.fill(india_x_scaled, india_y_scaled, color='#e8f5e9', alpha=0.5, zorder=5)
+    ax.plot(india_x_scaled, india_y_scaled, 'k-', linewidth=1.5, zorder=6)
+
+    # Add hotspot markers (red markers for high-severity events), placed
+    # inside the outline rather than anywhere in the map box
+    np.random.seed(42)
+    n_hotspots = 15
+    hotspot_x, hotspot_y = to_map(*PolygonIndex.from_ring(INDIA_OUTLINE).sample(
+        n_hotspots, np.random.default_rng(42)))
+
+    for x, y in zip(hotspot_x, hotspot_y):
+        # Severity-based coloring
+        severity = np.random.choice(['high', 'medium', 'low'], p=[0.3, 0.5, 0.2])
+
+        if severity == 'high':
+            color = '#e74c3c'
+            size = 200
+            alpha = 0.9
+        elif severity == 'medium':
+            color = '#f39c12'
+            size = 150
+            alpha = 0.7
+        else:
+            color = '#f1c40f'
+            size = 100
+            alpha = 0.6
+
+        # Marker (pin style)
+        marker = Circle((x, y), 0.15, color=color, alpha=alpha, 
+                       edgecolor='darkred' if severity == 'high' else 'black', 
+                       linewidth=1.5, zorder=7)
+        ax.add_patch(marker)
+
+    # Map legend
+    legend_y = 7.0
+    ax.text(1.0, legend_y, '●', fontsize=20, color='#e74c3c', fontweight='bold')
+    ax.text(1.4, legend_y, 'High Severity', fontsize=8)
+    ax.text(1.0, legend_y - 0.3, '●', fontsize=16, color='#f39c12', fontweight='bold')
+    ax.text(1.4, legend_y - 0.3, 'Medium', fontsize=8)
+    ax.text(1.0, legend_y - 0.6, '●', fontsize=12, color='#f1c40f', fontweight='bold')
+    ax.text(1.4, legend_y - 0.6, 'Low', fontsize=8)
+
+    # Map controls (zoom buttons)
+    zoom_in = Circle((8.3, 9.8), 0.15, color='white', edgecolor='#2c3e50', linewidth=1.5, zorder=7)
+    ax.add_patch(zoom_in)
+    ax.text(8.3, 9.8, '+', fontsize=14, fontweight='bold', ha='center', va='center')
+
+    zoom_out = Circle((8.3, 9.4), 0.15, color='white', edgecolor='#2c3e50', linewidth=1.5, zorder=7)
+    ax.add_patch(zoom_out)
+    ax.text(8.3, 9.4, '−', fontsize=14, fontweight='bold', ha='center', va='center')
+
+    # --- QUADRANT 2: MetricsPanel Health Score (Top Right) ---
+    metrics_box = FancyBboxPatch((9.2, 6.5), 8.5, 4.2,
+                                boxstyle="round,pad=0.1",
+                                edgecolor='#bdc3c7',
+                                facecolor='white',
+                                linewidth=2, zorder=4)
+    ax.add_patch(metrics_box)
+
+    # Metrics title bar
+    metrics_title_bar = Rectangle((9.2, 10.5), 8.5, 0.4, facecolor='#2ecc71', 
+                                 edgecolor='none', zorder=5)
+    ax.add_patch(metrics_title_bar)
+    ax.text(13.45, 10.7, '(b) System Health & Performance Metrics', 
+           fontsize=11, fontweight='bold', color='white', va='center', ha='center')
+
+    # Health score gauge (circular)
+    gauge_center_x, gauge_center_y = 13.45, 9.0
+    gauge_radius = 0.8
+
+    # Background circle
+    bg_circle = Circle((gauge_center_x, gauge_center_y), gauge_radius, 
+                      color='#ecf0f1', zorder=5)
+    ax.add_patch(bg_circle)
+
+    # Health score arc (87/100 = 313 degrees)
+    health_score = 87
+    theta = health_score / 100 * 360
+
+    wedge = Wedge((gauge_center_x, gauge_center_y), gauge_radius, 0, theta, 
+                 facecolor='#2ecc71', edgecolor='none', zorder=6)
+    ax.add_patch(wedge)
+
+    # Center white circle (donut effect)
+    center_circle = Circle((gauge_center_x, gauge_center_y), gauge_radius * 0.65, 
+                           color='white', zorder=7)
+    ax.add_patch(center_circle)
+
+    # Score text
+    ax.text(gauge_center_x, gauge_center_y + 0.15, '87', fontsize=28, 
+           fontweight='bold', color='#2ecc71', ha='center', va='center', zorder=8)
+    ax.text(gauge_center_x, gauge_center_y - 0.2, '/100', fontsize=12, 
+           color='#7f8c8d', ha='center', va='center', zorder=8)
+    ax.text(gauge_center_x, gauge_center_y - 0.5, 'Health Score', fontsize=10, 
+           fontweight='bold', ha='center', va='center', zorder=8)
+
+    # Component metrics (below gauge)
+    metrics_data = [
+        {'label': 'Detection Precision', 'value': '92%', 'color': '#3498db'},
+        {'label': 'Detection Recall', 'value': '89%', 'color': '#9b59b6'},
+        {'label': 'District Coverage', 'value': '91.6%', 'color': '#e67e22'},
+    ]
+
+    metric_y = 7.8
+    for metric in metrics_data:
+        # Metric bar
+        bar = Rectangle((10.0, metric_y), 7.0, 0.35, 
+                       facecolor='#ecf0f1', edgecolor='#bdc3c7', linewidth=1, zorder=5)
+        ax.add_patch(bar)
+
+        # Progress fill
+        value_pct = float(metric['value'].rstrip('%')) / 100
+        fill = Rectangle((10.0, metric_y), 7.0 * value_pct, 0.35, 
+                        facecolor=metric['color'], edgecolor='none', zorder=6)
+        ax.add_patch(fill)
+
+        # Label and value
+        ax.text(10.1, metric_y + 0.175, metric['label'], fontsize=9, 
+               fontweight='bold', va='center', ha='left', color='white', zorder=7)
+        ax.text(16.8, metric_y + 0.175, metric['value'], fontsize=9, 
+               fontweight='bold', va='center', ha='right', color='white', zorder=7)
+
+        metric_y -= 0.5
+
+    # Key statistics
+    stats_y = 7.0
+    stats = [
+        '📊 Observations Processed: 847,250',
+        '🎯 Alert Accuracy: 94.2%',
+        '⏱️ Predictive Lead Time: 18-36 hours',
+        '🔔 Alerts Generated (2024-2025): 419'
+    ]
+
+    for stat in stats:
+        ax.text(13.45, stats_y, stat, fontsize=9, fontweight='bold', 
+               ha='center', va='center',
+               bbox=dict(boxstyle='round,pad=0.3', facecolor='#ecf0f1', 
+                        edgecolor='#bdc3c7', linewidth=1))
+        stats_y -= 0.4
+
+    # --- QUADRANT 3: Autonomous Loop Status (Bottom Left) ---
+    loop_box = FancyBboxPatch((0.3, 0.5), 8.5, 5.7,
                              boxstyle="round,pad=0.1",
-                             edgecolor=phase['color'],
+                             edgecolor='#bdc3c7',
+                             facecolor='white',
+                             linewidth=2, zorder=4)
+    ax.add_patch(loop_box)
+
+    # Loop title bar
+    loop_title_bar = Rectangle((0.3, 5.9), 8.5, 0.4, facecolor='#9b59b6', 
+                              edgecolor='none', zorder=5)
+    ax.add_patch(loop_title_bar)
+    ax.text(4.55, 6.1, '(c) Autonomous Loop Status - Live Processing', 
+           fontsize=11, fontweight='bold', color='white', va='center', ha='center')
+
+    # Loop phases with status
+    phases = [
+        {
+            'name': 'SENSE',
+            'subtitle': 'Satellite Data Ingestion',
+            'status': 'Active',
+            'timestamp': '2025-10-11 14:23:15',
+            'color': '#3498db',
+            'icon': '🛰️',
+            'y_pos': 5.2
+        },
+        {
+            'name': 'REASON',
+            'subtitle': 'ML Analysis & Prediction',
+            'status': 'Processing',
+            'timestamp': '2025-10-11 14:23:18',
+            'color': '#e74c3c',
+            'icon': '🧠',
+            'y_pos': 4.0
+        },
+        {
+            'name': 'ACT',
+            'subtitle': 'Alert Generation',
+            'status': 'Standby',
+            'timestamp': '2025-10-11 14:20:42',
+            'color': '#2ecc71',
+            'icon': '⚡',
+            'y_pos': 2.8
+        },
+        {
+            'name': 'LEARN',
+            'subtitle': 'Model Adaptation',
+            'status': 'Scheduled',
+            'timestamp': 'Next: 2025-11-01',
+            'color': '#f39c12',
+            'icon': '🔄',
+            'y_pos': 1.6
+        }
+    ]
+
+    for phase in phases:
+        # Phase box
+        phase_bg = FancyBboxPatch((0.8, phase['y_pos'] - 0.4), 7.5, 0.9,
+                                 boxstyle="round,pad=0.1",
+                                 edgecolor=phase['color'],
+                                 facecolor='white',
+                                 linewidth=2, zorder=5)
+        ax.add_patch(phase_bg)
+
+        # Icon
+        ax.text(1.1, phase['y_pos'], phase['icon'], fontsize=20, va='center', ha='center')
+
+        # Phase name
+        ax.text(1.6, phase['y_pos'] + 0.15, phase['name'], fontsize=11, 
+               fontweight='bold', color=phase['color'], va='center', ha='left')
+
+        # Subtitle
+        ax.text(1.6, phase['y_pos'] - 0.15, phase['subtitle'], fontsize=8, 
+               style='italic', color='#7f8c8d', va='center', ha='left')
+
+        # Status indicator
+        if phase['status'] == 'Active':
+            status_color = '#2ecc71'
+            status_icon = '●'
+        elif phase['status'] == 'Processing':
+            status_color = '#f39c12'
+            status_icon = '◐'
+        elif phase['status'] == 'Standby':
+            status_color = '#95a5a6'
+            status_icon = '○'
+        else:  # Scheduled
+            status_color = '#3498db'
+            status_icon = '◷'
+
+        ax.text(6.5, phase['y_pos'] + 0.1, f"{status_icon} {phase['status']}", 
+               fontsize=9, fontweight='bold', color=status_color, va='center', ha='left')
+
+        # Timestamp
+        ax.text(6.5, phase['y_pos'] - 0.2, phase['timestamp'], fontsize=7, 
+               color='#7f8c8d', va='center', ha='left', style='italic')
+
+    # --- QUADRANT 4: Recent Alerts Timeline (Bottom Right) ---
+    alerts_box = FancyBboxPatch((9.2, 0.5), 8.5, 5.7,
+                               boxstyle="round,pad=0.1",
+                               edgecolor='#bdc3c7',
+                               facecolor='white',
+                               linewidth=2, zorder=4)
+    ax.add_patch(alerts_box)
+
+    # Alerts title bar
+    alerts_title_bar = Rectangle((9.2, 5.9), 8.5, 0.4, facecolor='#e74c3c', 
+                                edgecolor='none', zorder=5)
+    ax.add_patch(alerts_title_bar)
+    ax.text(13.45, 6.1, '(d) Recent Alerts - Severity-Sorted Notifications', 
+           fontsize=11, fontweight='bold', color='white', va='center', ha='center')
+
+    # Sample alerts
+    alerts = [
+        {
+            'id': 'ALT-2471',
+            'district': 'New Delhi Central',
+            'severity': 'HIGH',
+            'lpi': 97.8,
+            'timestamp': '2025-10-11 14:15:03',
+            'status': 'Sent',
+            'color': '#e74c3c'
+        },
+        {
+            'id': 'ALT-2470',
+            'district': 'Mumbai Suburban',
+            'severity': 'HIGH',
+            'lpi': 95.2,
+            'timestamp': '2025-10-11 13:42:17',
+            'status': 'Sent',
+            'color': '#e74c3c'
+        },
+        {
+            'id': 'ALT-2469',
+            'district': 'Bangalore Urban',
+            'severity': 'MEDIUM',
+            'lpi': 78.4,
+            'timestamp': '2025-10-11 12:30:56',
+            'status': 'Sent',
+            'color': '#f39c12'
+        },
+        {
+            'id': 'ALT-2468',
+            'district': 'Hyderabad',
+            'severity': 'MEDIUM',
+            'lpi': 76.1,
+            'timestamp': '2025-10-11 11:18:23',
+            'status': 'Sent',
+            'color': '#f39c12'
+        },
+        {
+            'id': 'ALT-2467',
+            'district': 'Chennai Metro',
+            'severity': 'LOW',
+            'lpi': 64.3,
+            'timestamp': '2025-10-11 09:45:12',
+            'status': 'Sent',
+            'color': '#f1c40f'
+        }
+    ]
+
+    alert_y = 5.4
+    for i, alert in enumerate(alerts):
+        # Alert card
+        card = FancyBboxPatch((9.6, alert_y - 0.5), 7.7, 0.85,
+                             boxstyle="round,pad=0.08",
+                             edgecolor=alert['color'],
                              facecolor='white',
                              linewidth=2, zorder=5)
-    ax.add_patch(phase_bg)
-    
-    # Icon
-    ax.text(1.1, phase['y_pos'], phase['icon'], fontsize=20, va='center', ha='center')
-    
-    # Phase name
-    ax.text(1.6, phase['y_pos'] + 0.15, phase['name'], fontsize=11, 
-           fontweight='bold', color=phase['color'], va='center', ha='left')
-    
-    # Subtitle
-    ax.text(1.6, phase['y_pos'] - 0.15, phase['subtitle'], fontsize=8, 
-           style='italic', color='#7f8c8d', va='center', ha='left')
-    
-    # Status indicator
-    if phase['status'] == 'Active':
-        status_color = '#2ecc71'
-        status_icon = '●'
-    elif phase['status'] == 'Processing':
-        status_color = '#f39c12'
-        status_icon = '◐'
-    elif phase['status'] == 'Standby':
-        status_color = '#95a5a6'
-        status_icon = '○'
-    else:  # Scheduled
-        status_color = '#3498db'
-        status_icon = '◷'
-    
-    ax.text(6.5, phase['y_pos'] + 0.1, f"{status_icon} {phase['status']}", 
-           fontsize=9, fontweight='bold', color=status_color, va='center', ha='left')
-    
-    # Timestamp
-    ax.text(6.5, phase['y_pos'] - 0.2, phase['timestamp'], fontsize=7, 
-           color='#7f8c8d', va='center', ha='left', style='italic')
-
-# --- QUADRANT 4: Recent Alerts Timeline (Bottom Right) ---
-alerts_box = FancyBboxPatch((9.2, 0.5), 8.5, 5.7,
-                           boxstyle="round,pad=0.1",
-                           edgecolor='#bdc3c7',
-                           facecolor='white',
-                           linewidth=2, zorder=4)
-ax.add_patch(alerts_box)
-
-# Alerts title bar
-alerts_title_bar = Rectangle((9.2, 5.9), 8.5, 0.4, facecolor='#e74c3c', 
-                            edgecolor='none', zorder=5)
-ax.add_patch(alerts_title_bar)
-ax.text(13.45, 6.1, '(d) Recent Alerts - Severity-Sorted Notifications', 
-       fontsize=11, fontweight='bold', color='white', va='center', ha='center')
-
-# Sample alerts
-alerts = [
-    {
-        'id': 'ALT-2471',
-        'district': 'New Delhi Central',
-        'severity': 'HIGH',
-        'lpi': 97.8,
-        'timestamp': '2025-10-11 14:15:03',
-        'status': 'Sent',
-        'color': '#e74c3c'
-    },
-    {
-        'id': 'ALT-2470',
-        'district': 'Mumbai Suburban',
-        'severity': 'HIGH',
-        'lpi': 95.2,
-        'timestamp': '2025-10-11 13:42:17',
-        'status': 'Sent',
-        'color': '#e74c3c'
-    },
-    {
-        'id': 'ALT-2469',
-        'district': 'Bangalore Urban',
-        'severity': 'MEDIUM',
-        'lpi': 78.4,
-        'timestamp': '2025-10-11 12:30:56',
-        'status': 'Sent',
-        'color': '#f39c12'
-    },
-    {
-        'id': 'ALT-2468',
-        'district': 'Hyderabad',
-        'severity': 'MEDIUM',
-        'lpi': 76.1,
-        'timestamp': '2025-10-11 11:18:23',
-        'status': 'Sent',
-        'color': '#f39c12'
-    },
-    {
-        'id': 'ALT-2467',
-        'district': 'Chennai Metro',
-        'severity': 'LOW',
-        'lpi': 64.3,
-        'timestamp': '2025-10-11 09:45:12',
-        'status': 'Sent',
-        'color': '#f1c40f'
-    }
-]
-
-alert_y = 5.4
-for i, alert in enumerate(alerts):
-    # Alert card
-    card = FancyBboxPatch((9.6, alert_y - 0.5), 7.7, 0.85,
-                         boxstyle="round,pad=0.08",
-                         edgecolor=alert['color'],
-                         facecolor='white',
-                         linewidth=2, zorder=5)
-    ax.add_patch(card)
-    
-    # Severity badge
-    badge = Rectangle((9.7, alert_y - 0.15), 1.2, 0.3, 
-                     facecolor=alert['color'], edgecolor='none', zorder=6)
-    ax.add_patch(badge)
-    ax.text(10.3, alert_y, alert['severity'], fontsize=7, fontweight='bold', 
-           color='white', va='center', ha='center')
-    
-    # Alert ID
-    ax.text(11.1, alert_y + 0.15, alert['id'], fontsize=8, fontweight='bold', 
-           color='#2c3e50', va='center', ha='left')
-    
-    # District name
-    ax.text(11.1, alert_y - 0.1, alert['district'], fontsize=8, 
-           color='#7f8c8d', va='center', ha='left')
-    
-    # LPI value
-    ax.text(15.0, alert_y, f"LPI: {alert['lpi']}", fontsize=8, 
-           fontweight='bold', color=alert['color'], va='center', ha='left')
-    
-    # Timestamp
-    ax.text(9.7, alert_y - 0.35, alert['timestamp'], fontsize=7, 
-           color='#95a5a6', va='center', ha='left', style='italic')
-    
-    # Status
-    status_badge = FancyBboxPatch((16.5, alert_y - 0.15), 0.7, 0.25,
-                                 boxstyle="round,pad=0.05",
-                                 edgecolor='#2ecc71',
-                                 facecolor='#d5f4e6',
-                                 linewidth=1, zorder=6)
-    ax.add_patch(status_badge)
-    ax.text(16.85, alert_y, '✓', fontsize=10, color='#2ecc71', 
-           fontweight='bold', va='center', ha='center')
-    
-    alert_y -= 1.0
-
-# ============================================================================
-# FOOTER STATUS BAR
-# ============================================================================
-footer = Rectangle((0, 0), 18, 0.4, facecolor='#34495e', edgecolor='none', zorder=2)
-ax.add_patch(footer)
-
-footer_items = [
-    '✓ System Online',
-    '📡 Last Update: 2025-10-11 14:23:15',
-    '🌐 742 Districts Monitored',
-    '⚙️ Version 1.0.0'
-]
-
-footer_x = 0.5
-for item in footer_items:
-    ax.text(footer_x, 0.2, item, fontsize=8, color='white', va='center', ha='left')
-    footer_x += 4.5
-
-# ============================================================================
-# OVERALL TITLE AND CAPTION
-# ============================================================================
-title_text = 'Figure 9: ALPS Dashboard User Interface and Real-Time Analytics'
-fig.text(0.5, 0.99, title_text, fontsize=16, fontweight='bold', ha='center', va='top')
-
-subtitle = (
-    'Production monitoring system interface showing: (a) Interactive Leaflet map with district hotspot visualization, '
-    '(b) System health metrics (87/100) with component breakdowns, (c) Live autonomous loop status for all four phases, '
-    '(d) Recent alerts panel with severity-based priority routing. Dashboard processes 847,250 observations with 94.2% accuracy.'
-)
-fig.text(0.5, 0.96, subtitle, fontsize=9, ha='center', va='top', style='italic', wrap=True)
-
-# Caption
-caption = (
-    "Figure 9. ALPS Dashboard User Interface and Real-Time Analytics. Screenshot of the production monitoring system "
-    "displaying: (a) Interactive Leaflet map with district-level hotspot visualization (red markers indicate high-severity "
-    "pollution events, orange = medium, yellow = low), (b) MetricsPanel showing system health score (87/100) calculated from "
-    "detection precision (92%), recall (89%), and district coverage (91.6%), (c) Autonomous Loop status indicators for "
-    "SENSE-REASON-ACT-LEARN phases with live processing timestamps showing real-time pipeline execution, (d) Recent alerts "
-    "panel featuring severity-sorted notifications with automated priority routing and delivery confirmation (✓ sent). "
-    "Dashboard processes 847,250 satellite observations with 94.2% alert accuracy and provides 18-36 hour predictive warnings "
-    "for intervention planning. All components update in real-time via WebSocket connections. Five most recent alerts shown "
-    "with alert IDs, district names, LPI values, and timestamps for operational transparency."
-)
-fig.text(0.5, 0.005, caption, wrap=True, ha='center', fontsize=8, style='italic')
-
-plt.tight_layout(rect=[0, 0.02, 1, 0.95])
-
-# Save
-output_pdf = 'd:/agentic-light-sentinel/tmp/exports/figures/figure9_dashboard_interface.pdf'
-output_png = 'd:/agentic-light-sentinel/tmp/exports/figures/figure9_dashboard_interface.png'
-
-plt.savefig(output_pdf, dpi=300, bbox_inches='tight')
-print(f"✅ Saved: {output_pdf}")
-
-plt.savefig(output_png, dpi=300, bbox_inches='tight')
-print(f"✅ Saved: {output_png}")
-
-plt.close()
-
-print("\n🎯 Figure 9 (ALPS Dashboard Interface) generated successfully!")
-print("   ✓ Component (a): Interactive district-level hotspot map")
-print("     • India map with 15 severity-coded markers")
-print("     • Red (high), orange (medium), yellow (low) severity levels")
-print("     • Zoom controls and legend included")
-print("   ✓ Component (b): System health & performance metrics")
-print("     • Health score gauge: 87/100")
-print("     • Detection precision: 92%")
-print("     • Detection recall: 89%")
-print("     • District coverage: 91.6%")
-print("     • Key statistics: 847,250 observations, 94.2% accuracy, 18-36h lead time, 419 alerts")
-print("   ✓ Component (c): Autonomous loop status")
-print("     • SENSE: Active (live satellite ingestion)")
-print("     • REASON: Processing (ML analysis)")
-print("     • ACT: Standby (alert generation)")
-print("     • LEARN: Scheduled (next: Nov 1)")
-print("     • Live timestamps for each phase")
-print("   ✓ Component (d): Recent alerts timeline")
-print("     • 5 most recent alerts with severity sorting")
-print("     • Alert IDs, districts, LPI values, timestamps")
-print("     • Delivery status confirmations")
-print("   ✓ Navigation bar, footer status bar included")
-print("   ✓ Format: PNG at 300 DPI (IEEE compliant)")
-print("   ✓ Ready for Section 3.2.4 (Dashboard Insights)")
+        ax.add_patch(card)
+
+        # Severity badge
+        badge = Rectangle((9.7, alert_y - 0.15), 1.2, 0.3, 
+                         facecolor=alert['color'], edgecolor='none', zorder=6)
+        ax.add_patch(badge)
+        ax.text(10.3, alert_y, alert['severity'], fontsize=7, fontweight='bold', 
+               color='white', va='center', ha='center')
+
+        # Alert ID
+        ax.text(11.1, alert_y + 0.15, alert['id'], fontsize=8, fontweight='bold', 
+               color='#2c3e50', va='center', ha='left')
+
+        # District name
+        ax.text(11.1, alert_y - 0.1, alert['district'], fontsize=8, 
+               color='#7f8c8d', va='center', ha='left')
+
+        # LPI value
+        ax.text(15.0, alert_y, f"LPI: {alert['lpi']}", fontsize=8, 
+               fontweight='bold', color=alert['color'], va='center', ha='left')
+
+        # Timestamp
+        ax.text(9.7, alert_y - 0.35, alert['timestamp'], fontsize=7, 
+               color='#95a5a6', va='center', ha='left', style='italic')
+
+        # Status
+        status_badge = FancyBboxPatch((16.5, alert_y - 0.15), 0.7, 0.25,
+                                     boxstyle="round,pad=0.05",
+                                     edgecolor='#2ecc71',
+                                     facecolor='#d5f4e6',
+                                     linewidth=1, zorder=6)
+        ax.add_patch(status_badge)
+        ax.text(16.85, alert_y, '✓', fontsize=10, color='#2ecc71', 
+               fontweight='bold', va='center', ha='center')
+
+        alert_y -= 1.0
+
+    # ============================================================================
+    # FOOTER STATUS BAR
+    # ============================================================================
+    footer = Rectangle((0, 0), 18, 0.4, facecolor='#34495e', edgecolor='none', zorder=2)
+    ax.add_patch(footer)
+
+    footer_items = [
+        '✓ System Online',
+        '📡 Last Update: 2025-10-11 14:23:15',
+        '🌐 742 Districts Monitored',
+        '⚙️ Version 1.0.0'
+    ]
+
+    footer_x = 0.5
+    for item in footer_items:
+        ax.text(footer_x, 0.2, item, fontsize=8, color='white', va='center', ha='left')
+        footer_x += 4.5
+
+    # ============================================================================
+    # OVERALL TITLE AND CAPTION
+    # ============================================================================
+    title_text = 'Figure 9: ALPS Dashboard User Interface and Real-Time Analytics'
+    fig.text(0.5, 0.99, title_text, fontsize=16, fontweight='bold', ha='center', va='top')
+
+    subtitle = (
+        'Production monitoring system interface showing: (a) Interactive Leaflet map with district hotspot visualization, '
+        '(b) System health metrics (87/100) with component breakdowns, (c) Live autonomous loop status for all four phases, '
+        '(d) Recent alerts panel with severity-based priority routing. Dashboard processes 847,250 observations with 94.2% accuracy.'
+    )
+    fig.text(0.5, 0.96, subtitle, fontsize=9, ha='center', va='top', style='italic', wrap=True)
+
+    # Caption
+    caption = (
+        "Figure 9. ALPS Dashboard User Interface and Real-Time Analytics. Screenshot of the production monitoring system "
+        "displaying: (a) Interactive Leaflet map with district-level hotspot visualization (red markers indicate high-severity "
+        "pollution events, orange = medium, yellow = low), (b) MetricsPanel showing system health score (87/100) calculated from "
+        "detection precision (92%), recall (89%), and district coverage (91.6%), (c) Autonomous Loop status indicators for "
+        "SENSE-REASON-ACT-LEARN phases with live processing timestamps showing real-time pipeline execution, (d) Recent alerts "
+        "panel featuring severity-sorted notifications with automated priority routing and delivery confirmation (✓ sent). "
+        "Dashboard processes 847,250 satellite observations with 94.2% alert accuracy and provides 18-36 hour predictive warnings "
+        "for intervention planning. All components update in real-time via WebSocket connections. Five most recent alerts shown "
+        "with alert IDs, district names, LPI values, and timestamps for operational transparency."
+    )
+    fig.text(0.5, 0.005, caption, wrap=True, ha='center', fontsize=8, style='italic')
+
+    plt.tight_layout(rect=[0, 0.02, 1, 0.95])
+
+    # Save every format from a single render
+    for path in export(fig, output_dir, 'figure9_dashboard_interface'):
+        print(f"✅ Saved: {path}")
+
+    plt.close()
+
+
+if __name__ == '__main__':
+    generate_figure9_dashboard()
+    print("\n🎯 Figure 9 (ALPS Dashboard Interface) generated successfully!")
+    print("   ✓ Component (a): Interactive district-level hotspot map")
+    print("     • India map with 15 severity-coded markers")
+    print("     • Red (high), orange (medium), yellow (low) severity levels")
+    print("     • Zoom controls and legend included")
+    print("   ✓ Component (b): System health & performance metrics")
+    print("     • Health score gauge: 87/100")
+    print("     • Detection precision: 92%")
+    print("     • Detection recall: 89%")
+    print("     • District coverage: 91.6%")
+    print("     • Key statistics: 847,250 observations, 94.2% accuracy, 18-36h lead time, 419 alerts")
+    print("   ✓ Component (c): Autonomous loop status")
+    print("     • SENSE: Active (live satellite ingestion)")
+    print("     • REASON: Processing (ML analysis)")
+    print("     • ACT: Standby (alert generation)")
+    print("     • LEARN: Scheduled (next: Nov 1)")
+    print("     • Live timestamps for each phase")
+    print("   ✓ Component (d): Recent alerts timeline")
+    print("     • 5 most recent alerts with severity sorting")
+    print("     • Alert IDs, districts, LPI values, timestamps")
+    print("     • Delivery status confirmations")
+    print("   ✓ Navigation bar, footer status bar included")
+    print("   ✓ Format: PNG at 300 DPI (IEEE compliant)")
+    print("   ✓ Ready for Section 3.2.4 (Dashboard Insights)")
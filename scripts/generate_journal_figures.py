@@ -4,28 +4,44 @@ Generate all figures for ALPS Journal Paper
 Automated figure generation with IEEE/Elsevier standards
 """
 
+import matplotlib
+matplotlib.use('Agg')  # Use non-interactive backend (also required in worker processes)
 import matplotlib.pyplot as plt
 import matplotlib as mpl
 import numpy as np
 import pandas as pd
 import seaborn as sns
 from pathlib import Path
+import argparse
+import sys
+import textwrap
+import time
 import warnings
 warnings.filterwarnings('ignore')
 
+from alps_figures.beeswarm import beeswarm
+from alps_figures.builder import build, print_report
+from alps_figures.data import load_exports
+from alps_figures.paths import OUTPUT_DIR
+from alps_figures.registry import get_figure
+from alps_figures.render import export
+
 # IEEE-compliant style configuration
-mpl.rcParams['font.family'] = 'sans-serif'
-mpl.rcParams['font.sans-serif'] = ['Arial', 'DejaVu Sans']
-mpl.rcParams['font.size'] = 10
-mpl.rcParams['axes.linewidth'] = 0.8
-mpl.rcParams['grid.linewidth'] = 0.5
-mpl.rcParams['lines.linewidth'] = 1.5
-mpl.rcParams['xtick.major.width'] = 0.8
-mpl.rcParams['ytick.major.width'] = 0.8
-mpl.rcParams['figure.dpi'] = 300
-mpl.rcParams['savefig.dpi'] = 300
-mpl.rcParams['savefig.bbox'] = 'tight'
-mpl.rcParams['savefig.pad_inches'] = 0.05
+STYLE = {
+    'font.family': 'sans-serif',
+    'font.sans-serif': ['Arial', 'DejaVu Sans'],
+    'font.size': 10,
+    'axes.linewidth': 0.8,
+    'grid.linewidth': 0.5,
+    'lines.linewidth': 1.5,
+    'xtick.major.width': 0.8,
+    'ytick.major.width': 0.8,
+    'figure.dpi': 300,
+    'savefig.dpi': 300,
+    'savefig.bbox': 'tight',
+    'savefig.pad_inches': 0.05,
+}
+mpl.rcParams.update(STYLE)
 
 # Color-blind friendly palette
 COLORS = {
@@ -37,30 +53,123 @@ COLORS = {
     'brown': '#949494'
 }
 
-# Output directory
-OUTPUT_DIR = Path('tmp/exports/figures')
-OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
-print(f"📊 ALPS Journal Figure Generator")
-print(f"Output directory: {OUTPUT_DIR}")
-print("=" * 60)
+def state_growth_rates(data, top=10):
+    """Radiance growth (%) between the first and last exported year, per state.
+
+    Returns the ``top`` fastest-growing states (indexed by state name), or
+    None when the district yearly export is unavailable.
+    """
+    yearly = data.district_yearly
+    if yearly is None or yearly.empty:
+        return None
+    by_state = yearly.groupby(['state_code', 'year'])['radiance'].mean().unstack('year')
+    first, last = by_state.iloc[:, 0], by_state.iloc[:, -1]
+    growth = ((last - first) / first * 100).dropna().sort_values(ascending=False).head(top)
+    if data.state_aggregates is not None:
+        names = data.state_aggregates.set_index('state_code')['state_name']
+        growth.index = [names.get(code, code) for code in growth.index]
+    return growth
+
+
+def monthly_seasonality(data):
+    """Monthly radiance distribution over all district-days.
+
+    Returns (median, first quartile, third quartile) per calendar month
+    (NaN for months without rows) and the overall mean radiance, or None
+    when the district daily export is unavailable.
+    """
+    metrics = data.district_daily(['date', 'radiance'])
+    if metrics is None or metrics.empty:
+        return None
+    quartiles = (metrics.groupby(metrics['date'].dt.month)['radiance']
+                 .quantile([0.25, 0.5, 0.75]).unstack().reindex(range(1, 13)))
+    return (quartiles[0.5].to_numpy(), quartiles[0.25].to_numpy(),
+            quartiles[0.75].to_numpy(), float(metrics['radiance'].mean()))
+
+
+def lpi_zone_shares(data):
+    """Share of districts (%) per year in the low/medium/high LPI zones.
+
+    Zones follow Figure 7's thresholds on district radiance (<15, 15-25,
+    >25). Returns (years, low, medium, high) or None without the export.
+    """
+    yearly = data.district_yearly
+    if yearly is None or yearly.empty:
+        return None
+    zones = pd.cut(yearly['radiance'], bins=[-np.inf, 15, 25, np.inf],
+                   labels=['low', 'medium', 'high'], right=False)
+    shares = (pd.crosstab(yearly['year'], zones, normalize='index') * 100)
+    shares = shares.reindex(columns=['low', 'medium', 'high'], fill_value=0)
+    return (shares.index.to_numpy(), shares['low'].to_numpy(),
+            shares['medium'].to_numpy(), shares['high'].to_numpy())
+
+
+def shap_summary(data, top=10, n_samples=None, seed=42):
+    """Top features by mean |SHAP| from the stored attributions.
+
+    Returns (labels, mean |SHAP|, SHAP values of every stored row (or of
+    ``n_samples`` random rows), feature values scaled to 0-1 by rank, years
+    covered), most important first, or None when
+    ``python -m alps_analytics.ml shap`` has not been run.
+    """
+    attributions = data.shap
+    if attributions is None or not len(attributions):
+        return None
+    importance = attributions.mean_abs()
+    order = np.argsort(importance)[::-1][:top]
+    rows = np.arange(len(attributions))
+    if n_samples and n_samples < len(attributions):
+        rows = np.sort(np.random.default_rng(seed).choice(len(attributions), n_samples,
+                                                          replace=False))
+    shap_vals = np.asarray(attributions.shap[rows][:, order], dtype=np.float64)
+    feature_vals = np.asarray(attributions.features[rows][:, order], dtype=np.float64)
+    ranks = feature_vals.argsort(axis=0).argsort(axis=0) / max(len(rows) - 1, 1)
+    years = attributions.dates.astype('datetime64[Y]').astype(int) + 1970
+    return ([attributions.labels[i] for i in order], importance[order],
+            list(shap_vals.T), list(ranks.T), (years.min(), years.max()))
+
+
+# Policy phases of Figure 6 (first and last year)
+PHASES = [('Pre-LED\n(2016-2018)', 2016, 2018), ('LED Transition\n(2019-2022)', 2019, 2022),
+          ('AI-Regulated\n(2023-2025)', 2023, 2025)]
 
 
-def generate_figure2_temporal_trends():
+def shap_phase_importance(data, top=5):
+    """Mean |SHAP| of the top features per policy phase and per year.
+
+    Returns (labels, phase matrix (phases x features, NaN for phases without
+    data), overall mean, inter-annual std) or None without attributions.
+    """
+    attributions = data.shap
+    if attributions is None or not len(attributions):
+        return None
+    overall = attributions.mean_abs()
+    order = np.argsort(overall)[::-1][:top]
+    years = attributions.dates.astype('datetime64[Y]').astype(int) + 1970
+    phases = np.array([attributions.mean_abs(np.flatnonzero((years >= a) & (years <= b)))[order]
+                       for _, a, b in PHASES])
+    annual = np.array([attributions.mean_abs(np.flatnonzero(years == y))[order]
+                       for y in np.unique(years)])
+    return ([attributions.labels[i] for i in order], phases, overall[order], annual.std(axis=0))
+
+
+def generate_figure2_temporal_trends(output_dir=OUTPUT_DIR, data=None):
     """Figure 2: Temporal Trends Analysis (4 panels)"""
     print("\n🎨 Generating Figure 2: Temporal Trends Analysis...")
+    output_dir = Path(output_dir)
+    data = data or load_exports()
+    trends = data.temporal_trends
+    
+    # Panel (a): Annual Radiance Progression
+    years = trends['year'].to_numpy()
+    radiance = trends['avg_radiance'].to_numpy()
+    std_dev = trends['std_dev'].to_numpy()
     
     fig, axes = plt.subplots(2, 2, figsize=(14, 10))
-    fig.suptitle('Temporal Trends in Light Pollution Intensity (2014-2025)', 
+    fig.suptitle(f'Temporal Trends in Light Pollution Intensity ({years[0]}-{years[-1]})', 
                  fontsize=14, fontweight='bold', y=0.995)
     
-    # Panel (a): Annual Radiance Progression
-    years = np.arange(2014, 2026)
-    radiance = np.array([15.20, 15.52, 15.84, 16.16, 16.48, 16.80, 17.12, 
-                        17.44, 17.76, 18.08, 18.40, 18.72])
-    std_dev = np.array([0.45, 0.48, 0.51, 0.53, 0.56, 0.58, 0.60, 
-                        0.62, 0.64, 0.66, 0.68, 0.70])
-    
     axes[0, 0].errorbar(years, radiance, yerr=std_dev*2, 
                         fmt='o-', capsize=5, linewidth=2, markersize=6,
                         color=COLORS['blue'], label='Mean Radiance ± 2σ',
@@ -72,30 +181,39 @@ def generate_figure2_temporal_trends():
     axes[0, 0].set_title('(a) Annual Average Radiance Progression', fontsize=12, pad=10)
     axes[0, 0].legend(fontsize=9, loc='upper left')
     axes[0, 0].grid(alpha=0.3, linestyle=':')
-    axes[0, 0].set_ylim(14, 20)
+    axes[0, 0].set_ylim(np.floor((radiance - 2*std_dev).min()), 
+                        np.ceil((radiance + 2*std_dev).max()))
     
     # Add growth annotation
     growth_pct = ((radiance[-1] - radiance[0]) / radiance[0]) * 100
-    axes[0, 0].annotate(f'+{growth_pct:.1f}% growth', 
-                        xy=(2020, 18.5), fontsize=9,
+    axes[0, 0].annotate(f'{growth_pct:+.1f}% growth', 
+                        xy=(0.5, 0.9), xycoords='axes fraction', fontsize=9,
                         bbox=dict(boxstyle='round,pad=0.3', facecolor='yellow', alpha=0.3))
     
     # Panel (b): Monthly Seasonality Patterns
     months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
               'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-    seasonal_mean = np.array([19.2, 19.5, 18.8, 17.5, 16.8, 14.2, 
-                              13.8, 14.0, 14.5, 16.0, 17.8, 18.9])
-    seasonal_q1 = seasonal_mean - np.array([1.2, 1.3, 1.1, 0.9, 0.8, 0.7, 
-                                            0.7, 0.8, 0.9, 1.0, 1.1, 1.2])
-    seasonal_q3 = seasonal_mean + np.array([1.2, 1.3, 1.1, 0.9, 0.8, 0.7, 
-                                            0.7, 0.8, 0.9, 1.0, 1.1, 1.2])
+    seasonality = monthly_seasonality(data)
+    if seasonality is not None:
+        # District-day radiance per calendar month: median and interquartile range
+        seasonal_mean, seasonal_q1, seasonal_q3, annual_mean = seasonality
+        centre_label = 'Median Radiance'
+    else:
+        seasonal_mean = np.array([19.2, 19.5, 18.8, 17.5, 16.8, 14.2, 
+                                  13.8, 14.0, 14.5, 16.0, 17.8, 18.9])
+        seasonal_q1 = seasonal_mean - np.array([1.2, 1.3, 1.1, 0.9, 0.8, 0.7, 
+                                                0.7, 0.8, 0.9, 1.0, 1.1, 1.2])
+        seasonal_q3 = seasonal_mean + np.array([1.2, 1.3, 1.1, 0.9, 0.8, 0.7, 
+                                                0.7, 0.8, 0.9, 1.0, 1.1, 1.2])
+        annual_mean = 17.0
+        centre_label = 'Mean Radiance'
     
     x_pos = np.arange(len(months))
     axes[0, 1].plot(x_pos, seasonal_mean, 'o-', linewidth=2, 
-                    markersize=6, color=COLORS['green'], label='Mean Radiance')
+                    markersize=6, color=COLORS['green'], label=centre_label)
     axes[0, 1].fill_between(x_pos, seasonal_q1, seasonal_q3, 
                             alpha=0.3, color=COLORS['green'], label='IQR')
-    axes[0, 1].axhline(y=17.0, color='gray', linestyle='--', 
+    axes[0, 1].axhline(y=annual_mean, color='gray', linestyle='--', 
                       linewidth=1, alpha=0.5, label='Annual Mean')
     axes[0, 1].set_xlabel('Month', fontsize=11)
     axes[0, 1].set_ylabel('Radiance (nW/cm²/sr)', fontsize=11)
@@ -110,8 +228,7 @@ def generate_figure2_temporal_trends():
     axes[0, 1].axvspan(5.5, 8.5, alpha=0.15, color='cyan', label='Monsoon Dip')
     
     # Panel (c): Cumulative Hotspot Distribution
-    hotspots = np.array([12450, 12690, 12930, 13170, 13410, 13650, 13890, 
-                         14130, 14370, 14610, 14850, 15090])
+    hotspots = trends['total_hotspots'].to_numpy(dtype=float)
     
     # Exponential fit: y = a * e^(b*x)
     from scipy.optimize import curve_fit
@@ -119,7 +236,7 @@ def generate_figure2_temporal_trends():
         return a * np.exp(b * x)
     
     x_data = np.arange(len(years))
-    popt, _ = curve_fit(exp_func, x_data, hotspots)
+    popt, _ = curve_fit(exp_func, x_data, hotspots, p0=(hotspots[0], 0.01), maxfev=10000)
     hotspots_fit = exp_func(x_data, *popt)
     
     # Calculate R²
@@ -139,11 +256,16 @@ def generate_figure2_temporal_trends():
     axes[1, 0].grid(alpha=0.3, linestyle=':')
     axes[1, 0].ticklabel_format(style='plain', axis='y')
     
-    # Panel (d): Regional Growth Rates (Simulated Heatmap)
-    # States in rows, growth quartiles in columns
-    states = ['Maharashtra', 'Gujarat', 'Karnataka', 'Tamil Nadu', 'UP', 
-              'MP', 'Rajasthan', 'West Bengal', 'Bihar', 'Andhra Pradesh']
-    growth_rates = [35.2, 33.8, 31.5, 29.2, 27.1, 18.5, 16.8, 15.2, 13.9, 12.4]
+    # Panel (d): Regional Growth Rates
+    # Top 10 states by radiance growth from the district yearly export
+    state_growth = state_growth_rates(data)
+    if state_growth is not None:
+        states = state_growth.index.tolist()
+        growth_rates = state_growth.tolist()
+    else:
+        states = ['Maharashtra', 'Gujarat', 'Karnataka', 'Tamil Nadu', 'UP', 
+                  'MP', 'Rajasthan', 'West Bengal', 'Bihar', 'Andhra Pradesh']
+        growth_rates = [35.2, 33.8, 31.5, 29.2, 27.1, 18.5, 16.8, 15.2, 13.9, 12.4]
     
     # Create horizontal bar chart
     y_pos = np.arange(len(states))
@@ -157,99 +279,108 @@ def generate_figure2_temporal_trends():
     axes[1, 1].set_title('(d) Regional Growth Rate Variation', fontsize=12, pad=10)
     axes[1, 1].grid(axis='x', alpha=0.3, linestyle=':')
     axes[1, 1].axvline(x=30, color='red', linestyle='--', linewidth=1, alpha=0.5)
-    axes[1, 1].text(31, 8, 'Industrial States', fontsize=8, color='darkred')
-    axes[1, 1].text(16, 2, 'Agricultural States', fontsize=8, color='green')
+    if state_growth is None:
+        axes[1, 1].text(31, 8, 'Industrial States', fontsize=8, color='darkred')
+        axes[1, 1].text(16, 2, 'Agricultural States', fontsize=8, color='green')
     
     plt.tight_layout(rect=[0, 0, 1, 0.99])
-    output_path = OUTPUT_DIR / 'figure2_temporal_trends.pdf'
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
-    plt.savefig(OUTPUT_DIR / 'figure2_temporal_trends.png', dpi=300, bbox_inches='tight')
+    output_path, _ = export(fig, output_dir, 'figure2_temporal_trends')
     print(f"✅ Saved: {output_path}")
     plt.close()
 
 
-def generate_figure5_shap_summary():
+def generate_figure5_shap_summary(output_dir=OUTPUT_DIR, data=None):
     """Figure 5: SHAP Summary Plot"""
     print("\n🎨 Generating Figure 5: SHAP Summary Plot...")
-    
-    # Simulated SHAP values (in practice, load from your model)
-    features = ['Population Density', 'Energy Consumption', 'Urban Area Index', 
-                'Cloud Cover', 'Industrial Activity', 'Road Lighting Density',
-                'Traffic Density', 'Temperature', 'Humidity', 'Seasonal Patterns']
-    mean_shap = np.array([0.309, 0.273, 0.243, 0.214, 0.208, 
-                          0.206, 0.189, 0.181, 0.153, 0.099])
-    
-    # Generate synthetic SHAP value distributions
-    np.random.seed(42)
-    n_samples = 1000
-    shap_distributions = []
-    feature_values = []
-    
-    for i, shap_mean in enumerate(mean_shap):
-        # Create distribution around mean
-        shap_vals = np.random.normal(shap_mean, shap_mean * 0.3, n_samples)
-        shap_distributions.append(shap_vals)
-        # Feature values (normalized 0-1)
-        feature_vals = np.random.beta(2, 2, n_samples)
-        feature_values.append(feature_vals)
+    output_dir = Path(output_dir)
+    
+    data = data or load_exports()
+    
+    summary = shap_summary(data)
+    if summary is not None:
+        # TreeSHAP values stored by python -m alps_analytics.ml shap
+        features, mean_shap, shap_distributions, feature_values, (first, last) = summary
+        xlabel = 'SHAP Value (Impact on Predicted Radiance)'
+        title = f'SHAP Feature Importance Summary ({first}-{last})'
+    else:
+        # Simulated SHAP values until the attribution stage has been run
+        features = ['Population Density', 'Energy Consumption', 'Urban Area Index', 
+                    'Cloud Cover', 'Industrial Activity', 'Road Lighting Density',
+                    'Traffic Density', 'Temperature', 'Humidity', 'Seasonal Patterns']
+        mean_shap = np.array([0.309, 0.273, 0.243, 0.214, 0.208, 
+                              0.206, 0.189, 0.181, 0.153, 0.099])
+        
+        # Generate synthetic SHAP value distributions
+        np.random.seed(42)
+        n_samples = 1000
+        shap_distributions = []
+        feature_values = []
+        
+        for i, shap_mean in enumerate(mean_shap):
+            # Create distribution around mean
+            shap_vals = np.random.normal(shap_mean, shap_mean * 0.3, n_samples)
+            shap_distributions.append(shap_vals)
+            # Feature values (normalized 0-1)
+            feature_vals = np.random.beta(2, 2, n_samples)
+            feature_values.append(feature_vals)
+        xlabel = 'SHAP Value (Impact on Light Pollution Index)'
+        title = 'SHAP Feature Importance Summary (2016-2025)'
     
     fig, ax = plt.subplots(figsize=(10, 8))
     
-    # Create scatter plot for each feature
     y_positions = np.arange(len(features))
-    
-    for i, feature in enumerate(features[::-1]):  # Reverse order for plotting
-        idx = len(features) - 1 - i
-        shap_vals = shap_distributions[idx]
-        feat_vals = feature_values[idx]
-        
-        # Add jitter to y-axis
-        y_jitter = np.random.normal(y_positions[i], 0.15, len(shap_vals))
-        
-        # Color by feature value
-        scatter = ax.scatter(shap_vals, y_jitter, 
-                            c=feat_vals, cmap='RdBu_r', 
-                            alpha=0.6, s=10, edgecolors='none')
-    
     ax.set_yticks(y_positions)
     ax.set_yticklabels(features[::-1], fontsize=10)
-    ax.set_xlabel('SHAP Value (Impact on Light Pollution Index)', fontsize=12, fontweight='bold')
-    ax.set_title('SHAP Feature Importance Summary (2016-2025)', fontsize=14, fontweight='bold', pad=15)
-    ax.axvline(x=0, color='black', linestyle='-', linewidth=1, alpha=0.5)
+    ax.set_xlabel(xlabel, fontsize=12, fontweight='bold')
+    ax.set_title(title, fontsize=14, fontweight='bold', pad=15)
     ax.grid(axis='x', alpha=0.3, linestyle=':')
     
-    # Add colorbar
-    cbar = plt.colorbar(scatter, ax=ax, pad=0.02)
+    # Colorbar first so the swarm is sized for the final axes
+    cmap, norm = plt.get_cmap('RdBu_r'), mpl.colors.Normalize(0, 1)
+    cbar = plt.colorbar(mpl.cm.ScalarMappable(norm=norm, cmap=cmap), ax=ax, pad=0.02)
     cbar.set_label('Feature Value\n(Low → High)', fontsize=10, rotation=270, labelpad=20)
+    plt.tight_layout()
+    
+    # All features in one collection, most important at the top
+    _, layout = beeswarm(ax, shap_distributions[::-1], feature_values[::-1],
+                         cmap=cmap, norm=norm, alpha=0.8, edgecolors='none')
+    ax.axvline(x=0, color='black', linestyle='-', linewidth=1, alpha=0.5)
+    print(f"   Beeswarm: {len(layout):,} of {layout.total.sum():,} points drawn")
     
     # Add mean SHAP value annotations
     for i, (feature, shap_val) in enumerate(zip(features[::-1], mean_shap[::-1])):
         ax.annotate(f'{shap_val:.3f}', 
-                   xy=(0.32, y_positions[i]), 
-                   fontsize=8, ha='left', va='center',
+                   xy=(0.98, y_positions[i]), xycoords=ax.get_yaxis_transform(),
+                   fontsize=8, ha='right', va='center',
                    bbox=dict(boxstyle='round,pad=0.2', facecolor='white', alpha=0.7))
     
-    plt.tight_layout()
-    output_path = OUTPUT_DIR / 'figure5_shap_summary.pdf'
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
-    plt.savefig(OUTPUT_DIR / 'figure5_shap_summary.png', dpi=300, bbox_inches='tight')
+    output_path, _ = export(fig, output_dir, 'figure5_shap_summary')
     print(f"✅ Saved: {output_path}")
     plt.close()
 
 
-def generate_figure7_urbanization_burden():
+def generate_figure7_urbanization_burden(output_dir=OUTPUT_DIR, data=None):
     """Figure 7: Urbanization Burden Analysis (3 panels)"""
     print("\n🎨 Generating Figure 7: Urbanization Burden Analysis...")
+    output_dir = Path(output_dir)
+    data = data or load_exports()
     
     fig, axes = plt.subplots(1, 3, figsize=(18, 5))
     fig.suptitle('Effect of Urbanization on Light Pollution Burden', 
                  fontsize=14, fontweight='bold')
     
     # Panel (a): Population Structure by LPI Zone
-    years = np.arange(2016, 2026)
-    low_lpi = np.array([62.5, 59.8, 57.2, 55.1, 52.8, 50.5, 48.2, 45.9, 43.6, 41.3])
-    med_lpi = np.array([19.3, 19.9, 20.4, 21.6, 21.8, 22.0, 22.2, 22.4, 22.6, 22.8])
-    high_lpi = np.array([18.2, 20.3, 22.4, 23.3, 25.4, 27.5, 29.6, 31.7, 33.8, 35.9])
+    zone_shares = lpi_zone_shares(data)
+    if zone_shares is not None:
+        # District shares from the yearly export (no population weights exported)
+        years, low_lpi, med_lpi, high_lpi = zone_shares
+        exposure_label = 'Districts (%)'
+    else:
+        years = np.arange(2016, 2026)
+        low_lpi = np.array([62.5, 59.8, 57.2, 55.1, 52.8, 50.5, 48.2, 45.9, 43.6, 41.3])
+        med_lpi = np.array([19.3, 19.9, 20.4, 21.6, 21.8, 22.0, 22.2, 22.4, 22.6, 22.8])
+        high_lpi = np.array([18.2, 20.3, 22.4, 23.3, 25.4, 27.5, 29.6, 31.7, 33.8, 35.9])
+        exposure_label = 'Population Percentage (%)'
     
     axes[0].fill_between(years, 0, low_lpi, 
                          label='Low LPI (<15)', alpha=0.7, color='#2ecc71')
@@ -258,15 +389,17 @@ def generate_figure7_urbanization_burden():
     axes[0].fill_between(years, low_lpi + med_lpi, 100, 
                          label='High LPI (>25)', alpha=0.7, color='#e74c3c')
     axes[0].set_xlabel('Year', fontsize=11)
-    axes[0].set_ylabel('Population Percentage (%)', fontsize=11)
+    axes[0].set_ylabel(exposure_label, fontsize=11)
     axes[0].set_title('(a) Population Exposure by LPI Zone', fontsize=12, pad=10)
     axes[0].legend(fontsize=9, loc='center left', framealpha=0.9)
     axes[0].set_ylim(0, 100)
     axes[0].grid(axis='y', alpha=0.3, linestyle=':')
     
-    # Add annotation for 2025
-    axes[0].annotate('35.9% in high-LPI zones\n(47.2M residents)', 
-                    xy=(2025, 85), xytext=(2021, 75),
+    # Add annotation for the latest year
+    high_note = (f'{high_lpi[-1]:.1f}% in high-LPI zones' if zone_shares is not None
+                 else '35.9% in high-LPI zones\n(47.2M residents)')
+    axes[0].annotate(high_note, 
+                    xy=(years[-1], 85), xytext=(years[-1] - 4, 75),
                     fontsize=8, ha='center',
                     arrowprops=dict(arrowstyle='->', color='red', lw=1.5),
                     bbox=dict(boxstyle='round,pad=0.3', facecolor='yellow', alpha=0.5))
@@ -338,38 +471,26 @@ def generate_figure7_urbanization_burden():
                     ha='center', va='center', fontsize=9, fontweight='bold', color='white')
     
     plt.tight_layout(rect=[0, 0, 1, 0.97])
-    output_path = OUTPUT_DIR / 'figure7_urbanization_burden.pdf'
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
-    plt.savefig(OUTPUT_DIR / 'figure7_urbanization_burden.png', dpi=300, bbox_inches='tight')
+    output_path, _ = export(fig, output_dir, 'figure7_urbanization_burden')
     print(f"✅ Saved: {output_path}")
     plt.close()
 
 
-def generate_figure10_correlation_matrix():
+def generate_figure10_correlation_matrix(output_dir=OUTPUT_DIR, data=None):
     """Figure 10: Correlation Matrix Heatmap"""
     print("\n🎨 Generating Figure 10: Correlation Matrix...")
-    
-    # Data from Table 1
-    data = pd.DataFrame({
-        'Year': range(2014, 2026),
-        'Avg Radiance': [15.20, 15.52, 15.84, 16.16, 16.48, 16.80, 17.12, 
-                         17.44, 17.76, 18.08, 18.40, 18.72],
-        'Total Hotspots': [12450, 12690, 12930, 13170, 13410, 13650, 13890, 
-                           14130, 14370, 14610, 14850, 15090],
-        'Temperature': [24.7, 23.3, 23.6, 25.4, 27.0, 26.9, 25.3, 
-                       23.6, 23.3, 24.8, 26.7, 27.1],
-        'Humidity': [57.2, 62.4, 70.0, 73.0, 68.6, 61.0, 57.0, 
-                    60.4, 68.0, 72.9, 70.5, 63.1],
-        'Cloud Cover': [56.9, 54.8, 50.2, 44.4, 38.7, 34.6, 33.0, 
-                       34.3, 38.3, 43.9, 49.8, 54.5],
-        'Pop Density': [400, 415, 430, 445, 460, 475, 490, 
-                       505, 520, 535, 550, 565],
-        'Energy Usage': [1200, 1285, 1370, 1455, 1540, 1625, 1710, 
-                        1795, 1880, 1965, 2050, 2135]
+    output_dir = Path(output_dir)
+    data = data or load_exports()
+    
+    # Yearly series from correlation_data.csv (Table 1 values if not exported)
+    table = data.correlation_data.rename(columns={
+        'year': 'Year', 'avg_radiance': 'Avg Radiance', 'total_hotspots': 'Total Hotspots',
+        'temperature': 'Temperature', 'humidity': 'Humidity', 'cloud_cover': 'Cloud Cover',
+        'pop_density': 'Pop Density', 'energy_usage': 'Energy Usage',
     })
     
     # Calculate correlation matrix
-    corr_matrix = data.iloc[:, 1:].corr()
+    corr_matrix = table.iloc[:, 1:].corr()
     
     # Create figure
     fig, ax = plt.subplots(figsize=(10, 8))
@@ -382,7 +503,8 @@ def generate_figure10_correlation_matrix():
                 ax=ax, vmin=-1, vmax=1,
                 annot_kws={'fontsize': 9, 'fontweight': 'bold'})
     
-    ax.set_title('Correlation Matrix: Light Pollution and Environmental/Socioeconomic Factors\n(2014-2025, n=12 years)', 
+    ax.set_title('Correlation Matrix: Light Pollution and Environmental/Socioeconomic Factors\n'
+                 f'({table["Year"].min()}-{table["Year"].max()}, n={len(table)} years)', 
                 fontsize=13, fontweight='bold', pad=15)
     
     # Rotate labels
@@ -390,29 +512,49 @@ def generate_figure10_correlation_matrix():
     ax.set_yticklabels(ax.get_yticklabels(), rotation=0, fontsize=10)
     
     plt.tight_layout()
-    output_path = OUTPUT_DIR / 'figure10_correlation_matrix.pdf'
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
-    plt.savefig(OUTPUT_DIR / 'figure10_correlation_matrix.png', dpi=300, bbox_inches='tight')
+    output_path, _ = export(fig, output_dir, 'figure10_correlation_matrix')
     print(f"✅ Saved: {output_path}")
     plt.close()
 
 
-def generate_figure6_feature_evolution():
+def generate_figure6_feature_evolution(output_dir=OUTPUT_DIR, data=None):
     """Figure 6: Feature Importance Evolution (3 panels)"""
     print("\n🎨 Generating Figure 6: Feature Importance Evolution...")
+    output_dir = Path(output_dir)
+    data = data or load_exports()
     
     fig, axes = plt.subplots(1, 3, figsize=(18, 5))
     fig.suptitle('Temporal Evolution of Feature Importance and Lag Effects', 
                  fontsize=14, fontweight='bold')
     
     # Panel (a): Feature Importance by Phase
-    phases = ['Pre-LED\n(2016-2018)', 'LED Transition\n(2019-2022)', 'AI-Regulated\n(2023-2025)']
-    features = ['Energy Cons.', 'Pop. Density', 'Urban Index', 'Policy Factor', 'Smart Infra.']
-    importance_matrix = np.array([
-        [0.31, 0.32, 0.21, 0.08, 0.05],  # Pre-LED
-        [0.24, 0.29, 0.25, 0.18, 0.12],  # LED Transition
-        [0.20, 0.28, 0.24, 0.19, 0.29]   # AI-Regulated
-    ])
+    phases = [label for label, _, _ in PHASES]
+    importance = shap_phase_importance(data)
+    if importance is not None:
+        # Mean |SHAP| per phase from the stored TreeSHAP attributions
+        labels, importance_matrix, cv_mean, annual_std = importance
+        features = [textwrap.fill(label, 16) for label in labels]
+        features_cv = [textwrap.fill(label, 12) for label in labels]
+        cv_std = annual_std
+        importance_label = 'Mean |SHAP| Value'
+        stability_title = '(b) Inter-Annual Stability (95% CI)'
+        ylim = 1.15 * np.nanmax(np.concatenate([importance_matrix.ravel(), cv_mean + 1.96 * cv_std]))
+        # Headroom for the two-column legend above the bars
+        ylim_phase = 1.5 * ylim
+    else:
+        features = ['Energy Cons.', 'Pop. Density', 'Urban Index', 'Policy Factor', 'Smart Infra.']
+        importance_matrix = np.array([
+            [0.31, 0.32, 0.21, 0.08, 0.05],  # Pre-LED
+            [0.24, 0.29, 0.25, 0.18, 0.12],  # LED Transition
+            [0.20, 0.28, 0.24, 0.19, 0.29]   # AI-Regulated
+        ])
+        features_cv = ['Pop.\nDensity', 'Energy\nCons.', 'Urban\nIndex', 
+                       'Cloud\nCover', 'Industrial\nActivity']
+        cv_mean = np.array([0.309, 0.273, 0.243, 0.214, 0.208])
+        cv_std = np.array([0.021, 0.019, 0.018, 0.025, 0.022])
+        importance_label = 'Feature Importance'
+        stability_title = '(b) Cross-Validation Stability (95% CI)'
+        ylim = ylim_phase = 0.35
     
     x = np.arange(len(phases))
     width = 0.15
@@ -424,29 +566,24 @@ def generate_figure6_feature_evolution():
                    label=feature, color=colors_feat[i], alpha=0.8)
     
     axes[0].set_xlabel('Policy Phase', fontsize=11)
-    axes[0].set_ylabel('Feature Importance', fontsize=11)
+    axes[0].set_ylabel(importance_label, fontsize=11)
     axes[0].set_title('(a) Feature Importance Evolution', fontsize=12, pad=10)
     axes[0].set_xticks(x + width * 2)
     axes[0].set_xticklabels(phases, fontsize=9)
     axes[0].legend(fontsize=9, loc='upper left', ncol=2)
     axes[0].grid(axis='y', alpha=0.3, linestyle=':')
-    axes[0].set_ylim(0, 0.35)
+    axes[0].set_ylim(0, ylim_phase)
     
     # Panel (b): Cross-validation Stability
-    features_cv = ['Pop.\nDensity', 'Energy\nCons.', 'Urban\nIndex', 
-                   'Cloud\nCover', 'Industrial\nActivity']
-    cv_mean = np.array([0.309, 0.273, 0.243, 0.214, 0.208])
-    cv_std = np.array([0.021, 0.019, 0.018, 0.025, 0.022])
-    
     x_cv = np.arange(len(features_cv))
     axes[1].bar(x_cv, cv_mean, yerr=cv_std*1.96, capsize=5, 
                color=COLORS['blue'], alpha=0.7, error_kw={'linewidth': 2})
     axes[1].set_ylabel('Mean |SHAP| Value', fontsize=11)
-    axes[1].set_title('(b) Cross-Validation Stability (95% CI)', fontsize=12, pad=10)
+    axes[1].set_title(stability_title, fontsize=12, pad=10)
     axes[1].set_xticks(x_cv)
     axes[1].set_xticklabels(features_cv, fontsize=9)
     axes[1].grid(axis='y', alpha=0.3, linestyle=':')
-    axes[1].set_ylim(0, 0.35)
+    axes[1].set_ylim(0, ylim)
     
     # Panel (c): Lag Correlation Analysis
     lags = np.arange(0, 31)
@@ -479,28 +616,51 @@ def generate_figure6_feature_evolution():
                     bbox=dict(boxstyle='round,pad=0.3', facecolor='yellow', alpha=0.5))
     
     plt.tight_layout(rect=[0, 0, 1, 0.97])
-    output_path = OUTPUT_DIR / 'figure6_feature_evolution.pdf'
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
-    plt.savefig(OUTPUT_DIR / 'figure6_feature_evolution.png', dpi=300, bbox_inches='tight')
+    output_path, _ = export(fig, output_dir, 'figure6_feature_evolution')
     print(f"✅ Saved: {output_path}")
     plt.close()
 
 
-def generate_figure8_model_performance():
+def generate_figure8_model_performance(output_dir=OUTPUT_DIR, data=None):
     """Figure 8: Model Performance Comparison"""
     print("\n🎨 Generating Figure 8: Model Performance Comparison...")
+    output_dir = Path(output_dir)
+    
+    data = data or load_exports()
     
     fig, axes = plt.subplots(1, 3, figsize=(18, 5))
     fig.suptitle('Machine Learning Model Performance Benchmarking', 
                  fontsize=14, fontweight='bold')
     
-    # Data from Table 2
-    models = ['SVM', 'ANN', 'XGBoost', 'LightGBM']
-    r2_scores = [0.847, 0.912, 0.945, 0.952]
-    rmse_scores = [0.179, 0.134, 0.105, 0.095]
-    mape_scores = [8.4, 5.7, 4.2, 3.8]
-    training_times = [45.2, 127.8, 89.3, 56.7]
-    migration_r2 = [0.792, 0.856, 0.918, 0.934]
+    benchmark = data.benchmark
+    if benchmark is not None:
+        # Measured by python -m alps_analytics.ml bench
+        results = benchmark['models']
+        models = [r['model'] for r in results]
+
+        def measured(key):
+            # Undefined scores are stored as null
+            return [np.nan if r[key] is None else r[key] for r in results]
+
+        r2_scores = measured('r2')
+        rmse_scores = measured('rmse')
+        mape_scores = measured('mape')
+        training_times = measured('fit_wall')
+        migration_r2 = measured('migration_r2')
+        host = benchmark['host']
+        fig.text(0.01, 0.01, f"Measured on {benchmark['rows']:,} district-days "
+                 f"({benchmark['train_rows']:,} train), {host['cpu_count']} CPU(s), "
+                 f"{host['machine']}; migration R² over {benchmark['migration_folds']} "
+                 f"state hold-out folds", fontsize=8, color='gray')
+    else:
+        # Data from Table 2
+        models = ['SVM', 'ANN', 'XGBoost', 'LightGBM']
+        r2_scores = [0.847, 0.912, 0.945, 0.952]
+        rmse_scores = [0.179, 0.134, 0.105, 0.095]
+        mape_scores = [8.4, 5.7, 4.2, 3.8]
+        training_times = [45.2, 127.8, 89.3, 56.7]
+        migration_r2 = [0.792, 0.856, 0.918, 0.934]
+    best = int(np.nanargmax(r2_scores))
     
     # Panel (a): Radar Chart
     from math import pi
@@ -508,9 +668,9 @@ def generate_figure8_model_performance():
     # Normalize metrics to 0-1 scale
     metrics_norm = {
         'R²': r2_scores,
-        'Speed': [1 - (t / max(training_times)) for t in training_times],
-        'Low Error': [1 - (m / max(mape_scores)) for m in mape_scores],
-        'Precision': [1 - (r / max(rmse_scores)) for r in rmse_scores]
+        'Speed': [1 - (t / np.nanmax(training_times)) for t in training_times],
+        'Low Error': [1 - (m / np.nanmax(mape_scores)) for m in mape_scores],
+        'Precision': [1 - (r / np.nanmax(rmse_scores)) for r in rmse_scores]
     }
     
     categories = list(metrics_norm.keys())
@@ -520,7 +680,9 @@ def generate_figure8_model_performance():
     
     ax = plt.subplot(131, projection='polar')
     
-    colors_radar = [COLORS['blue'], COLORS['orange'], COLORS['green'], COLORS['red']]
+    model_colors = {'SVM': COLORS['blue'], 'ANN': COLORS['orange'],
+                    'XGBoost': COLORS['green'], 'LightGBM': COLORS['red']}
+    colors_radar = [model_colors.get(model, COLORS['purple']) for model in models]
     
     for i, model in enumerate(models):
         values = [metrics_norm[cat][i] for cat in categories]
@@ -538,41 +700,59 @@ def generate_figure8_model_performance():
     ax.grid(True, linestyle=':', alpha=0.5)
     
     # Panel (b): Pareto Frontier (Speed vs Accuracy)
-    axes[1].scatter(training_times[:3], r2_scores[:3], 
-                   s=[m*50 for m in mape_scores[:3]], 
-                   c=[COLORS['blue'], COLORS['orange'], COLORS['green']], 
+    others = [i for i in range(len(models)) if i != best]
+    axes[1].scatter([training_times[i] for i in others], [r2_scores[i] for i in others], 
+                   s=[mape_scores[i]*50 for i in others], 
+                   c=[colors_radar[i] for i in others], 
                    alpha=0.6, edgecolors='black', linewidths=1.5)
-    axes[1].scatter(training_times[3], r2_scores[3], 
-                   s=mape_scores[3]*50, c=COLORS['red'], 
+    axes[1].scatter(training_times[best], r2_scores[best], 
+                   s=mape_scores[best]*50, c=colors_radar[best], 
                    alpha=0.8, edgecolors='black', linewidths=2,
-                   marker='*', zorder=5, label='LightGBM (Optimal)')
+                   marker='*', zorder=5, label=f'{models[best]} (Optimal)')
     
     for i, model in enumerate(models):
         axes[1].annotate(model, 
                         xy=(training_times[i], r2_scores[i]),
                         xytext=(5, 5), textcoords='offset points',
-                        fontsize=9, fontweight='bold' if i == 3 else 'normal')
+                        fontsize=9, fontweight='bold' if i == best else 'normal')
     
-    axes[1].set_xlabel('Training Time (seconds)', fontsize=11)
+    axes[1].set_xlabel('Training Time (seconds, wall clock)' if benchmark is not None
+                       else 'Training Time (seconds)', fontsize=11)
     axes[1].set_ylabel('R² Score', fontsize=11)
     axes[1].set_title('(b) Efficiency-Accuracy Trade-off\n(bubble size = MAPE)', fontsize=12, pad=10)
     axes[1].grid(alpha=0.3, linestyle=':')
-    axes[1].legend(fontsize=9)
-    axes[1].set_xlim(30, 140)
-    axes[1].set_ylim(0.82, 0.96)
+    # Legend star at a fixed size whatever the measured MAPE
+    axes[1].legend(fontsize=9, markerscale=min(1, np.sqrt(200 / (mape_scores[best] * 50))))
+    if benchmark is not None:
+        # Measured fit times span orders of magnitude across model families
+        if np.nanmax(training_times) > 10 * np.nanmin(training_times):
+            axes[1].set_xscale('log')
+        axes[1].margins(x=0.25, y=0.25)
+    else:
+        axes[1].set_xlim(30, 140)
+        axes[1].set_ylim(0.82, 0.96)
     
     # Panel (c): Migration R² (Cross-region Generalization)
     x_models = np.arange(len(models))
     bars = axes[2].bar(x_models, migration_r2, color=colors_radar, alpha=0.7)
-    axes[2].axhline(y=0.93, color='red', linestyle='--', linewidth=2, 
-                   label='Target: 93% retention', alpha=0.7)
-    
-    # Add value labels on bars
+    if benchmark is not None:
+        # Each model's own random hold-out R², so the drop across regions shows
+        axes[2].scatter(x_models, r2_scores, marker='_', s=900, linewidths=2.5,
+                        color='red', alpha=0.7, zorder=3, label='In-region R² (random hold-out)')
+    else:
+        axes[2].axhline(y=0.93, color='red', linestyle='--', linewidth=2, 
+                       label='Target: 93% retention', alpha=0.7)
+    
+    # Add value labels on bars (inside them when the in-region marks sit on top)
     for i, (bar, val) in enumerate(zip(bars, migration_r2)):
+        if not np.isfinite(val):
+            continue
         height = bar.get_height()
-        axes[2].text(bar.get_x() + bar.get_width()/2., height,
-                    f'{val:.3f}',
-                    ha='center', va='bottom', fontsize=9, fontweight='bold')
+        axes[2].annotate(f'{val:.3f}', (bar.get_x() + bar.get_width()/2., height),
+                        xytext=(0, -4 if benchmark is not None else 0),
+                        textcoords='offset points', ha='center',
+                        va='top' if benchmark is not None else 'bottom',
+                        fontsize=9, fontweight='bold')
     
     axes[2].set_ylabel('Migration R² (Cross-Region)', fontsize=11)
     axes[2].set_title('(c) Generalization Performance', fontsize=12, pad=10)
@@ -580,47 +760,66 @@ def generate_figure8_model_performance():
     axes[2].set_xticklabels(models, fontsize=10)
     axes[2].legend(fontsize=9)
     axes[2].grid(axis='y', alpha=0.3, linestyle=':')
-    axes[2].set_ylim(0.75, 0.95)
-    
-    plt.tight_layout(rect=[0, 0, 1, 0.97])
-    output_path = OUTPUT_DIR / 'figure8_model_performance.pdf'
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
-    plt.savefig(OUTPUT_DIR / 'figure8_model_performance.png', dpi=300, bbox_inches='tight')
+    if benchmark is not None:
+        shown = [v for v in migration_r2 + r2_scores if np.isfinite(v)] or [0.0, 1.0]
+        axes[2].set_ylim(max(0, min(shown) - 0.05), min(1, max(shown) + 0.03))
+    else:
+        axes[2].set_ylim(0.75, 0.95)
+    
+    plt.tight_layout(rect=[0, 0.03 if benchmark is not None else 0, 1, 0.97])
+    output_path, _ = export(fig, output_dir, 'figure8_model_performance')
     print(f"✅ Saved: {output_path}")
     plt.close()
 
 
-def main():
+# Registry names of the figures rendered by main(), in paper order
+JOURNAL_FIGURES = ['fig2', 'fig5', 'fig6', 'fig7', 'fig8', 'fig10']
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Generate ALPS journal paper figures')
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                        help='Number of worker processes (default: 1, render in-process)')
+    parser.add_argument('--force', '-f', action='store_true',
+                        help='Re-render figures even if inputs and code are unchanged')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
     """Generate all journal figures"""
+    args = parse_args(argv)
+
+    print(f"📊 ALPS Journal Figure Generator")
+    print(f"Output directory: {OUTPUT_DIR}")
+    print("=" * 60)
     print("\n🚀 Starting Journal Figure Generation")
+    if args.jobs > 1:
+        print(f"⚙️  Rendering {len(JOURNAL_FIGURES)} figures across {args.jobs} worker processes")
     print("=" * 60)
-    
-    try:
-        generate_figure2_temporal_trends()
-        generate_figure5_shap_summary()
-        generate_figure6_feature_evolution()
-        generate_figure7_urbanization_burden()
-        generate_figure8_model_performance()
-        generate_figure10_correlation_matrix()
-        
-        print("\n" + "=" * 60)
-        print("✅ All figures generated successfully!")
-        print(f"📁 Output directory: {OUTPUT_DIR.absolute()}")
-        print("\nGenerated figures:")
-        for fig_file in sorted(OUTPUT_DIR.glob('*.pdf')):
-            print(f"  - {fig_file.name}")
-        
-        print("\n💡 Next steps:")
-        print("  1. Review generated figures in tmp/exports/figures/")
-        print("  2. Insert figures into Word document at recommended positions")
-        print("  3. Update figure captions with specific data from your system")
-        print("  4. Cross-check all figure references in text")
-        
-    except Exception as e:
-        print(f"\n❌ Error during figure generation: {str(e)}")
-        import traceback
-        traceback.print_exc()
+
+    wall_start = time.perf_counter()
+    results = build([get_figure(name) for name in JOURNAL_FIGURES],
+                    jobs=args.jobs, force=args.force)
+    print_report(results, time.perf_counter() - wall_start)
+
+    failed = [r for r in results if not r.ok]
+    if failed:
+        print(f"❌ {len(failed)} of {len(results)} figures failed")
+        return 1
+
+    print("✅ All figures generated successfully!")
+    print(f"📁 Output directory: {OUTPUT_DIR.absolute()}")
+    print("\nGenerated figures:")
+    for fig_file in sorted(OUTPUT_DIR.glob('*.pdf')):
+        print(f"  - {fig_file.name}")
+
+    print("\n💡 Next steps:")
+    print("  1. Review generated figures in tmp/exports/figures/")
+    print("  2. Insert figures into Word document at recommended positions")
+    print("  3. Update figure captions with specific data from your system")
+    print("  4. Cross-check all figure references in text")
+    return 0
 
 
 if __name__ == '__main__':
-    main()
+    sys.exit(main())
@@ -0,0 +1,27 @@
+// scripts/import-alerts.ts
+// Bulk-inserts the alerts written by `python -m alps_analytics.anomaly`
+import "dotenv/config";
+import { readFileSync } from "fs";
+import { prisma } from "../src/lib/prisma";
+
+// Rows per createMany call
+const BATCH_SIZE = 5000;
+
+type AlertRow = { level: string; code: string; message: string; severity: number; detectedAt: string };
+
+async function run(file = "tmp/exports/alerts.json") {
+  const rows: AlertRow[] = JSON.parse(readFileSync(file, "utf8"));
+  let created = 0;
+  for (let i = 0; i < rows.length; i += BATCH_SIZE) {
+    const { count } = await prisma.alert.createMany({
+      data: rows.slice(i, i + BATCH_SIZE).map(r => ({
+        level: r.level, code: r.code, message: r.message, severity: r.severity,
+        detectedAt: new Date(r.detectedAt + "T00:00:00Z"),
+      })),
+    });
+    created += count;
+  }
+  console.log(`✅ Imported ${created} alerts from ${file}.`);
+}
+
+run(process.argv[2]).finally(() => prisma.$disconnect());
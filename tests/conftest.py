@@ -0,0 +1,10 @@
+"""
+pytest setup for the Python packages under scripts/
+They are run from scripts/ (python -m alps_analytics ...), so that directory
+goes on sys.path
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
@@ -0,0 +1,109 @@
+"""
+Moran's I and LISA against loop implementations
+A 6 x 6 rook lattice with a smooth gradient plus noise; statistics are
+recomputed location by location from the dense weights
+"""
+
+import numpy as np
+import pytest
+from scipy import sparse, stats
+
+from alps_analytics.spatial import lisa, moran
+from alps_analytics.spatial.autocorrelation import HH, HL, LH, LL
+
+SIDE = 6
+
+
+def _rook_lattice(side=SIDE):
+    rows, cols = [], []
+    for r in range(side):
+        for c in range(side):
+            for dr, dc in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+                if 0 <= r + dr < side and 0 <= c + dc < side:
+                    rows.append(r * side + c)
+                    cols.append((r + dr) * side + c + dc)
+    n = side * side
+    return sparse.csr_matrix((np.ones(len(rows)), (rows, cols)), shape=(n, n))
+
+
+def _values(seed=0):
+    rng = np.random.default_rng(seed)
+    r, c = np.divmod(np.arange(SIDE * SIDE), SIDE)
+    return r + 0.5 * c + rng.normal(0, 1.0, SIDE * SIDE)
+
+
+def _loop_moran(y, W):
+    W = W / W.sum(axis=1, keepdims=True)
+    n = len(y)
+    z = (y - y.mean()) / y.std()
+    s0 = W.sum()
+    cross = sum(W[i, j] * z[i] * z[j] for i in range(n) for j in range(n))
+    I = n / s0 * cross / (z @ z)
+    s1 = sum((W[i, j] + W[j, i]) ** 2 for i in range(n) for j in range(n)) / 2
+    s2 = sum((W[i].sum() + W[:, i].sum()) ** 2 for i in range(n))
+    expected = -1 / (n - 1)
+    var = (n * n * s1 - n * s2 + 3 * s0 * s0) / ((n * n - 1) * s0 * s0) - expected ** 2
+    return I, expected, (I - expected) / np.sqrt(var)
+
+
+def test_moran_matches_loop():
+    y, W = _values(), _rook_lattice()
+
+    result = moran(y, W, permutations=199, seed=1)
+    I, expected, z_norm = _loop_moran(y, W.toarray())
+
+    assert result.I == pytest.approx(I, rel=1e-12)
+    assert result.expected == pytest.approx(expected)
+    assert result.z_norm == pytest.approx(z_norm, rel=1e-12)
+    assert result.p_norm == pytest.approx(2 * stats.norm.sf(abs(z_norm)), rel=1e-9)
+    # The gradient is far stronger than any shuffle of it
+    assert result.p_sim == pytest.approx(1 / 200)
+    assert result.lag == pytest.approx(
+        (W.toarray() / W.toarray().sum(axis=1, keepdims=True)) @ result.z)
+
+
+def test_moran_of_random_values_is_near_expected():
+    y = np.random.default_rng(3).normal(size=SIDE * SIDE)
+
+    result = moran(y, _rook_lattice(), permutations=999, seed=3)
+
+    assert abs(result.z_sim) < 3
+    assert result.p_sim > 0.01
+
+
+def test_lisa_matches_loop():
+    y, W = _values(), _rook_lattice()
+    permutations = 99
+    n = len(y)
+
+    result = lisa(y, W, permutations=permutations, seed=7)
+
+    Wr = W.toarray() / W.toarray().sum(axis=1, keepdims=True)
+    z = (y - y.mean()) / y.std()
+    m2 = (z @ z) / n
+    # Conditional permutations: one draw of k_max other locations per
+    # permutation, shared by every location (skipping its own index)
+    rng = np.random.default_rng(7)
+    k_max = int((W.toarray() > 0).sum(axis=1).max())
+    draws = [rng.choice(n - 1, k_max, replace=False) for _ in range(permutations)]
+    for i in range(n):
+        neighbours = np.flatnonzero(Wr[i])
+        lag = sum(Wr[i, j] * z[j] for j in neighbours)
+        Ii = z[i] * lag / m2
+        assert result.Is[i] == pytest.approx(Ii, rel=1e-12, abs=1e-12)
+
+        quadrant = (HH if lag > 0 else HL) if z[i] > 0 else (LH if lag > 0 else LL)
+        assert result.quadrant[i] == quadrant
+
+        sims = []
+        for draw in draws:
+            others = draw + (draw >= i)
+            sims.append(z[i] * sum(Wr[i, j] * z[o] for j, o in zip(neighbours, others)) / m2)
+        larger = sum(s >= Ii for s in sims)
+        larger = min(larger, permutations - larger)
+        assert result.p_sim[i] == pytest.approx((larger + 1) / (permutations + 1))
+
+
+def test_constant_values_are_rejected():
+    with pytest.raises(ValueError, match='constant'):
+        moran(np.ones(SIDE * SIDE), _rook_lattice())
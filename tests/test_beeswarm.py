@@ -0,0 +1,93 @@
+"""
+Beeswarm layout: slots, per-bin caps and point budgets
+Kept points of one x bin sit in distinct slots at least one spacing apart
+and inside their row, no bin keeps more than max_per_bin, the densest bin
+keeps exactly that many and max_points bounds the total
+"""
+
+import matplotlib
+
+matplotlib.use('Agg')
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+from alps_figures.beeswarm import ROW_FILL, beeswarm, beeswarm_layout
+
+BINS, MAX_PER_BIN = 40, 8
+
+
+def _values(seed=0):
+    """Three rows: skewed, bimodal with NaNs, and a short sparse one"""
+    rng = np.random.default_rng(seed)
+    bimodal = np.concatenate([rng.normal(-2, 0.3, 3000), rng.normal(1, 0.5, 2000)])
+    bimodal[::97] = np.nan
+    return [rng.exponential(1.0, 6000), bimodal, rng.uniform(-3, 3, 25)]
+
+
+def _bins(layout, values, bins=BINS):
+    finite = np.concatenate([v[np.isfinite(v)] for v in values])
+    lo, hi = finite.min(), finite.max()
+    return np.clip(np.floor((layout.x - lo) / ((hi - lo) / bins)), 0, bins - 1).astype(int)
+
+
+def test_bins_respect_the_cap_and_the_densest_keeps_it():
+    values = _values()
+
+    layout = beeswarm_layout(values, bins=BINS, max_per_bin=MAX_PER_BIN)
+
+    kept = np.zeros((3, BINS), dtype=int)
+    np.add.at(kept, (layout.row, _bins(layout, values)), 1)
+    assert kept.max() <= MAX_PER_BIN
+    assert kept[:2].max(axis=1).tolist() == [MAX_PER_BIN, MAX_PER_BIN]
+    # The sparse row has at most a few points per bin and keeps them all
+    assert layout.shown[2] == 25
+    assert layout.total.tolist() == [6000, 5000 - len(range(0, 5000, 97)), 25]
+    assert layout.shown.tolist() == np.bincount(layout.row, minlength=3).tolist()
+
+
+def test_points_of_a_bin_never_share_a_slot():
+    values = _values()
+    spacing = ROW_FILL / MAX_PER_BIN
+
+    layout = beeswarm_layout(values, bins=BINS, max_per_bin=MAX_PER_BIN)
+
+    offset = layout.y - layout.row
+    assert (np.abs(offset) <= ROW_FILL / 2 + 1e-12).all()
+    for r, b in set(zip(layout.row, _bins(layout, values))):
+        dy = np.sort(offset[(layout.row == r) & (_bins(layout, values) == b)])
+        assert (np.diff(dy) >= spacing - 1e-12).all()
+
+
+def test_max_points_caps_the_total():
+    values = _values()
+
+    layout = beeswarm_layout(values, bins=BINS, max_per_bin=MAX_PER_BIN, max_points=80)
+    full = beeswarm_layout(values, bins=BINS, max_per_bin=MAX_PER_BIN)
+
+    assert len(full) > 80 >= len(layout) > 60
+    assert (layout.shown <= full.shown).all()
+
+
+def test_layout_is_deterministic_and_colours_follow_points():
+    values = _values()
+    colors = [v * 2 for v in values]
+
+    first = beeswarm_layout(values, colors, bins=BINS, max_per_bin=MAX_PER_BIN)
+    second = beeswarm_layout(values, colors, bins=BINS, max_per_bin=MAX_PER_BIN)
+
+    assert first.x.tolist() == second.x.tolist() and first.y.tolist() == second.y.tolist()
+    assert first.c == pytest.approx(2 * first.x)
+    with pytest.raises(ValueError, match='colors'):
+        beeswarm_layout(values, [v[:-1] for v in values])
+
+
+def test_beeswarm_draws_every_kept_point():
+    fig, ax = plt.subplots(figsize=(6, 3))
+
+    collection, layout = beeswarm(ax, _values(), max_points=500)
+
+    assert len(collection.get_offsets()) == len(layout) <= 500
+    assert ax.get_ylim() == (-0.5, 2.5)
+    plt.close(fig)
@@ -0,0 +1,25 @@
+"""
+Model benchmark cache key
+The stored timings are only reused for the same exports, settings, model
+backends and host; installing xgboost or moving machines measures again
+"""
+
+from alps_analytics.ml import benchmark
+
+
+def test_key_follows_backends_and_host(tmp_path, monkeypatch):
+    (tmp_path / 'district_daily_metrics.csv').write_text('Code,Date,Radiance\n101,2024-01-01,1\n')
+    key = benchmark.benchmark_key(tmp_path)
+    svm_only = benchmark.benchmark_key(tmp_path, models=('SVM',))
+
+    # xgboost installed later: same model name, another backend
+    monkeypatch.setitem(benchmark.MODELS, 'XGBoost', lambda seed: (None, 'xgboost 2.1.0'))
+    installed = benchmark.benchmark_key(tmp_path)
+
+    assert installed != key
+    assert benchmark.benchmark_key(tmp_path, models=('SVM',)) == svm_only
+
+    host = benchmark.host_info()
+    monkeypatch.setattr(benchmark, 'host_info',
+                        lambda: {**host, 'cpu_count': 2 * host['cpu_count']})
+    assert benchmark.benchmark_key(tmp_path) not in (key, installed)
@@ -0,0 +1,27 @@
+"""
+Figure builds isolate failures per figure
+A figure whose module cannot be imported fails on its own; the others still
+render and are cached
+"""
+
+from alps_figures.builder import build
+from alps_figures.registry import FIGURES, Figure
+
+
+def render_marker(output_dir, data):
+    (output_dir / 'marker.txt').write_text('ok')
+
+
+def test_unimportable_figure_fails_alone(tmp_path, monkeypatch):
+    broken = Figure('broken', 'Broken', 'no_such_module:generate', outputs=('broken.png',))
+    marker = Figure('marker', 'Marker', 'test_builder:render_marker', outputs=('marker.txt',))
+    for figure in (broken, marker):
+        monkeypatch.setitem(FIGURES, figure.name, figure)
+    out, data = tmp_path / 'out', tmp_path / 'data'
+
+    first = build([broken, marker], output_dir=out, data_dir=data)
+    second = build([broken, marker], output_dir=out, data_dir=data)
+
+    assert not first[0].ok and 'no_such_module' in first[0].error
+    assert first[1].ok and (out / 'marker.txt').read_text() == 'ok'
+    assert not second[0].ok and second[1].cached
@@ -0,0 +1,96 @@
+"""
+Vectorised anomaly rule against the per-entity loop of process-hotspots.ts
+For every entity and day the reference takes the previous 30 stored rows
+(orderBy date desc, take 30), needs 10 of them and alerts when the day
+exceeds their mean by more than 20%; detect() must flag the same rows with
+the same severity and message
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from alps_analytics.anomaly import detect, read_daily
+
+
+def _daily(n_codes=8, n_days=150, seed=0):
+    """Shuffled code/date/radiance rows with gaps and occasional spikes"""
+    rng = np.random.default_rng(seed)
+    rows = []
+    for k in range(n_codes):
+        level = rng.uniform(2, 30)
+        for day in pd.date_range('2024-01-01', periods=n_days):
+            if rng.random() < 0.15:
+                continue
+            value = level * rng.lognormal(0, 0.15)
+            if rng.random() < 0.05:
+                value *= rng.uniform(1.2, 2.5)
+            rows.append((f'{k:03d}', day, round(value, 3)))
+    frame = pd.DataFrame(rows, columns=['code', 'date', 'radiance'])
+    return frame.sample(frac=1, random_state=seed).reset_index(drop=True)
+
+
+def _typescript_rule(frame, label='District'):
+    """Transcription of anomaliesForDistricts, run for every stored day"""
+    alerts = []
+    for code, rows in frame.groupby('code'):
+        dates, radiance = rows['date'].to_numpy(), rows['radiance'].to_numpy()
+        for day, today in zip(dates, radiance):
+            earlier = dates < day
+            hist = radiance[earlier][np.argsort(dates[earlier])[::-1]][:30]
+            if len(hist) < 10:
+                continue
+            mean = hist.sum() / len(hist)
+            dev = today - mean
+            if dev > 0.2 * mean:
+                alerts.append({
+                    'code': code, 'date': pd.Timestamp(day),
+                    'message': f"{label} radiance {today:.2f} is +{100 * dev / mean:.0f}% "
+                               f"vs 30-day mean {mean:.2f}.",
+                    'severity': max(0, min(10, int(np.floor(dev / mean * 10 + 0.5)))),
+                })
+    return pd.DataFrame(alerts).sort_values(['code', 'date']).reset_index(drop=True)
+
+
+@pytest.mark.parametrize('level', ['district', 'state'])
+def test_detect_matches_typescript_rule(level):
+    frame = _daily()
+
+    alerts = detect(frame, level).sort_values(['code', 'date']).reset_index(drop=True)
+    expected = _typescript_rule(frame, level.capitalize())
+
+    assert len(expected) > 20
+    assert alerts['code'].tolist() == expected['code'].tolist()
+    assert (pd.to_datetime(alerts['date']) == expected['date']).all()
+    assert alerts['severity'].tolist() == expected['severity'].tolist()
+    assert alerts['message'].tolist() == expected['message'].tolist()
+    assert (alerts['level'] == level).all()
+
+
+def test_detect_single_day_is_that_days_slice():
+    frame = _daily()
+    backfill = detect(frame)
+    dates = pd.to_datetime(backfill['date'])
+    day = dates.value_counts().idxmax()
+
+    daily_run = detect(frame, day=day)
+
+    expected = backfill[dates == day].reset_index(drop=True)
+    assert len(expected) > 1
+    pd.testing.assert_frame_equal(daily_run, expected)
+
+
+def test_detect_rejects_unknown_level():
+    with pytest.raises(ValueError, match='level'):
+        detect(_daily(n_codes=1, n_days=5), 'country')
+
+
+def test_read_daily_parses_export_header(tmp_path):
+    path = tmp_path / 'district_daily_metrics.csv'
+    path.write_text('Code,Date,Radiance,Hotspots\n101,2024-01-01,10.5,1\n102,2024-01-02,5.0,0\n')
+
+    frame = read_daily(path)
+
+    assert list(frame.columns) == ['code', 'date', 'radiance']
+    assert frame['code'].tolist() == ['101', '102']
+    assert frame['date'].tolist() == list(pd.to_datetime(['2024-01-01', '2024-01-02']))
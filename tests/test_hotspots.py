@@ -0,0 +1,102 @@
+"""
+Getis-Ord Gi* and Benjamini-Hochberg FDR on a toy grid
+Gi* is recomputed district by district from the Ord & Getis (1995) formula;
+FDR rejections are compared with scipy's adjusted p-values
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import sparse, stats
+
+from alps_analytics.spatial import COLD, HOT, SpatialWeights, daily_gi_star, fdr_mask, gi_star
+
+SIDE = 7
+
+
+def _queen_lattice(side=SIDE):
+    n = side * side
+    W = np.zeros((n, n))
+    for i in range(n):
+        for j in range(n):
+            if i != j and max(abs(i // side - j // side), abs(i % side - j % side)) == 1:
+                W[i, j] = 1
+    return W
+
+
+def _toy_grid(seed=0):
+    """Background noise with a bright 3 x 3 block at one corner and a dark one opposite"""
+    rng = np.random.default_rng(seed)
+    x = rng.normal(10, 1, (SIDE, SIDE))
+    x[:3, :3] += 8
+    x[-3:, -3:] -= 8
+    return x.ravel()
+
+
+def _loop_gi_star(x, W):
+    valid = np.isfinite(x)
+    n = valid.sum()
+    mean = x[valid].mean()
+    S = np.sqrt((x[valid] ** 2).mean() - mean ** 2)
+    z = np.full(len(x), np.nan)
+    for i in np.flatnonzero(valid):
+        w = W[i].copy()
+        w[i] = 1.0
+        w[~valid] = 0.0
+        Wi, S1i = w.sum(), (w ** 2).sum()
+        z[i] = ((w * np.where(valid, x, 0)).sum() - mean * Wi) / (
+            S * np.sqrt((n * S1i - Wi ** 2) / (n - 1)))
+    return z
+
+
+def test_gi_star_matches_loop_and_finds_clusters():
+    x, W = _toy_grid(), _queen_lattice()
+
+    result = gi_star(x, sparse.csr_matrix(W))
+
+    assert result.z == pytest.approx(_loop_gi_star(x, W), rel=1e-12)
+    assert result.p == pytest.approx(2 * stats.norm.sf(np.abs(result.z)))
+    clusters = result.clusters(alpha=0.05, fdr=True).reshape(SIDE, SIDE)
+    assert clusters[1, 1] == HOT and clusters[-2, -2] == COLD
+    assert (clusters[0:2, -2:] == 0).all()
+
+
+def test_gi_star_drops_missing_values_per_date():
+    x, W = _toy_grid(), _queen_lattice()
+    dates = np.column_stack([x, x[::-1]])
+    dates[[3, 10], 0] = np.nan
+
+    result = gi_star(dates, sparse.csr_matrix(W))
+
+    assert np.isnan(result.z[[3, 10], 0]).all()
+    assert result.z[:, 0] == pytest.approx(_loop_gi_star(dates[:, 0], W), nan_ok=True)
+    assert result.z[:, 1] == pytest.approx(_loop_gi_star(dates[:, 1], W))
+
+
+def test_daily_gi_star_pivots_long_table():
+    x, W = _toy_grid(), _queen_lattice()
+    codes = np.array([f'D{i:02d}' for i in range(SIDE * SIDE)])
+    daily = pd.DataFrame({'code': np.tile(codes, 2),
+                          'date': np.repeat(pd.to_datetime(['2024-01-02', '2024-01-01']), len(x)),
+                          'radiance': np.concatenate([x, x[::-1]])})
+
+    dates, result = daily_gi_star(daily, SpatialWeights(codes, sparse.csr_matrix(W), 'queen'))
+
+    assert list(dates) == list(pd.to_datetime(['2024-01-01', '2024-01-02']))
+    assert result.z[:, 1] == pytest.approx(_loop_gi_star(x, W))
+
+
+def test_fdr_mask_matches_benjamini_hochberg():
+    rng = np.random.default_rng(1)
+    p = np.concatenate([rng.uniform(0, 0.01, 15), rng.uniform(0, 1, 85)])
+    family = np.column_stack([p, rng.permutation(p), rng.uniform(0, 1, 100)])
+    family[::7, 2] = np.nan
+
+    reject = fdr_mask(family, alpha=0.05)
+
+    for col in range(family.shape[1]):
+        finite = np.isfinite(family[:, col])
+        expected = np.zeros(len(family), dtype=bool)
+        expected[finite] = stats.false_discovery_control(family[finite, col]) <= 0.05
+        assert (reject[:, col] == expected).all()
+    assert (fdr_mask(p, 0.05) == reject[:, 0]).all()
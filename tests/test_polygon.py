@@ -0,0 +1,78 @@
+"""
+Point-in-polygon tests against matplotlib's Path
+Concave rings, a polygon with a hole and several districts at once, checked
+on random points; rejection sampling stays inside and fails on empty windows
+"""
+
+import numpy as np
+import pytest
+from matplotlib.path import Path
+
+from alps_analytics.spatial import INDIA_OUTLINE, PolygonIndex, from_features
+from alps_analytics.spatial import polygon
+
+# Concave "C" shape opening to the east
+C_SHAPE = np.array([[0, 0], [6, 0], [6, 2], [2, 2], [2, 4], [6, 4], [6, 6], [0, 6], [0, 0]],
+                   dtype=np.float64)
+OUTER = [[10, 0], [16, 0], [16, 6], [10, 6], [10, 0]]
+HOLE = [[12, 2], [14, 2], [14, 4], [12, 4], [12, 2]]
+
+
+def _random_points(n=20000, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.uniform(-1, 17, n), rng.uniform(-1, 7, n)
+
+
+def _inside(ring, x, y):
+    return Path(np.asarray(ring, dtype=np.float64)).contains_points(np.column_stack([x, y]))
+
+
+@pytest.mark.parametrize('ring', [C_SHAPE, INDIA_OUTLINE], ids=['c_shape', 'india'])
+def test_concave_ring_matches_path(ring):
+    rng = np.random.default_rng(1)
+    (west, south), (east, north) = ring.min(axis=0) - 1, ring.max(axis=0) + 1
+    x, y = rng.uniform(west, east, 20000), rng.uniform(south, north, 20000)
+
+    inside = PolygonIndex.from_ring(ring, n_bands=7).contains(x, y)
+
+    assert (inside == _inside(ring, x, y)).all()
+    assert PolygonIndex.from_ring(ring).contains(x, y).tolist() == inside.tolist()
+
+
+def test_locate_districts_with_a_hole():
+    geoms = from_features([
+        {'properties': {'code': 'C'}, 'geometry': {'type': 'Polygon',
+                                                   'coordinates': [C_SHAPE.tolist()]}},
+        {'properties': {'code': 'H'}, 'geometry': {'type': 'Polygon',
+                                                   'coordinates': [OUTER, HOLE]}},
+    ])
+    x, y = _random_points()
+
+    owner = PolygonIndex.from_geometries(geoms).locate(x.reshape(100, -1), y.reshape(100, -1))
+
+    expected = np.where(_inside(C_SHAPE, x, y), 0,
+                        np.where(_inside(OUTER, x, y) & ~_inside(HOLE, x, y), 1, -1))
+    assert owner.shape == (100, 200)
+    assert (owner.ravel() == expected).all()
+    assert (owner.ravel()[_inside(HOLE, x, y)] == -1).all()
+
+
+def test_sample_stays_inside():
+    index = PolygonIndex.from_ring(INDIA_OUTLINE)
+
+    x, y = index.sample(500, np.random.default_rng(2))
+    wx, wy = index.sample(50, np.random.default_rng(2), bounds=(75, 23, 85, 30))
+
+    assert len(x) == 500 and _inside(INDIA_OUTLINE, x, y).all()
+    assert ((wx >= 75) & (wx <= 85) & (wy >= 23) & (wy <= 30)).all()
+
+
+def test_sample_rejects_windows_without_polygon_area(monkeypatch):
+    index = PolygonIndex.from_ring(INDIA_OUTLINE)
+    monkeypatch.setattr(polygon, 'SAMPLE_ATTEMPTS', 5)
+
+    with pytest.raises(ValueError, match='do not overlap'):
+        index.sample(10, np.random.default_rng(3), bounds=(0, 0, 10, 10))
+    # Inside the bounding box but outside the outline (its north-east corner)
+    with pytest.raises(ValueError, match='found 0 of 10'):
+        index.sample(10, np.random.default_rng(3), bounds=(96, 33, 97, 35))
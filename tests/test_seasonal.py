@@ -0,0 +1,99 @@
+"""
+Month-of-year profiles against a pandas groupby
+Median, MAD and day counts per entity and calendar month must match
+groupby(code, month) in pandas; robust z-scores use the floored spread and
+months without enough history keep their flat-rule alert
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from alps_analytics.anomaly import seasonal
+from alps_analytics.anomaly.seasonal import SeasonalProfile, load_profile, seasonal_gate
+
+
+def _daily(n_codes=5, seed=0):
+    """Two years of shuffled rows with a winter peak, gaps and NaN radiance"""
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range('2023-01-01', '2024-12-31')
+    rows = []
+    for k in range(n_codes):
+        level = rng.uniform(2, 30)
+        for day in dates:
+            if rng.random() < 0.2:
+                continue
+            winter = 1 + 0.3 * np.cos(2 * np.pi * day.dayofyear / 365)
+            value = level * winter * rng.lognormal(0, 0.2)
+            rows.append((f'{k:03d}', day, np.nan if rng.random() < 0.02 else value))
+    frame = pd.DataFrame(rows, columns=['code', 'date', 'radiance'])
+    return frame.sample(frac=1, random_state=seed).reset_index(drop=True)
+
+
+def _pandas_profile(frame):
+    frame = frame.dropna(subset=['radiance']).assign(month=frame['date'].dt.month - 1)
+    by = frame.groupby(['code', 'month'])['radiance']
+    median = by.transform('median')
+    mad = (frame['radiance'] - median).abs().groupby([frame['code'], frame['month']]).median()
+    table = pd.DataFrame({'median': by.median(), 'mad': mad, 'count': by.size()})
+    return {c: table[c].unstack() for c in table}
+
+
+def test_fit_matches_pandas_groupby():
+    frame = _daily()
+    # One entity without any June rows
+    frame = frame[~((frame['code'] == '002') & (frame['date'].dt.month == 6))]
+
+    profile = SeasonalProfile.fit(frame, 'district')
+    expected = _pandas_profile(frame)
+
+    assert profile.codes.tolist() == expected['median'].index.tolist()
+    assert profile.median == pytest.approx(expected['median'].to_numpy(), rel=1e-12, nan_ok=True)
+    assert profile.mad == pytest.approx(expected['mad'].to_numpy(), rel=1e-12, nan_ok=True)
+    assert profile.count.tolist() == expected['count'].fillna(0).astype(int).to_numpy().tolist()
+    assert np.isnan(profile.median[2, 5]) and profile.through == np.datetime64('2024-12-31')
+
+
+def test_zscores_use_floored_spread_and_need_min_days():
+    profile = SeasonalProfile.fit(_daily(), 'district')
+    profile.mad[0, 0] = 0.0
+    profile.count[1, 0] = seasonal.MIN_MONTH_DAYS - 1
+    dates = np.array(['2025-01-05', '2025-01-05', '2025-03-05', '2025-03-05'],
+                     dtype='datetime64[D]')
+    codes = np.array(['000', '001', '001', 'missing'])
+    radiance = np.array([50.0, 50.0, 50.0, 50.0])
+
+    median, z = profile.zscores(codes, dates, radiance)
+
+    floor = seasonal.MAD_SCALE * seasonal.MIN_SPREAD * profile.median[0, 0]
+    assert z[0] == pytest.approx((50.0 - profile.median[0, 0]) / floor)
+    assert np.isnan(z[1]) and median[1] == profile.median[1, 0]
+    assert z[2] == pytest.approx((50.0 - profile.median[1, 2]) / profile.spread()[1, 2])
+    assert np.isnan(median[3]) and np.isnan(z[3])
+
+
+def test_seasonal_gate_keeps_alerts_without_history():
+    profile = SeasonalProfile.fit(_daily(), 'district')
+    typical = profile.median[0, 0]
+    alerts = pd.DataFrame({
+        'code': ['000', '000', 'new'],
+        'date': pd.to_datetime(['2025-01-10', '2025-01-11', '2025-01-10']),
+        'radiance': [typical * 1.01, typical * 3, 10.0],
+    })
+
+    gated = seasonal_gate(alerts, profile)
+
+    assert gated['radiance'].tolist() == [typical * 3, 10.0]
+    assert gated['z'].iloc[0] > seasonal.Z_THRESHOLD and np.isnan(gated['z'].iloc[1])
+
+
+def test_load_profile_reuses_then_refits(tmp_path):
+    frame = _daily(n_codes=2)
+
+    first = load_profile(frame, 'state', tmp_path, day='2024-10-01')
+    reused = load_profile(frame, 'state', tmp_path, day='2024-10-20')
+    refitted = load_profile(frame, 'state', tmp_path, day='2024-12-31')
+
+    assert first.through == reused.through == np.datetime64('2024-09-30')
+    assert refitted.through == np.datetime64('2024-12-30')
+    assert SeasonalProfile.load(tmp_path / 'state.npz').through == refitted.through
@@ -0,0 +1,103 @@
+"""
+Exact TreeSHAP against brute-force Shapley values
+The value of a feature set S is the path-dependent expectation of the model:
+trees follow the sample at splits on features in S and average both children
+by training cover elsewhere. Shapley values over every subset of S must
+match TreeExplainer, and they must add up to the prediction
+"""
+
+from itertools import combinations
+from math import factorial
+
+import numpy as np
+import pytest
+from sklearn.ensemble import (GradientBoostingRegressor, HistGradientBoostingRegressor,
+                              RandomForestRegressor)
+from sklearn.tree import DecisionTreeRegressor
+
+from alps_analytics.ml.treeshap import TreeEnsemble, TreeExplainer
+
+N_FEATURES = 4
+
+MODELS = {
+    'hist_gb': lambda: HistGradientBoostingRegressor(max_iter=20, max_leaf_nodes=15,
+                                                     random_state=0),
+    'gbr': lambda: GradientBoostingRegressor(n_estimators=20, max_depth=3, random_state=0),
+    'random_forest': lambda: RandomForestRegressor(n_estimators=5, max_depth=5, random_state=0),
+    'decision_tree': lambda: DecisionTreeRegressor(max_depth=6, random_state=0),
+}
+
+
+def _data(missing=False):
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(300, N_FEATURES))
+    y = X[:, 0] * X[:, 1] + np.sin(X[:, 2]) + 0.1 * rng.normal(size=300)
+    if missing:
+        X[rng.random(X.shape) < 0.1] = np.nan
+    return X, y
+
+
+def _expectation(ensemble, x, known):
+    """Path-dependent model expectation with only the features in ``known`` set"""
+    total = ensemble.base
+    for root in ensemble.roots:
+        stack = [(root, 1.0)]
+        while stack:
+            node, weight = stack.pop()
+            if ensemble.left[node] < 0:
+                total += weight * ensemble.value[node]
+                continue
+            left, right = ensemble.left[node], ensemble.right[node]
+            f = ensemble.feature[node]
+            if f in known:
+                go_left = (x[f] <= ensemble.threshold[node]
+                           or (np.isnan(x[f]) and ensemble.missing_left[node]))
+                stack.append((left if go_left else right, weight))
+            else:
+                for child in (left, right):
+                    stack.append((child, weight * ensemble.cover[child] / ensemble.cover[node]))
+    return total
+
+
+def _brute_force(ensemble, x):
+    n = ensemble.n_features
+    phi = np.zeros(n)
+    for i in range(n):
+        others = [k for k in range(n) if k != i]
+        for size in range(n):
+            weight = factorial(size) * factorial(n - size - 1) / factorial(n)
+            for subset in combinations(others, size):
+                known = set(subset)
+                phi[i] += weight * (_expectation(ensemble, x, known | {i})
+                                    - _expectation(ensemble, x, known))
+    return phi
+
+
+@pytest.mark.parametrize('missing', [False, True], ids=['dense', 'nan'])
+@pytest.mark.parametrize('name', list(MODELS))
+def test_matches_brute_force_and_adds_up(name, missing):
+    if missing and name == 'gbr':
+        pytest.skip('GradientBoostingRegressor does not accept NaN')
+    X, y = _data(missing)
+    model = MODELS[name]().fit(X, y)
+    ensemble = TreeEnsemble.from_sklearn(model)
+    explainer = TreeExplainer(ensemble)
+    rows = X[:8]
+
+    phi = explainer.explain(rows)
+
+    assert ensemble.predict(rows) == pytest.approx(model.predict(rows), abs=1e-9)
+    assert explainer.expected_value == pytest.approx(_expectation(ensemble, rows[0], set()),
+                                                     abs=1e-10)
+    assert phi.sum(axis=1) + explainer.expected_value == pytest.approx(model.predict(rows),
+                                                                      abs=1e-9)
+    for x, row in zip(rows, phi):
+        assert row == pytest.approx(_brute_force(ensemble, x), abs=1e-10)
+
+
+def test_rejects_paths_beyond_max_path_features():
+    X, y = _data()
+    ensemble = TreeEnsemble.from_sklearn(DecisionTreeRegressor(random_state=0).fit(X, y))
+
+    with pytest.raises(ValueError, match='max_path_features=2'):
+        TreeExplainer(ensemble, max_path_features=2)
@@ -0,0 +1,118 @@
+"""
+Empirical variogram against an O(n^2) pair loop
+Every pair within max_lag is binned by hand; the KD-tree and tiled paths
+must give the same counts, mean lags, semivariances and jackknife errors
+"""
+
+from unittest import mock
+
+import numpy as np
+import pytest
+
+from alps_analytics.spatial import empirical_variogram, fit_models, fit_variogram
+from alps_analytics.spatial import variogram
+
+MAX_LAG, N_LAGS = 30.0, 10
+
+
+def _points(n=400, seed=0):
+    rng = np.random.default_rng(seed)
+    coords = rng.uniform(0, 100, (n, 2))
+    values = np.sin(coords[:, 0] / 15) + np.cos(coords[:, 1] / 20) + rng.normal(0, 0.2, n)
+    return coords, values
+
+
+def _pair_loop(coords, values, max_lag=MAX_LAG, n_lags=N_LAGS):
+    """Bin every pair i < j of the dense n x n distance matrix"""
+    i, j = np.triu_indices(len(coords), k=1)
+    d = np.hypot(*(coords[i] - coords[j]).T)
+    keep = d <= max_lag
+    d, half = d[keep], ((values[i] - values[j]) ** 2 / 2)[keep]
+    counts, dist, total = np.zeros(n_lags), np.zeros(n_lags), np.zeros(n_lags)
+    for dk, hk in zip(d, half):
+        b = min(int(dk * n_lags / max_lag), n_lags - 1)
+        counts[b] += 1
+        dist[b] += dk
+        total[b] += hk
+    return counts, dist / counts, total / counts
+
+
+def test_kdtree_matches_pair_loop():
+    coords, values = _points()
+
+    ev = empirical_variogram(coords, values, MAX_LAG, N_LAGS)
+    counts, lags, gamma = _pair_loop(coords, values)
+
+    assert ev.counts == pytest.approx(counts)
+    assert ev.lags == pytest.approx(lags, rel=1e-12)
+    assert ev.gamma == pytest.approx(gamma, rel=1e-12)
+    assert np.isfinite(ev.stderr).all() and ev.blocks == variogram.JACKKNIFE_BLOCKS
+
+
+@pytest.mark.parametrize('tile_size', [17, 64, 1000])
+def test_tiled_matches_kdtree_and_pair_loop(tile_size):
+    coords, values = _points()
+
+    tiled = empirical_variogram(coords, values, MAX_LAG, N_LAGS, tile_size=tile_size)
+    kdtree = empirical_variogram(coords, values, MAX_LAG, N_LAGS)
+    counts, lags, gamma = _pair_loop(coords, values)
+
+    assert tiled.counts == pytest.approx(counts)
+    assert tiled.lags == pytest.approx(lags, rel=1e-12)
+    assert tiled.gamma == pytest.approx(gamma, rel=1e-12)
+    assert tiled.stderr == pytest.approx(kdtree.stderr, rel=1e-9)
+
+
+def test_stderr_is_the_delete_one_block_jackknife():
+    coords, values = _points(200)
+    block, n_blocks = variogram._blocks(coords, variogram.JACKKNIFE_BLOCKS)
+
+    ev = empirical_variogram(coords, values, MAX_LAG, N_LAGS)
+
+    # gamma recomputed from scratch with each block's points removed
+    leave_out = np.array([_pair_loop(coords[block != g], values[block != g])[2]
+                          for g in range(n_blocks)])
+    spread = ((leave_out - leave_out.mean(axis=0)) ** 2).sum(axis=0)
+    assert ev.stderr == pytest.approx(np.sqrt((n_blocks - 1) / n_blocks * spread), rel=1e-9)
+    low, high = ev.confidence_interval(0.95)
+    assert ((low < ev.gamma) & (ev.gamma < high)).all()
+
+
+def test_sample_keeps_a_random_subset():
+    coords, values = _points()
+
+    ev = empirical_variogram(coords, values, MAX_LAG, N_LAGS, sample=0.5, seed=3)
+    idx = np.random.default_rng(3).choice(len(values), size=200, replace=False)
+
+    assert ev.sample_fraction == 0.5
+    assert ev.gamma == pytest.approx(_pair_loop(coords[idx], values[idx])[2], rel=1e-12)
+
+
+def test_missing_values_are_dropped():
+    coords, values = _points(100)
+    values[[5, 17]] = np.nan
+    keep = np.isfinite(values)
+
+    ev = empirical_variogram(coords, values, MAX_LAG, N_LAGS)
+
+    assert ev.gamma == pytest.approx(_pair_loop(coords[keep], values[keep])[2], rel=1e-12)
+
+
+def test_fits_recover_a_spatial_range():
+    coords, values = _points()
+
+    fits = fit_models(empirical_variogram(coords, values, MAX_LAG, N_LAGS))
+
+    assert [f.name for f in fits] and fits == sorted(fits, key=lambda f: f.wsse)
+    assert 0 < fits[0].range <= 2 * MAX_LAG
+
+
+def test_unfittable_variograms_give_no_model():
+    coords = np.array([[0.0, 0.0], [500.0, 0.0], [0.0, 500.0]])
+    sparse_ev = empirical_variogram(coords, np.array([1.0, 2.0, 3.0]), MAX_LAG, N_LAGS)
+    coords, values = _points()
+    ev = empirical_variogram(coords, values, MAX_LAG, N_LAGS)
+
+    assert fit_variogram(sparse_ev) is None and fit_models(sparse_ev) == []
+    with mock.patch.object(variogram, 'curve_fit', side_effect=RuntimeError('maxfev')):
+        assert fit_variogram(ev) is None and fit_models(ev) == []
@@ -0,0 +1,74 @@
+"""
+Spatial weights on a 3 x 3 grid of unit-square districts
+Queen neighbours share a corner or an edge, rook neighbours an edge, and the
+k nearest centroids of a corner cell are its two edge neighbours
+"""
+
+import numpy as np
+import pytest
+
+from alps_analytics.spatial import build_weights, from_features
+
+SIDE = 3
+
+
+def _grid(side=SIDE):
+    features = []
+    for r in range(side):
+        for c in range(side):
+            # Longitude/latitude around India; the cells are 0.5 degrees wide
+            x, y = 75 + 0.5 * c, 20 + 0.5 * r
+            ring = [[x, y], [x + 0.5, y], [x + 0.5, y + 0.5], [x, y + 0.5], [x, y]]
+            features.append({'type': 'Feature', 'properties': {'code': f'R{r}C{c}'},
+                             'geometry': {'type': 'Polygon', 'coordinates': [ring]}})
+    return from_features(features)
+
+
+def _expected(kind, side=SIDE):
+    n = side * side
+    W = np.zeros((n, n))
+    for i in range(n):
+        for j in range(n):
+            dr, dc = abs(i // side - j // side), abs(i % side - j % side)
+            if i != j and (max(dr, dc) == 1 if kind == 'queen' else dr + dc == 1):
+                W[i, j] = 1
+    return W
+
+
+@pytest.mark.parametrize('kind', ['queen', 'rook'])
+def test_contiguity_on_grid(kind):
+    weights = build_weights(_grid(), kind)
+
+    assert weights.W.toarray() == pytest.approx(_expected(kind))
+    assert weights.codes.tolist() == [f'R{r}C{c}' for r in range(SIDE) for c in range(SIDE)]
+    assert not len(weights.islands)
+
+
+def test_knn_corners_pick_edge_neighbours():
+    weights = build_weights(_grid(), 'knn', k=2)
+    W = weights.W.toarray()
+    rook = _expected('rook')
+
+    assert (W.sum(axis=1) == 2).all()
+    for corner in (0, SIDE - 1, SIDE * (SIDE - 1), SIDE * SIDE - 1):
+        assert W[corner] == pytest.approx(rook[corner])
+
+
+def test_cached_weights_round_trip(tmp_path):
+    geoms = _grid()
+
+    built = build_weights(geoms, 'queen', cache_dir=tmp_path)
+    cached = build_weights(geoms, 'queen', cache_dir=tmp_path)
+
+    assert len(list(tmp_path.glob('queen-*.npz'))) == 1
+    assert cached.codes.tolist() == built.codes.tolist()
+    assert (cached.W != built.W).nnz == 0
+
+
+def test_reorder_follows_codes():
+    weights = build_weights(_grid(), 'rook')
+    codes = weights.codes[::-1]
+
+    reordered = weights.reorder(codes)
+
+    assert reordered.W.toarray() == pytest.approx(_expected('rook')[::-1, ::-1])
@@ -0,0 +1,34 @@
+"""
+Backfill verification against the exported district daily metrics
+"""
+
+import pandas as pd
+import pytest
+
+from alps_analytics.raster.zonal import compare
+
+# Header and layout as written by scripts/export_paper_data.ts
+EXPORT = """Code,Date,Radiance,Hotspots
+101,2024-01-01,10.0,1
+101,2024-01-02,12.0,0
+102,2024-01-01,5.0,0
+102,2024-01-03,7.5,2
+"""
+
+
+def test_compare_reads_exported_header(tmp_path):
+    path = tmp_path / 'district_daily_metrics.csv'
+    path.write_text(EXPORT)
+    backfilled = pd.DataFrame({
+        'code': ['101', '101', '102'],
+        'date': pd.to_datetime(['2024-01-01', '2024-01-02', '2024-01-01']),
+        'radiance': [11.0, 12.0, 5.0],
+    })
+
+    report = compare(backfilled, path)
+
+    assert report['rows'] == 3
+    assert report['bias'] == pytest.approx(1 / 3)
+    assert report['median_abs_diff'] == 0
+    assert report['pearson_r'] == pytest.approx(backfilled['radiance'].corr(
+        pd.Series([10.0, 12.0, 5.0])))